@@ -7,6 +7,7 @@ https://github.com/lnls-sirius/libbsmp/blob/master/doc/protocol_v2-30_pt_BR.pdf
 https://github.com/lnls-sirius/libbsmp/blob/master/doc/protocol_v2-30_en_US.pdf
 """
 
+from .asyncserial import *
 from .commands import *
 from .entities import *
 from .exceptions import *
@@ -14,4 +15,4 @@ from .serial import *
 from .types import *
 
 __version__ = '2.30.0'
-del serial, types, entities, commands, exceptions
+del asyncserial, serial, types, entities, commands, exceptions
@@ -0,0 +1,309 @@
+"""BSMP asynchronous serial communications classes."""
+import abc
+import asyncio as _asyncio
+import collections as _collections
+import functools as _functools
+import struct as _struct
+import typing
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+
+from .exceptions import SerialErrEmpty as _SerialErrEmpty
+from .exceptions import SerialError as _SerialError
+from .serial import IOInterface as _IOInterface
+from .serial import Message as _Message
+from .serial import Package as _Package
+from .serial import _bytes_to_chars
+
+
+class AsyncIOInterface(metaclass=abc.ABCMeta):
+    """Base class for asynchronous I/O.
+
+    Streams are bytes-like objects. Implementations must return responses
+    to concurrent requests in the order the requests were issued.
+    """
+
+    @abc.abstractmethod
+    async def open(self) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def close(self) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def UART_write(self, stream: bytes, timeout: float) -> typing.Optional[typing.Any]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def UART_request(self, stream: bytes, timeout: float) -> typing.Optional[bytes]:
+        raise NotImplementedError
+
+
+class AsyncIOInterfaceAdapter(AsyncIOInterface):
+    """Asynchronous adapter of a synchronous IOInterface.
+
+    Requests are run, in submission order, in a thread dedicated to the
+    adapted interface, so that one coroutine never blocks the event loop.
+    """
+
+    def __init__(self, iointerf: _IOInterface):
+        """Init."""
+        self._iointerf = iointerf
+        self._executor = _ThreadPoolExecutor(max_workers=1)
+
+    @property
+    def iointerf(self) -> _IOInterface:
+        """Return adapted synchronous IOInterface."""
+        return self._iointerf
+
+    async def open(self) -> None:
+        """Open adapted interface."""
+        await self._run(self._iointerf.open)
+
+    async def close(self) -> None:
+        """Close adapted interface."""
+        await self._run(self._iointerf.close)
+        self._executor.shutdown(wait=False)
+
+    async def UART_write(self, stream: bytes, timeout: float) -> typing.Optional[typing.Any]:
+        """Write stream to serial port."""
+        return await self._run(
+            self._iointerf.UART_write, _bytes_to_chars(stream), timeout=timeout)
+
+    async def UART_request(self, stream: bytes, timeout: float) -> typing.Optional[bytes]:
+        """Write stream to serial port then read."""
+        return await self._run(
+            self._iointerf.UART_request_bytes, stream, timeout=timeout)
+
+    async def _run(self, func, *args, **kwargs):
+        loop = _asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._executor, _functools.partial(func, *args, **kwargs))
+
+
+class AsyncEthBridge(AsyncIOInterface):
+    """Pipelined asynchronous I/O with a beaglebone through TCP.
+
+    Up to 'max_in_flight' requests are sent to the bridge server before
+    their responses arrive, hiding network latencies between consecutive
+    serial transactions. The server must process requests in order and
+    answer each one of them.
+
+    Frames in both directions: command (1 byte), payload size (4 bytes,
+    big endian) and payload. Request payloads are the serial timeout in
+    [ms] (float, 4 bytes, big endian) followed by the serial stream.
+    Response payloads are the serial response stream, empty if the serial
+    line timed out. Write-only commands are not answered.
+
+    The timeout of each request only starts to count when the previous
+    request is done, since requests share the serial line.
+    """
+
+    CMD_REQUEST: int = 0x01
+    CMD_WRITE: int = 0x02
+
+    DEFAULT_PORT: int = 5000
+    DEFAULT_MAX_IN_FLIGHT: int = 8
+    TIMEOUT_MARGIN: float = 0.5  # [s]
+
+    def __init__(
+        self,
+        ip_address: str,
+        port: int = DEFAULT_PORT,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    ):
+        """Init."""
+        self._ip_address = ip_address
+        self._port = port
+        self._max_in_flight = max_in_flight
+        self._reader: typing.Optional[_asyncio.StreamReader] = None
+        self._writer: typing.Optional[_asyncio.StreamWriter] = None
+        self._reader_task = None
+        self._slots: typing.Optional[_asyncio.Semaphore] = None
+        self._pending: typing.Deque[_asyncio.Future] = _collections.deque()
+        self._last_turn: typing.Optional[_asyncio.Future] = None
+
+    @property
+    def ip_address(self) -> str:
+        """Return bridge IP address."""
+        return self._ip_address
+
+    @property
+    def port(self) -> int:
+        """Return bridge TCP port."""
+        return self._port
+
+    @property
+    def max_in_flight(self) -> int:
+        """Return maximum number of requests in flight."""
+        return self._max_in_flight
+
+    @property
+    def connected(self) -> bool:
+        """Return whether connection is open."""
+        return self._reader_task is not None and not self._reader_task.done()
+
+    async def open(self) -> None:
+        """Open connection to bridge server."""
+        self._reader, self._writer = await _asyncio.open_connection(
+            self._ip_address, self._port)
+        self._slots = _asyncio.Semaphore(self._max_in_flight)
+        self._pending = _collections.deque()
+        self._last_turn = None
+        self._reader_task = _asyncio.ensure_future(self._read_responses())
+
+    async def close(self) -> None:
+        """Close connection to bridge server."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except _asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            # NOTE: StreamWriter.wait_closed is only available in python 3.7+
+            if hasattr(self._writer, 'wait_closed'):
+                await self._writer.wait_closed()
+            self._writer = None
+        self._fail_pending(_SerialError('Connection closed.'))
+
+    async def UART_write(self, stream: bytes, timeout: float) -> None:
+        """Write stream to serial port."""
+        self._check_connected()
+        self._writer.write(self._frame(self.CMD_WRITE, stream, timeout))
+        await self._writer.drain()
+
+    async def UART_request(self, stream: bytes, timeout: float) -> typing.Optional[bytes]:
+        """Write stream to serial port then read.
+
+        Returns None if no response arrives within 'timeout' [ms] (plus
+        TIMEOUT_MARGIN for network delays).
+        """
+        # NOTE: slots only exist after the connection is opened.
+        self._check_connected()
+        async with self._slots:
+            # connection may have been closed while waiting for a slot.
+            self._check_connected()
+            loop = _asyncio.get_event_loop()
+            future, turn = loop.create_future(), loop.create_future()
+            prev_turn, self._last_turn = self._last_turn, turn
+            # NOTE: no await between queueing the future and writing
+            # the frame, which keeps responses matched with requests.
+            self._pending.append(future)
+            self._writer.write(self._frame(self.CMD_REQUEST, stream, timeout))
+            try:
+                await self._writer.drain()
+                if prev_turn is not None:
+                    await prev_turn
+                # NOTE: the future is shielded so that a late response is
+                # still consumed by the reader task, in order.
+                return await _asyncio.wait_for(
+                    _asyncio.shield(future),
+                    timeout=timeout/1000 + self.TIMEOUT_MARGIN)
+            except _asyncio.TimeoutError:
+                return None
+            finally:
+                if not turn.done():
+                    turn.set_result(None)
+
+    # --- private methods ---
+
+    @staticmethod
+    def _frame(cmd: int, stream: bytes, timeout: float) -> bytes:
+        payload = _struct.pack('>f', timeout) + stream
+        return _struct.pack('>BI', cmd, len(payload)) + payload
+
+    def _check_connected(self) -> None:
+        if not self.connected:
+            raise _SerialError('Bridge {}:{} is not connected.'.format(
+                self._ip_address, self._port))
+
+    def _fail_pending(self, exception: Exception) -> None:
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(exception)
+                # NOTE: flags exception as retrieved, for futures of
+                # requests that already timed out have no awaiters.
+                future.exception()
+
+    async def _read_responses(self) -> None:
+        try:
+            while True:
+                header = await self._reader.readexactly(5)
+                _, size = _struct.unpack('>BI', header)
+                data = await self._reader.readexactly(size) if size else b''
+                if not self._pending:
+                    # unsolicited response, discard it.
+                    continue
+                future = self._pending.popleft()
+                if not future.done():
+                    future.set_result(data)
+        except (_asyncio.IncompleteReadError, ConnectionError):
+            self._fail_pending(_SerialError('Connection lost.'))
+
+
+class AsyncChannel:
+    """BSMP asynchronous channel.
+
+    The channel is defined by an AsyncIOInterface object and recipient
+    address.
+    """
+
+    def __init__(self, iointerf: AsyncIOInterface, address: int):
+        """Set channel."""
+        self._iointerf: AsyncIOInterface = iointerf
+        self._address: int = address
+        self._size_counter: int = 0  # stream size counter [bytes]
+
+    @property
+    def iointerf(self) -> AsyncIOInterface:
+        """Return AsyncIOInterface serial communication object."""
+        return self._iointerf
+
+    @property
+    def address(self) -> int:
+        """Return attached bsmp device id."""
+        return self._address
+
+    @property
+    def size_counter(self) -> int:
+        """Return stream size of last request."""
+        return self._size_counter
+
+    def size_counter_reset(self) -> None:
+        """Reset stream size counter."""
+        self._size_counter = 0
+
+    async def write(self, message: _Message, timeout: float = 100):
+        """Write to serial. :param timeout [ms]"""
+        stream = _Package.package(self._address, message).stream_bytes
+        response = await self.iointerf.UART_write(stream, timeout=timeout)
+        self._size_counter += len(stream)
+        return response
+
+    async def request_(self, message: _Message, timeout: float = 100) -> _Message:
+        """:param timeout [ms]"""
+        stream = _Package.package(self._address, message).stream_bytes
+        response = await self.iointerf.UART_request(stream, timeout=timeout)
+        self._size_counter += len(stream)
+
+        if not response:
+            raise _SerialErrEmpty("Serial read returned empty!")
+
+        package = _Package(response)
+        self._size_counter += len(response)
+        return package.message
+
+    async def request(self, message: _Message, timeout: float = 100, read_flag: bool = True) -> typing.Optional[_Message]:
+        """Write and wait for response. :param timeout [ms]"""
+        response: typing.Optional[_Message] = None
+
+        if read_flag:
+            response = await self.request_(message, timeout)
+        else:
+            await self.write(message, timeout)
+
+        return response
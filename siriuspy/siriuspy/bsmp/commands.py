@@ -2,6 +2,8 @@
 import typing
 
 from . import constants as _const
+from .asyncserial import AsyncChannel as _AsyncChannel
+from .asyncserial import AsyncIOInterface as _AsyncIOInterface
 from .entities import Entities as _Entities
 from .exceptions import SerialAnomResp as _SerialAnomResp
 from .exceptions import SerialError as _SerialError
@@ -43,32 +45,9 @@ class BSMP:
 
     def query_list_of_group_of_variables(self, timeout: float) -> typing.Tuple[int, typing.Optional[typing.List[typing.Tuple[bool, int]]]]:
         """Consult groups list. Command 0x04."""
-        # command and expected response
-        cmd, ack = _const.CMD_QUERY_LIST_OF_GROUP_OF_VARIABLES, \
-            _const.CMD_LIST_OF_GROUP_OF_VARIABLES
-
-        # build payload
-        payload: typing.List[str] = []
-
-        # send request package
-        msg = _Message.message(cmd, payload=payload)
+        msg = self._query_list_of_group_of_variables_message()
         res = self.channel.request(msg, timeout=timeout)
-
-        if not res:
-            raise _SerialError("Expected response from request, found {}".format(res))
-
-        # expected response
-        if res.cmd == ack:
-            groupdata: typing.List[typing.Tuple[bool, int]] = []
-            for groupchar in res.payload:
-                byte = ord(groupchar)
-                waccess = (byte & 0b10000000) > 0
-                nrvars = (byte & 0b01111111)
-                groupdata.append((waccess, nrvars))
-            return _const.ACK_OK, groupdata
-
-        # anomalous response
-        return BSMP.anomalous_response(cmd, res.cmd)
+        return self._query_list_of_group_of_variables_response(res)
 
     def query_group_of_variables(
         self,
@@ -76,26 +55,9 @@ class BSMP:
         timeout: float
     ) -> typing.Tuple[int, typing.Optional[typing.List[int]]]:
         """Return id of the variables in the given group."""
-        # command and expected response
-        cmd, ack = _const.CMD_QUERY_GROUP_OF_VARIABLES, \
-            _const.CMD_GROUP_OF_VARIABLES
-
-        # build payload
-        payload = [chr(group_id)]
-
-        # send request package
-        msg = _Message.message(cmd, payload=payload)
+        msg = self._query_group_of_variables_message(group_id)
         res = self.channel.request(msg, timeout=timeout)
-
-        if not res:
-            raise _SerialError("Expected response from request, found {}".format(res))
-
-        # expected response
-        if res.cmd == ack:
-            return _const.ACK_OK, list(map(ord, res.payload))
-
-        # anomalous response
-        return BSMP.anomalous_response(cmd, res.cmd)
+        return self._query_group_of_variables_response(res)
 
     def query_list_of_curves(self):
         """Consult curves_list. Command 0x08."""
@@ -116,33 +78,9 @@ class BSMP:
         timeout: float
     ) -> typing.Union[typing.Tuple[None, None], typing.Tuple[int, typing.Any]]:
         """Read variable."""
-        # command and expected response
-        cmd, ack = _const.CMD_READ_VARIABLE, _const.CMD_VARIABLE_VALUE
-
-        # build payload
-        payload = [chr(var_id)]
-
-        # send request package
-        msg = _Message.message(cmd, payload=payload)
+        msg = self._read_variable_message(var_id)
         res = self.channel.request(msg, timeout=timeout)
-
-        if not res:
-            raise _SerialError("Expected response from request, found {}".format(res))
-
-        if res.cmd == ack:
-            variable = self.entities.variables[var_id]
-            if len(res.payload) == variable.size:
-                # expected response
-                return _const.ACK_OK, variable.load_to_value(res.payload)
-
-            # unexpected variable size
-            fmts = 'Unexpected BSMP variable size for command 0x{:02X}: {}!'
-            print(fmts.format(cmd, res.cmd))
-            return None, None
-
-        # anomalous response
-        return BSMP.anomalous_response(
-            cmd, res.cmd, var_id=var_id, payload=res.payload)
+        return self._read_variable_response(res, var_id)
 
     def read_group_of_variables(
         self,
@@ -150,36 +88,24 @@ class BSMP:
         timeout: float
     ):
         """Read variable group."""
-        # command and expected response
-        cmd, ack = \
-            _const.CMD_READ_GROUP_OF_VARIABLES, \
-            _const.CMD_GROUP_OF_VARIABLES_VALUE
-
-        # build payload
-        payload = [chr(group_id)]
-
-        # send request package
-        msg = _Message.message(cmd, payload=payload)
+        msg = self._read_group_of_variables_message(group_id)
         res = self.channel.request(msg, timeout=timeout)
+        return self._read_group_of_variables_response(res, group_id)
 
-        if not res:
-            raise _SerialError("Expected response from request, found {}".format(res))
-
-        if res.cmd == ack:
-            # expected response
-            group = self.entities.groups[group_id]
-            if len(res.payload) == group.variables_size():
-                return _const.ACK_OK, group.load_to_value(res.payload)
-            # unexpected group variables size
-            return BSMP.anomalous_response(
-                cmd, res.cmd,
-                group_id=group_id,
-                payload_len=len(res.payload),
-                var_size=group.variables_size()
-            )
+    def read_group_of_variables_load(
+        self,
+        group_id: int,
+        timeout: float
+    ):
+        """Read variable group, returning its load undecoded (bytes).
 
-        # anomalous response
-        return BSMP.anomalous_response(cmd, res.cmd)
+        Loads of many devices may be decoded in bulk with
+        VariablesGroup.loads_to_array.
+        """
+        msg = self._read_group_of_variables_message(group_id)
+        res = self.channel.request(msg, timeout=timeout)
+        return self._read_group_of_variables_response(
+            res, group_id, decode=False)
 
     # 0x2_
     def write_variable(self, var_id, value):
@@ -214,20 +140,222 @@ class BSMP:
         timeout: float
     ) -> typing.Tuple[typing.Optional[int], typing.Optional[typing.List[str]]]:
         """Create new group with given variable ids."""
-        cmd, ack = \
-            _const.CMD_CREATE_GROUP_OF_VARIABLES, _const.ACK_OK
-
-        # build payload
         var_ids = sorted(var_ids)
-        payload = [chr(var_id) for var_id in var_ids]
+        msg = self._create_group_of_variables_message(var_ids)
+        res = self.channel.request(msg, timeout=timeout)
+        return self._create_group_of_variables_response(res, var_ids)
+
+    def remove_all_groups_of_variables(
+        self,
+        timeout: float
+    ) -> typing.Tuple[int, typing.Optional[typing.List[str]]]:
+        """Remove all groups."""
+        msg = self._remove_all_groups_of_variables_message()
+        res = self.channel.request(msg, timeout=timeout)
+        return self._remove_all_groups_of_variables_response(res)
+
+    # 0x4_
+    def request_curve_block(
+            self,
+            curve_id,
+            block,
+            timeout: float,
+            print_error: bool = True
+    ) -> typing.Tuple[typing.Optional[int], typing.Optional[typing.List[str]]]:
+        """Read curve block."""
+        msg = self._request_curve_block_message(curve_id, block)
+        res = self.channel.request(msg, timeout=timeout)
+        return self._request_curve_block_response(
+            res, curve_id, block, print_error)
+
+    def curve_block(
+            self,
+            curve_id: int,
+            block,
+            value,
+            timeout: float
+    ) -> typing.Tuple[int, typing.Optional[typing.List[str]]]:
+        """Write to curve block."""
+        msg = self._curve_block_message(curve_id, block, value)
+        res = self.channel.request(msg, timeout=timeout)
+        return self._curve_block_response(res)
 
-        # send request package
-        msg = _Message.message(cmd, payload=payload)
+    def recalculate_curve_checksum(
+        self,
+        curve_id: int,
+        timeout: float
+    ) -> typing.Tuple[int, typing.Optional[typing.List[str]]]:
+        """Recalculate curve checksum."""
+        msg = self._recalculate_curve_checksum_message(curve_id)
         res = self.channel.request(msg, timeout=timeout)
+        return self._recalculate_curve_checksum_response(res)
+
+    # 0x5_
+    def execute_function(
+        self,
+        func_id: int,
+        input_val=None,
+        timeout: float = _timeout_execute_function,
+        read_flag: bool = True,
+        print_error: bool = True
+    ) -> typing.Optional[typing.Tuple[int, typing.Optional[typing.Union[typing.List[str], str]]]]:
+        """Execute a function.
+
+        parameter:
+            read_flag: whether to execute a read after a write.
+        """
+        msg = self._execute_function_message(func_id, input_val)
+        res = self.channel.request(msg, timeout=timeout, read_flag=read_flag)
+
+        # TODO: This should be temporary. It is used for ps F_RESET_UDC.
+        # PS Firmware should change so that F_RESET_UDC returns ack.
+        if not read_flag:
+            return None
+
+        return self._execute_function_response(res, func_id, print_error)
+
+    @staticmethod
+    def anomalous_response(cmd, ack: int, **kwargs) -> typing.Tuple[int, None]:
+        """Print information about anomalous response."""
+        # response with error
+        if _const.ACK_OK < ack <= _const.ACK_RESOURCE_BUSY:
+            if 'print_error' not in kwargs or kwargs['print_error']:
+                fmts = 'BSMP response (error) for command 0x{:02X}: 0x{:02X}!'
+                print(fmts.format(cmd, ack))
+                for key, value in kwargs.items():
+                    print('{}: {}'.format(key, value))
+            return ack, None
+
+        # unexpected response, raise Exception
+        if 'print_error' not in kwargs or kwargs['print_error']:
+            fmts = 'BSMP response (unexpected) for command 0x{:02X}: 0x{:02X}!'
+            print(fmts.format(cmd, ack))
+            for key, value in kwargs.items():
+                print('{}: {}'.format(key, value))
+        raise _SerialAnomResp
+
+    # --- private methods ---
+    # NOTE: request messages are built and responses are parsed in the
+    # methods below, which are shared with the asynchronous implementation.
 
+    @staticmethod
+    def _check_response(res: typing.Optional[_Message]) -> None:
         if not res:
             raise _SerialError("Expected response from request, found {}".format(res))
 
+    def _query_list_of_group_of_variables_message(self) -> _Message:
+        # build payload
+        payload: typing.List[str] = []
+        return _Message.message(
+            _const.CMD_QUERY_LIST_OF_GROUP_OF_VARIABLES, payload=payload)
+
+    def _query_list_of_group_of_variables_response(self, res):
+        # command and expected response
+        cmd, ack = _const.CMD_QUERY_LIST_OF_GROUP_OF_VARIABLES, \
+            _const.CMD_LIST_OF_GROUP_OF_VARIABLES
+        self._check_response(res)
+
+        # expected response
+        if res.cmd == ack:
+            groupdata: typing.List[typing.Tuple[bool, int]] = []
+            for byte in res.payload_bytes:
+                waccess = (byte & 0b10000000) > 0
+                nrvars = (byte & 0b01111111)
+                groupdata.append((waccess, nrvars))
+            return _const.ACK_OK, groupdata
+
+        # anomalous response
+        return BSMP.anomalous_response(cmd, res.cmd)
+
+    def _query_group_of_variables_message(self, group_id: int) -> _Message:
+        # build payload
+        payload = [chr(group_id)]
+        return _Message.message(
+            _const.CMD_QUERY_GROUP_OF_VARIABLES, payload=payload)
+
+    def _query_group_of_variables_response(self, res):
+        # command and expected response
+        cmd, ack = _const.CMD_QUERY_GROUP_OF_VARIABLES, \
+            _const.CMD_GROUP_OF_VARIABLES
+        self._check_response(res)
+
+        # expected response
+        if res.cmd == ack:
+            return _const.ACK_OK, list(res.payload_bytes)
+
+        # anomalous response
+        return BSMP.anomalous_response(cmd, res.cmd)
+
+    def _read_variable_message(self, var_id: int) -> _Message:
+        # build payload
+        payload = [chr(var_id)]
+        return _Message.message(_const.CMD_READ_VARIABLE, payload=payload)
+
+    def _read_variable_response(self, res, var_id: int):
+        # command and expected response
+        cmd, ack = _const.CMD_READ_VARIABLE, _const.CMD_VARIABLE_VALUE
+        self._check_response(res)
+
+        if res.cmd == ack:
+            variable = self.entities.variables[var_id]
+            payload = res.payload_bytes
+            if len(payload) == variable.size:
+                # expected response
+                return _const.ACK_OK, variable.load_to_value(payload)
+
+            # unexpected variable size
+            fmts = 'Unexpected BSMP variable size for command 0x{:02X}: {}!'
+            print(fmts.format(cmd, res.cmd))
+            return None, None
+
+        # anomalous response
+        return BSMP.anomalous_response(
+            cmd, res.cmd, var_id=var_id, payload=res.payload)
+
+    def _read_group_of_variables_message(self, group_id: int) -> _Message:
+        # build payload
+        payload = [chr(group_id)]
+        return _Message.message(
+            _const.CMD_READ_GROUP_OF_VARIABLES, payload=payload)
+
+    def _read_group_of_variables_response(
+            self, res, group_id: int, decode: bool = True):
+        # command and expected response
+        cmd, ack = \
+            _const.CMD_READ_GROUP_OF_VARIABLES, \
+            _const.CMD_GROUP_OF_VARIABLES_VALUE
+        self._check_response(res)
+
+        if res.cmd == ack:
+            # expected response
+            group = self.entities.groups[group_id]
+            payload = res.payload_bytes
+            if len(payload) == group.variables_size():
+                if not decode:
+                    return _const.ACK_OK, bytes(payload)
+                return _const.ACK_OK, group.load_to_value(payload)
+            # unexpected group variables size
+            return BSMP.anomalous_response(
+                cmd, res.cmd,
+                group_id=group_id,
+                payload_len=len(payload),
+                var_size=group.variables_size()
+            )
+
+        # anomalous response
+        return BSMP.anomalous_response(cmd, res.cmd)
+
+    def _create_group_of_variables_message(self, var_ids: typing.List[int]) -> _Message:
+        # build payload
+        payload = [chr(var_id) for var_id in var_ids]
+        return _Message.message(
+            _const.CMD_CREATE_GROUP_OF_VARIABLES, payload=payload)
+
+    def _create_group_of_variables_response(self, res, var_ids: typing.List[int]):
+        cmd, ack = \
+            _const.CMD_CREATE_GROUP_OF_VARIABLES, _const.ACK_OK
+        self._check_response(res)
+
         if res.cmd == ack:
             if not res.payload:
                 # expected response
@@ -244,23 +372,16 @@ class BSMP:
         # anomalous response
         return BSMP.anomalous_response(cmd, res.cmd)
 
-    def remove_all_groups_of_variables(
-        self,
-        timeout: float
-    ) -> typing.Tuple[int, typing.Optional[typing.List[str]]]:
-        """Remove all groups."""
-        cmd, ack = \
-            _const.CMD_REMOVE_ALL_GROUPS_OF_VARIABLES, _const.ACK_OK
-
+    def _remove_all_groups_of_variables_message(self) -> _Message:
         # build payload
         payload: typing.List[str] = []
+        return _Message.message(
+            _const.CMD_REMOVE_ALL_GROUPS_OF_VARIABLES, payload=payload)
 
-        # send request package
-        msg = _Message.message(cmd, payload=payload)
-        res = self.channel.request(msg, timeout=timeout)
-
-        if not res:
-            raise _SerialError("Expected response from request, found {}".format(res))
+    def _remove_all_groups_of_variables_response(self, res):
+        cmd, ack = \
+            _const.CMD_REMOVE_ALL_GROUPS_OF_VARIABLES, _const.ACK_OK
+        self._check_response(res)
 
         if res.cmd == ack and not res.payload:
             # expected response
@@ -272,31 +393,21 @@ class BSMP:
         # anomalous response
         return BSMP.anomalous_response(cmd, res.cmd, payload=res.payload)
 
-    # 0x4_
-    def request_curve_block(
-            self,
-            curve_id,
-            block,
-            timeout: float,
-            print_error: bool = True
-    ) -> typing.Tuple[typing.Optional[int], typing.Optional[typing.List[str]]]:
-        """Read curve block."""
-        # command and expected response
-        cmd, ack = _const.CMD_REQUEST_CURVE_BLOCK, _const.CMD_CURVE_BLOCK
-
+    def _request_curve_block_message(self, curve_id, block) -> _Message:
         # build payload
         lsb, hsb = block & 0xff, (block & 0xff00) >> 8
         payload = [chr(curve_id), chr(hsb), chr(lsb)]
+        return _Message.message(
+            _const.CMD_REQUEST_CURVE_BLOCK, payload=payload)
 
-        # send request package
-        msg = _Message.message(cmd, payload=payload)
-        res = self.channel.request(msg, timeout=timeout)
-
-        if not res:
-            raise _SerialError("Expected response from request, found {}".format(res))
+    def _request_curve_block_response(self, res, curve_id, block, print_error):
+        # command and expected response
+        cmd, ack = _const.CMD_REQUEST_CURVE_BLOCK, _const.CMD_CURVE_BLOCK
+        self._check_response(res)
 
         if res.cmd == ack:
-            data = res.payload[3:]
+            payload = res.payload_bytes
+            data = payload[3:]
             curve = self.entities.curves[curve_id]
             if len(data) % curve.type.size:
                 # unexpected curve size
@@ -305,8 +416,8 @@ class BSMP:
                         ' curve.type.size: {}')
                 print(fmts.format(len(data), curve.type.size))
                 return None, None
-            cid = ord(res.payload[0])
-            cblock = (ord(res.payload[1]) << 8) + ord(res.payload[2])
+            cid = payload[0]
+            cblock = (payload[1] << 8) + payload[2]
             if cid != curve_id or cblock != block:
                 # unexpected curve id or block number
                 fmts = ('Invalid curve id or block offset in response!\n'
@@ -322,29 +433,18 @@ class BSMP:
         # anomalous response
         return BSMP.anomalous_response(cmd, res.cmd, print_error=print_error)
 
-    def curve_block(
-            self,
-            curve_id: int,
-            block,
-            value,
-            timeout: float
-    ) -> typing.Tuple[int, typing.Optional[typing.List[str]]]:
-        """Write to curve block."""
-        # command and expected response
-        cmd, ack = _const.CMD_CURVE_BLOCK, _const.ACK_OK
-
+    def _curve_block_message(self, curve_id, block, value) -> _Message:
         # build payload
         curve = self.entities.curves[curve_id]
         lsb, hsb = block & 0xff, (block & 0xff00) >> 8
         payload = [chr(curve_id), chr(hsb), chr(lsb)] + \
             curve.value_to_load(value)
+        return _Message.message(_const.CMD_CURVE_BLOCK, payload=payload)
 
-        # send request package
-        msg = _Message.message(cmd, payload=payload)
-        res = self.channel.request(msg, timeout=timeout)
-
-        if not res:
-            raise _SerialError("Expected response from request, found {}".format(res))
+    def _curve_block_response(self, res):
+        # command and expected response
+        cmd, ack = _const.CMD_CURVE_BLOCK, _const.ACK_OK
+        self._check_response(res)
 
         if res.cmd == ack:
             # expected response
@@ -353,25 +453,17 @@ class BSMP:
         # anomalous response
         return BSMP.anomalous_response(cmd, res.cmd)
 
-    def recalculate_curve_checksum(
-        self,
-        curve_id: int,
-        timeout: float
-    ) -> typing.Tuple[int, typing.Optional[typing.List[str]]]:
-        """Recalculate curve checksum."""
-        # command and expected response
-        cmd, ack = \
-            _const.CMD_RECALCULATE_CURVE_CHECKSUM, _const.CMD_CURVE_CHECKSUM
-
+    def _recalculate_curve_checksum_message(self, curve_id) -> _Message:
         # build payload
         payload = [chr(curve_id)]
+        return _Message.message(
+            _const.CMD_RECALCULATE_CURVE_CHECKSUM, payload=payload)
 
-        # send request package
-        msg = _Message.message(cmd, payload=payload)
-        res = self.channel.request(msg, timeout=timeout)
-
-        if not res:
-            raise _SerialError("Expected response from request, found {}".format(res))
+    def _recalculate_curve_checksum_response(self, res):
+        # command and expected response
+        cmd, ack = \
+            _const.CMD_RECALCULATE_CURVE_CHECKSUM, _const.CMD_CURVE_CHECKSUM
+        self._check_response(res)
 
         if res.cmd == ack:
             # expected response
@@ -380,43 +472,23 @@ class BSMP:
         # anomalous response
         return BSMP.anomalous_response(cmd, res.cmd)
 
-    # 0x5_
-    def execute_function(
-        self,
-        func_id: int,
-        input_val=None,
-        timeout: float = _timeout_execute_function,
-        read_flag: bool = True,
-        print_error: bool = True
-    ) -> typing.Optional[typing.Tuple[int, typing.Optional[typing.Union[typing.List[str], str]]]]:
-        """Execute a function.
-
-        parameter:
-            read_flag: whether to execute a read after a write.
-        """
-        # command and expected response
-        cmd, ack = _const.CMD_EXECUTE_FUNCTION, _const.CMD_FUNCTION_RETURN
-
+    def _execute_function_message(self, func_id: int, input_val) -> _Message:
         # build payload
         function = self.entities.functions[func_id]
         payload = [chr(func_id)] + function.value_to_load(input_val)
+        return _Message.message(_const.CMD_EXECUTE_FUNCTION, payload=payload)
 
-        # send request package
-        msg = _Message.message(cmd, payload=payload)
-        res = self.channel.request(msg, timeout=timeout, read_flag=read_flag)
-
-        # TODO: This should be temporary. It is used for ps F_RESET_UDC.
-        # PS Firmware should change so that F_RESET_UDC returns ack.
-        if not read_flag:
-            return None
-
-        if not res:
-            raise _SerialError("Expected response from request, found {}".format(res))
+    def _execute_function_response(self, res, func_id: int, print_error: bool):
+        # command and expected response
+        cmd, ack = _const.CMD_EXECUTE_FUNCTION, _const.CMD_FUNCTION_RETURN
+        self._check_response(res)
 
         if res.cmd == ack:
-            if len(res.payload) == function.o_size:
+            function = self.entities.functions[func_id]
+            payload = res.payload_bytes
+            if len(payload) == function.o_size:
                 # expected response
-                return _const.ACK_OK, function.load_to_value(res.payload)
+                return _const.ACK_OK, function.load_to_value(payload)
         if res.cmd == _const.CMD_FUNCTION_ERROR:
             # function error
             if len(res.payload) == 1:
@@ -427,22 +499,154 @@ class BSMP:
         return BSMP.anomalous_response(
             cmd, res.cmd, func_id=func_id, print_error=print_error)
 
-    @staticmethod
-    def anomalous_response(cmd, ack: int, **kwargs) -> typing.Tuple[int, None]:
-        """Print information about anomalous response."""
-        # response with error
-        if _const.ACK_OK < ack <= _const.ACK_RESOURCE_BUSY:
-            if 'print_error' not in kwargs or kwargs['print_error']:
-                fmts = 'BSMP response (error) for command 0x{:02X}: 0x{:02X}!'
-                print(fmts.format(cmd, ack))
-                for key, value in kwargs.items():
-                    print('{}: {}'.format(key, value))
-            return ack, None
 
-        # unexpected response, raise Exception
-        if 'print_error' not in kwargs or kwargs['print_error']:
-            fmts = 'BSMP response (unexpected) for command 0x{:02X}: 0x{:02X}!'
-            print(fmts.format(cmd, ack))
-            for key, value in kwargs.items():
-                print('{}: {}'.format(key, value))
-        raise _SerialAnomResp
+class AsyncBSMP(BSMP):
+    """Asynchronous BSMP protocol implementation for Master Node.
+
+    Command methods are coroutines. AsyncBSMP objects of all devices
+    connected to the same beaglebone should share one AsyncIOInterface,
+    which keeps several requests in flight:
+
+        bsmps = [AsyncBSMP(iointerf, addr, entities) for addr in addrs]
+        resps = await asyncio.gather(
+            *[bsmp.read_group_of_variables(3, 100) for bsmp in bsmps])
+    """
+
+    def __init__(self, iointerf: _AsyncIOInterface, slave_address: int, entities: _Entities):
+        """_cructor."""
+        self._entities: _Entities = entities
+        self._channel: _AsyncChannel = _AsyncChannel(iointerf, slave_address)
+
+    @property
+    def channel(self) -> _AsyncChannel:
+        """Return asynchronous serial channel to an address."""
+        return self._channel
+
+    # 0x0_
+    async def query_list_of_group_of_variables(self, timeout: float) -> typing.Tuple[int, typing.Optional[typing.List[typing.Tuple[bool, int]]]]:
+        """Consult groups list. Command 0x04."""
+        msg = self._query_list_of_group_of_variables_message()
+        res = await self.channel.request(msg, timeout=timeout)
+        return self._query_list_of_group_of_variables_response(res)
+
+    async def query_group_of_variables(
+        self,
+        group_id: int,
+        timeout: float
+    ) -> typing.Tuple[int, typing.Optional[typing.List[int]]]:
+        """Return id of the variables in the given group."""
+        msg = self._query_group_of_variables_message(group_id)
+        res = await self.channel.request(msg, timeout=timeout)
+        return self._query_group_of_variables_response(res)
+
+    # 0x1_
+    async def read_variable(
+        self,
+        var_id: int,
+        timeout: float
+    ) -> typing.Union[typing.Tuple[None, None], typing.Tuple[int, typing.Any]]:
+        """Read variable."""
+        msg = self._read_variable_message(var_id)
+        res = await self.channel.request(msg, timeout=timeout)
+        return self._read_variable_response(res, var_id)
+
+    async def read_group_of_variables(
+        self,
+        group_id: int,
+        timeout: float
+    ):
+        """Read variable group."""
+        msg = self._read_group_of_variables_message(group_id)
+        res = await self.channel.request(msg, timeout=timeout)
+        return self._read_group_of_variables_response(res, group_id)
+
+    async def read_group_of_variables_load(
+        self,
+        group_id: int,
+        timeout: float
+    ):
+        """Read variable group, returning its load undecoded (bytes)."""
+        msg = self._read_group_of_variables_message(group_id)
+        res = await self.channel.request(msg, timeout=timeout)
+        return self._read_group_of_variables_response(
+            res, group_id, decode=False)
+
+    # 0x3_
+    async def create_group_of_variables(
+        self,
+        var_ids: typing.List[int],
+        timeout: float
+    ) -> typing.Tuple[typing.Optional[int], typing.Optional[typing.List[str]]]:
+        """Create new group with given variable ids."""
+        var_ids = sorted(var_ids)
+        msg = self._create_group_of_variables_message(var_ids)
+        res = await self.channel.request(msg, timeout=timeout)
+        return self._create_group_of_variables_response(res, var_ids)
+
+    async def remove_all_groups_of_variables(
+        self,
+        timeout: float
+    ) -> typing.Tuple[int, typing.Optional[typing.List[str]]]:
+        """Remove all groups."""
+        msg = self._remove_all_groups_of_variables_message()
+        res = await self.channel.request(msg, timeout=timeout)
+        return self._remove_all_groups_of_variables_response(res)
+
+    # 0x4_
+    async def request_curve_block(
+            self,
+            curve_id,
+            block,
+            timeout: float,
+            print_error: bool = True
+    ) -> typing.Tuple[typing.Optional[int], typing.Optional[typing.List[str]]]:
+        """Read curve block."""
+        msg = self._request_curve_block_message(curve_id, block)
+        res = await self.channel.request(msg, timeout=timeout)
+        return self._request_curve_block_response(
+            res, curve_id, block, print_error)
+
+    async def curve_block(
+            self,
+            curve_id: int,
+            block,
+            value,
+            timeout: float
+    ) -> typing.Tuple[int, typing.Optional[typing.List[str]]]:
+        """Write to curve block."""
+        msg = self._curve_block_message(curve_id, block, value)
+        res = await self.channel.request(msg, timeout=timeout)
+        return self._curve_block_response(res)
+
+    async def recalculate_curve_checksum(
+        self,
+        curve_id: int,
+        timeout: float
+    ) -> typing.Tuple[int, typing.Optional[typing.List[str]]]:
+        """Recalculate curve checksum."""
+        msg = self._recalculate_curve_checksum_message(curve_id)
+        res = await self.channel.request(msg, timeout=timeout)
+        return self._recalculate_curve_checksum_response(res)
+
+    # 0x5_
+    async def execute_function(
+        self,
+        func_id: int,
+        input_val=None,
+        timeout: float = BSMP._timeout_execute_function,
+        read_flag: bool = True,
+        print_error: bool = True
+    ) -> typing.Optional[typing.Tuple[int, typing.Optional[typing.Union[typing.List[str], str]]]]:
+        """Execute a function.
+
+        parameter:
+            read_flag: whether to execute a read after a write.
+        """
+        msg = self._execute_function_message(func_id, input_val)
+        res = await self.channel.request(
+            msg, timeout=timeout, read_flag=read_flag)
+
+        if not read_flag:
+            return None
+
+        return self._execute_function_response(res, func_id, print_error)
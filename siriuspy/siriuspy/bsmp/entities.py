@@ -7,6 +7,14 @@ import numpy as _np
 from .types import BSMPType
 
 
+def _load_to_bytes(load) -> typing.Union[bytes, bytearray, memoryview]:
+    """Return load as a bytes-like object."""
+    if isinstance(load, (bytes, bytearray, memoryview)):
+        return load
+    # NOTE: compatibility with loads given as lists of chars.
+    return ''.join(load).encode('latin-1')
+
+
 class Entity:
     """BSMP entity."""
 
@@ -57,25 +65,27 @@ class Entity:
     def _conv_load_to_value(
         self,
         var_types: typing.Union[typing.Tuple[BSMPType], typing.List[BSMPType]],
-        load: typing.List[str]
+        load: typing.Union[bytes, memoryview, typing.List[str]]
     ) -> typing.Union[str, float, int, typing.List[typing.Union[str, float, int]]]:
         """Return a value or a list of values unpacked according to the BMSPType.fmt"""
-        # NOTE: optimize this critical function!
-        _load = list(map(ord, load))
+        _load = _load_to_bytes(load)
         if len(var_types) > 1:
             values = []
             offset = 0
             for var_type in var_types:
-                datum = _load[offset:offset+var_type.size]
-                values.append(_struct.unpack(var_type.fmt, bytes(datum))[0])
+                values.append(_struct.unpack_from(var_type.fmt, _load, offset)[0])
                 offset += var_type.size
             return values
-        return _struct.unpack(var_types[0].fmt, bytes(_load))[0]
+        return _struct.unpack(var_types[0].fmt, _load)[0]
 
 
 class Variable(Entity):
     """BSMP variable."""
 
+    # NOTE: variables and groups of variables compile their binary layout
+    # (struct.Struct) once, at creation, so that a whole load is decoded
+    # with a single 'unpack_from' call.
+
     def __init__(self, eid: int, waccess: bool, var_type: BSMPType, count: int = 1):
         """Set variable properties."""
         if (var_type.size * count) > 128 or (var_type.size * count) < 1:
@@ -89,11 +99,25 @@ class Variable(Entity):
         self.size: int = (var_type.size * count)  # 1..128 bytes
         self.type: BSMPType = var_type
 
+        self.count: int = count
+
         self._var_types: typing.List[BSMPType] = [var_type for _ in range(count)]
+        self._struct_fmt: str = '{}{}'.format(count, var_type.fmt[1:])
+        self._struct = _struct.Struct('<' + self._struct_fmt)
 
-    def load_to_value(self, load: typing.List[str]):
+    def _dtype_descr(self) -> typing.Tuple:
+        """Return numpy dtype field description of variable."""
+        descr = ('v{}'.format(self.eid), self.type.fmt)
+        if self.count == 1:
+            return descr
+        return descr + ((self.count, ), )
+
+    def load_to_value(self, load: typing.Union[bytes, memoryview, typing.List[str]]):
         """Parse value from load."""
-        return self._conv_load_to_value(self._var_types, load)
+        values = self._struct.unpack_from(_load_to_bytes(load))
+        if self.count == 1:
+            return values[0]
+        return list(values)
 
     def value_to_load(self, value) -> typing.List[str]:
         """Convert value to load."""
@@ -122,15 +146,60 @@ class VariablesGroup(Entity):
         self.size: int = len(variables)
         self.variables: typing.List[Variable] = variables
 
-    def load_to_value(self, load: typing.List[str]) -> typing.List[typing.Union[str, float, int]]:
+        # compile group layout: a single struct for the whole group load
+        # and the (index, count) of each variable in the unpacked tuple.
+        fmt = '<' + ''.join(var._struct_fmt for var in variables)
+        self._struct = _struct.Struct(fmt)
+        self._layout: typing.List[typing.Tuple[int, int]] = []
+        index = 0
+        for variable in variables:
+            self._layout.append((index, variable.count))
+            index += variable.count
+        self._dtype = _np.dtype([var._dtype_descr() for var in variables])
+
+    @property
+    def dtype(self) -> _np.dtype:
+        """Return numpy structured dtype of group load.
+
+        Fields are named 'v<eid>' after the ids of the group variables.
+        """
+        return self._dtype
+
+    def load_to_value(
+        self,
+        load: typing.Union[bytes, memoryview, typing.List[str]]
+    ) -> typing.List[typing.Union[str, float, int]]:
         """Parse value from load."""
-        value: typing.List[typing.Union[str, float, int]] = []
-        offset = 0
-        for variable in self.variables:
-            i, j = offset, offset + variable.size
-            value.append(variable.load_to_value(load[i:j]))
-            offset += variable.size
-        return value
+        values = self._struct.unpack_from(_load_to_bytes(load))
+        return [
+            values[idx] if count == 1 else list(values[idx:idx+count])
+            for idx, count in self._layout]
+
+    def loads_to_array(
+        self,
+        loads: typing.Sequence[typing.Optional[typing.Union[bytes, memoryview, typing.List[str]]]],
+        array: typing.Optional[_np.ndarray] = None
+    ) -> _np.ndarray:
+        """Decode loads of many devices into a structured array.
+
+        loads: sequence of group loads, one per device. Entries that are
+            None or whose sizes do not match the group size are skipped,
+            leaving the corresponding array rows untouched.
+        array: optional preallocated array with 'dtype' and at least
+            len(loads) rows. A new zeroed array is created if not given.
+        """
+        if array is None:
+            array = _np.zeros(len(loads), dtype=self._dtype)
+        size = self._struct.size
+        indices, datum = [], []
+        for idx, load in enumerate(loads):
+            if load is None or len(load) != size:
+                continue
+            indices.append(idx)
+            datum.append(_load_to_bytes(load))
+        if indices:
+            array[indices] = _np.frombuffer(b''.join(datum), dtype=self._dtype)
+        return array
 
     def value_to_load(
         self,
@@ -147,10 +216,7 @@ class VariablesGroup(Entity):
 
     def variables_size(self) -> int:
         """Return sum of variables size."""
-        size = 0
-        for variable in self.variables:
-            size += variable.size
-        return size
+        return self._struct.size
 
 
 class Curve(Entity):
@@ -174,14 +240,13 @@ class Curve(Entity):
         self.max_size_t_float: int = self.nblocks * (self.size // self.type.size)
         self._var_types: typing.List[BSMPType] = [var_type for _ in range(count)]
 
-    def load_to_value(self, load: typing.List[str]):
+    def load_to_value(self, load: typing.Union[bytes, memoryview, typing.List[str]]):
         """Parse value from load."""
-        _load = [ord(c) for c in load]
+        _load = _load_to_bytes(load)
         values = []
         offset = 0
         for var_type in self._var_types:
-            datum = _load[offset:offset+var_type.size]
-            values.append(_struct.unpack(var_type.fmt, bytes(datum))[0])
+            values.append(_struct.unpack_from(var_type.fmt, _load, offset)[0])
             offset += var_type.size
             if offset >= len(_load):
                 break
@@ -231,7 +296,7 @@ class Function(Entity):
         self.o_size: int = o_size  # 0..32
         self.o_type: typing.Tuple[BSMPType] = o_type
 
-    def load_to_value(self, load: typing.Optional[typing.List[str]]):  # Parse output_size
+    def load_to_value(self, load: typing.Optional[typing.Union[bytes, memoryview, typing.List[str]]]):  # Parse output_size
         """Parse value from load."""
         if load is None or not load:
             return None
@@ -9,6 +9,18 @@ from .exceptions import SerialErrEmpty as _SerialErrEmpty
 from .exceptions import SerialErrMsgShort as _SerialErrMsgShort
 from .exceptions import SerialErrPckgLen as _SerialErrPckgLen
 
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+
+
+def _chars_to_bytes(stream: typing.List[str]) -> bytes:
+    """Convert a list of 1-char strings into bytes."""
+    return ''.join(stream).encode('latin-1')
+
+
+def _bytes_to_chars(stream) -> typing.List[str]:
+    """Convert a bytes-like stream into a list of 1-char strings."""
+    return list(bytes(stream).decode('latin-1'))
+
 
 class IOInterface(metaclass=abc.ABCMeta):
     """Base class for I/O"""
@@ -33,6 +45,17 @@ class IOInterface(metaclass=abc.ABCMeta):
     def UART_request(self, stream, timeout: float) -> typing.Optional[typing.List[str]]:
         raise NotImplementedError
 
+    def UART_request_bytes(self, stream: bytes, timeout: float) -> typing.Optional[bytes]:
+        """Write bytes stream then read bytes response.
+
+        Default implementation goes through the char-list 'UART_request'.
+        Subclasses whose transport handles bytes natively should override it.
+        """
+        response = self.UART_request(_bytes_to_chars(stream), timeout=timeout)
+        if not response or isinstance(response, _BYTES_TYPES):
+            return response
+        return _chars_to_bytes(response)
+
 
 class Message:
     """BSMP Message.
@@ -40,44 +63,56 @@ class Message:
     Command: command id; 1 byte;
     Load Size: payload size in bytes; 2 bytes (big endian);
     Load: 0..65535 bytes.
-    """
 
-    # TODO: indicate somehow that stream is a char stream.
+    The stream may be given either as a bytes-like object or, for backward
+    compatibility, as a list of 1-char strings. Conversion between the two
+    representations is done lazily, only when requested.
+    """
 
     # Constructors
-    def __init__(self, stream: typing.List[str]):
+    def __init__(self, stream: typing.Union[bytes, typing.List[str]]):
         """Build a BSMP message."""
         if len(stream) < 3:
             raise _SerialErrMsgShort("BSMP Message too short.")
-        self._stream: typing.List[str] = stream
-        self._cmd: int = ord(stream[0])
+        if isinstance(stream, _BYTES_TYPES):
+            self._buffer: typing.Optional[bytes] = bytes(stream)
+            self._stream: typing.Optional[typing.List[str]] = None
+            self._cmd: int = self._buffer[0]
+        else:
+            self._buffer = None
+            self._stream = stream
+            self._cmd = ord(stream[0])
 
     def __eq__(self, other) -> bool:
         """Compare messages."""
-        return self._stream == other.stream
+        if self._buffer is not None and other._buffer is not None:
+            return self._buffer == other._buffer
+        return self.stream == other.stream
 
     @classmethod
     def message(
         cls,
         cmd: int,
-        payload: typing.Optional[typing.List[str]] = None
+        payload: typing.Optional[typing.Union[bytes, typing.List[str]]] = None
     ):
         """Build a Message object from a byte stream."""
-        if payload and not isinstance(payload, list):
+        if payload and not isinstance(payload, (list, ) + _BYTES_TYPES):
             # TODO: should be create serial exceptions here too?
-            raise TypeError("Load must be a list.")
+            raise TypeError("Load must be a list or a bytes-like object.")
         if payload and len(payload) > 65535:
             # TODO: should be create serial exceptions here too?
             raise ValueError("Load must be smaller than 65535.")
 
-        stream: typing.List[str] = []
-
         if not payload:
-            payload = []
+            return cls(_struct.pack('>BH', cmd, 0))
+        if isinstance(payload, _BYTES_TYPES):
+            return cls(_struct.pack('>BH', cmd, len(payload)) + payload)
+
+        stream: typing.List[str] = []
         # Append cmd
         stream.append(chr(cmd))
         # Append size
-        stream.extend(list(map(chr, (_struct.pack('>H', len(payload))))))
+        stream.extend(_bytes_to_chars(_struct.pack('>H', len(payload))))
         # Append payload
         stream.extend(payload)
         return cls(stream)
@@ -85,9 +120,18 @@ class Message:
     # API
     @property
     def stream(self) -> typing.List[str]:
-        """Return stream."""
+        """Return stream as a list of chars."""
+        if self._stream is None:
+            self._stream = _bytes_to_chars(self._buffer)
         return self._stream
 
+    @property
+    def stream_bytes(self) -> bytes:
+        """Return stream as bytes."""
+        if self._buffer is None:
+            self._buffer = _chars_to_bytes(self._stream)
+        return self._buffer
+
     @property
     def cmd(self) -> int:
         """Command ID."""
@@ -96,13 +140,20 @@ class Message:
     @property
     def size(self) -> int:
         """Load size."""
-        return _struct.unpack('>H', bytes(map(ord, self._stream[1:3])))[0]
+        return _struct.unpack_from('>H', self.stream_bytes, 1)[0]
 
     @property
     def payload(self) -> typing.List[str]:
-        """Message payload."""
+        """Message payload as a list of chars."""
+        if self._stream is None:
+            return _bytes_to_chars(self._buffer[3:])
         return self._stream[3:]
 
+    @property
+    def payload_bytes(self) -> memoryview:
+        """Message payload as a bytes-like memoryview (no copy)."""
+        return memoryview(self.stream_bytes)[3:]
+
 
 class Package:
     """BSMP Package.
@@ -114,7 +165,7 @@ class Package:
 
     def __init__(
         self,
-        stream: typing.List[str]
+        stream: typing.Union[bytes, typing.List[str]]
     ):
         """Build a BSMP package."""
         if len(stream) < 5:
@@ -123,28 +174,42 @@ class Package:
             raise _SerialErrCheckSum(
                 "Inconsistent message. Checksum does not check.")
 
-        self._stream: typing.List[str] = stream
-        self._address: int = ord(stream[0])  # 0 to 31
-        self._message: Message = Message(stream[1:-1])
-        self._checksum: int = ord(stream[-1])
+        if isinstance(stream, _BYTES_TYPES):
+            self._buffer: typing.Optional[bytes] = bytes(stream)
+            self._stream: typing.Optional[typing.List[str]] = None
+            self._address: int = self._buffer[0]  # 0 to 31
+            self._message: Message = Message(self._buffer[1:-1])
+            self._checksum: int = self._buffer[-1]
+        else:
+            self._buffer = None
+            self._stream = stream
+            self._address = ord(stream[0])  # 0 to 31
+            self._message = Message(stream[1:-1])
+            self._checksum = ord(stream[-1])
 
     @classmethod
     def package(cls, address: int, message: Message):
         """Build a Package object from a byte stream."""
         # Return new package
-        stream: typing.List[str] = []
-        stream.append(chr(address))
-        stream.extend(message.stream)
+        stream = bytes((address, )) + message.stream_bytes
         chksum = cls.calc_checksum(stream)
-        stream.append(chr(chksum))
-        return cls(stream)
+        return cls(stream + bytes((chksum, )))
 
     # API
     @property
     def stream(self) -> typing.List[str]:
-        """Stream."""
+        """Stream as a list of chars."""
+        if self._stream is None:
+            self._stream = _bytes_to_chars(self._buffer)
         return self._stream
 
+    @property
+    def stream_bytes(self) -> bytes:
+        """Stream as bytes."""
+        if self._buffer is None:
+            self._buffer = _chars_to_bytes(self._stream)
+        return self._buffer
+
     @property
     def address(self) -> int:
         """Receiver node serial address."""
@@ -163,23 +228,23 @@ class Package:
     @staticmethod
     def calc_checksum(stream) -> int:
         """Return stream checksum."""
-        streambytes = [ord(s) for s in stream]
-        counter = sum(streambytes)
+        if isinstance(stream, _BYTES_TYPES):
+            counter = sum(stream)
+        else:
+            counter = sum(map(ord, stream))
         counter = (counter & 0xFF)
         counter = (256 - counter) & 0xFF
         return counter
 
     @staticmethod
-    def verify_checksum(stream: typing.List[str]) -> bool:
+    def verify_checksum(stream: typing.Union[bytes, typing.List[str]]) -> bool:
         """Verify stream checksum."""
-        streambytes = [ord(s) for s in stream[:-1]]
-        counter = sum(streambytes)
-        counter = (counter & 0xFF)
-        counter = (256 - counter) & 0xFF
-        if stream[len(stream) - 1] == chr(counter):
-            return True
+        # NOTE: a valid stream, checksum byte included, sums up to 0 mod 256.
+        if isinstance(stream, _BYTES_TYPES):
+            counter = sum(stream)
         else:
-            return False
+            counter = sum(map(ord, stream))
+        return not counter & 0xFF
 
 
 class Channel:
@@ -197,6 +262,8 @@ class Channel:
         self._iointerf: IOInterface = iointerf  # IOInterface object to communicate with bsmp device
         self._address: int = address  # address of recipient device.
         self._size_counter: int = 0  # stream size counter [bytes]
+        # whether requests may go through the bytes-native interface method
+        self._bytes_native: bool = isinstance(iointerf, IOInterface)
 
     @property
     def iointerf(self) -> IOInterface:
@@ -223,7 +290,7 @@ class Channel:
         if not resp:
             raise _SerialErrEmpty("Serial read returned empty!")
         package = Package(resp)
-        self._size_counter += len(package.stream)
+        self._size_counter += len(resp)
         return package.message
 
     def write(self, message: Message, timeout: float = 100):
@@ -235,13 +302,19 @@ class Channel:
 
     def request_(self, message: Message, timeout: float = 100) -> Message:
         """:param timeout [ms]"""
-        stream = Package.package(self._address, message).stream
+        package = Package.package(self._address, message)
+        if self._bytes_native:
+            stream = package.stream_bytes
+            uart_request = self.iointerf.UART_request_bytes
+        else:
+            stream = package.stream
+            uart_request = self.iointerf.UART_request
 
         if Channel.LOCK is None:
-            response = self.iointerf.UART_request(stream, timeout=timeout)
+            response = uart_request(stream, timeout=timeout)
         else:
             with Channel.LOCK:
-                response = self.iointerf.UART_request(stream, timeout=timeout)
+                response = uart_request(stream, timeout=timeout)
 
         self._size_counter += len(stream)
 
@@ -249,7 +322,7 @@ class Channel:
             raise _SerialErrEmpty("Serial read returned empty!")
 
         package = Package(response)
-        self._size_counter += len(package.stream)
+        self._size_counter += len(response)
         return package.message
 
     def request(self, message: Message, timeout: float = 100, read_flag: bool = True) -> typing.Optional[Message]:
@@ -4,8 +4,9 @@ from ..envars import SRVURL_ARCHIVER as SERVER_URL
 
 from .client import ClientArchiver
 from .pvarch import PVDetails, PVData, PVDataSet
+from .cache import DataCache
 from .devices import Orbit, Correctors, TrimQuads
 from .time import Time
 
 
-del client, pvarch, devices
+del client, dataformat, pvarch, devices, cache
@@ -0,0 +1,144 @@
+"""Local on-disk cache of archiver data."""
+
+import os as _os
+import json as _json
+import hashlib as _hashlib
+import tempfile as _tempfile
+import time as _time
+
+import numpy as _np
+
+
+class DataCache:
+    """Local on-disk cache of archiver data of closed time bins.
+
+    Data of each PV time bin is stored in a '.npz' file named after the
+    hash of the PV name, processing arguments and bin limits. Only bins
+    closed for longer than CLOSED_BIN_DELAY are stored, since the archiver
+    may still receive data of recent bins. Least recently used files are
+    evicted when the cache size exceeds 'max_size'.
+    """
+
+    DEFAULT_PATH = _os.path.join(
+        _os.path.expanduser('~'), '.cache', 'siriuspy', 'clientarch')
+    DEFAULT_MAX_SIZE = 2 * 1024**3  # [bytes]
+    CLOSED_BIN_DELAY = 10 * 60  # [s]
+
+    _COLUMNS = ('timestamp', 'value', 'status', 'severity')
+
+    def __init__(self, path=None, max_size=DEFAULT_MAX_SIZE):
+        """Init."""
+        self._path = path or DataCache.DEFAULT_PATH
+        self._max_size = max_size
+        self._size = None
+
+    @property
+    def path(self):
+        """Return cache directory."""
+        return self._path
+
+    @property
+    def max_size(self):
+        """Return maximum cache size [bytes]."""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value):
+        self._max_size = value
+        self._evict()
+
+    @property
+    def size(self):
+        """Return cache size [bytes]."""
+        return sum(_os.path.getsize(fname) for fname in self._get_files())
+
+    @staticmethod
+    def get_key(pvname, timestamp_start, timestamp_stop, **kwargs):
+        """Return key of PV data of a time bin.
+
+        kwargs are processing arguments of the data, as 'process_type' and
+        'interval' of ClientArchiver.getData.
+        """
+        args = [pvname, float(timestamp_start), float(timestamp_stop)]
+        args.append(sorted(kwargs.items()))
+        return _hashlib.sha1(_json.dumps(args).encode()).hexdigest()
+
+    @classmethod
+    def is_closed(cls, timestamp_stop):
+        """Return whether a time bin ending at 'timestamp_stop' is closed."""
+        return timestamp_stop < _time.time() - cls.CLOSED_BIN_DELAY
+
+    def get(self, key):
+        """Return cached data columns of key, or None if not cached."""
+        fname = self._get_fname(key)
+        try:
+            with _np.load(fname) as data:
+                columns = [data[col] for col in self._COLUMNS]
+        except (OSError, ValueError, KeyError):
+            return None
+        # NOTE: modification times track the last use of files.
+        _os.utime(fname)
+        return columns
+
+    def put(self, key, columns):
+        """Store data columns of key."""
+        fname = self._get_fname(key)
+        _os.makedirs(_os.path.dirname(fname), exist_ok=True)
+        if columns[0] is None:
+            columns = [_np.array([])] * len(self._COLUMNS)
+        with _tempfile.NamedTemporaryFile(
+                dir=_os.path.dirname(fname), suffix='.tmp',
+                delete=False) as tmp:
+            _np.savez(tmp, **dict(zip(self._COLUMNS, columns)))
+        # NOTE: files are replaced atomically, for concurrent users.
+        _os.replace(tmp.name, fname)
+        if self._size is None:
+            self._size = self.size
+        else:
+            self._size += _os.path.getsize(fname)
+        if self._size > self._max_size:
+            self._evict()
+
+    def clear(self):
+        """Remove all cached data."""
+        for fname in self._get_files():
+            _os.remove(fname)
+        self._size = 0
+
+    # --- private methods ---
+
+    def _get_fname(self, key):
+        return _os.path.join(self._path, key[:2], key + '.npz')
+
+    def _get_files(self):
+        if not _os.path.isdir(self._path):
+            return []
+        fnames = []
+        for subdir in _os.listdir(self._path):
+            subdir = _os.path.join(self._path, subdir)
+            if not _os.path.isdir(subdir):
+                continue
+            fnames.extend(
+                _os.path.join(subdir, fname) for fname in _os.listdir(subdir)
+                if fname.endswith('.npz'))
+        return fnames
+
+    def _evict(self):
+        files = []
+        for fname in self._get_files():
+            try:
+                stat = _os.stat(fname)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, fname))
+        files.sort()
+        size = sum(fsize for _, fsize, _ in files)
+        for _, fsize, fname in files:
+            if size <= self._max_size:
+                break
+            try:
+                _os.remove(fname)
+            except OSError:
+                continue
+            size -= fsize
+        self._size = size
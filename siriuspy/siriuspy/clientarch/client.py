@@ -7,12 +7,16 @@ See https://slacmshankar.github.io/epicsarchiver_docs/userguide.html
 import asyncio as _asyncio
 import urllib as _urllib
 import ssl as _ssl
+import weakref as _weakref
 import urllib3 as _urllib3
-from aiohttp import ClientSession as _ClientSession
-
-import numpy as _np
+from aiohttp import ClientSession as _ClientSession, \
+    TCPConnector as _TCPConnector, \
+    ClientConnectionError as _ClientConnectionError
 
 from .. import envars as _envars
+from .dataformat import DATA_FORMATS as _DATA_FORMATS, \
+    json_to_columns as _json_to_columns, raw_to_columns as _raw_to_columns, \
+    concatenate_columns as _concatenate_columns
 
 
 _TIMEOUT = 5.0  # [seconds]
@@ -23,15 +27,37 @@ class AuthenticationError(Exception):
 
 
 class ClientArchiver:
-    """Archiver Data Fetcher class."""
+    """Archiver Data Fetcher class.
+
+    Requests without login share a pooled session, closed by the close
+    method. At most 'max_concurrency' requests are made at a time, with at
+    most 'limit_per_host' connections to each host. Requests failing with
+    connection errors, timeouts or server errors are retried up to
+    'max_retries' times, waiting 'retry_backoff' seconds before the first
+    retry and doubling it for each one of the following.
+    'progress_callback', if set, is called with the number of finished
+    and total requests of data retrievals as each request finishes.
+    """
 
     SERVER_URL = _envars.SRVURL_ARCHIVER
     ENDPOINT = '/mgmt/bpl'
 
+    DEFAULT_MAX_CONCURRENCY = 100
+    DEFAULT_LIMIT_PER_HOST = 30
+    DEFAULT_MAX_RETRIES = 3
+    DEFAULT_RETRY_BACKOFF = 0.5  # [s]
+
     def __init__(self, server_url=None):
         """Initialize."""
         self.session = None
         self.timeout = _TIMEOUT
+        self.max_concurrency = ClientArchiver.DEFAULT_MAX_CONCURRENCY
+        self.limit_per_host = ClientArchiver.DEFAULT_LIMIT_PER_HOST
+        self.max_retries = ClientArchiver.DEFAULT_MAX_RETRIES
+        self.retry_backoff = ClientArchiver.DEFAULT_RETRY_BACKOFF
+        self.progress_callback = None
+        self._pool_session = None
+        self._pool_loop = None
         self._url = server_url or self.SERVER_URL
         # print('urllib3 InsecureRequestWarning disabled!')
         _urllib3.disable_warnings(_urllib3.exceptions.InsecureRequestWarning)
@@ -72,6 +98,20 @@ class ClientArchiver:
             return resp
         return None
 
+    def close(self):
+        """Close pooled session of requests without login."""
+        session, loop = self._pool_session, self._pool_loop
+        self._pool_session = self._pool_loop = None
+        _close_pool_session(session, loop)
+
+    def __enter__(self):
+        """Enter context."""
+        return self
+
+    def __exit__(self, *args):
+        """Exit context, closing pooled session."""
+        self.close()
+
     def getPVsInfo(self, pvnames):
         """Get PVs Info."""
         if isinstance(pvnames, (list, tuple)):
@@ -126,7 +166,7 @@ class ClientArchiver:
 
     def getData(self, pvname, timestamp_start, timestamp_stop,
                 process_type='', interval=None, stddev=None,
-                get_request_url=False):
+                get_request_url=False, data_format='json'):
         """Get archiver data.
 
         pvname -- name of pv.
@@ -143,81 +183,87 @@ class ClientArchiver:
         interval -- interval of the bin of data, in seconds
         stddev -- number of standard deviations.
                   argument used in processing 'ignoreflyers' and 'flyers'.
-        """
-        if isinstance(pvname, str):
-            pvname = [pvname, ]
-        if isinstance(timestamp_start, str):
-            timestamp_start = [timestamp_start, ]
-        if isinstance(timestamp_stop, str):
-            timestamp_stop = [timestamp_stop, ]
-        if not isinstance(timestamp_start, (list, tuple)) or \
-                not isinstance(timestamp_stop, (list, tuple)):
-            raise TypeError(
-                "'timestampstart' and 'timestamp_stop' arguments must be "
-                "timestamp strings or iterable.")
+        data_format -- retrieval data format, 'json' or 'raw' (PB over HTTP).
 
-        pvname_orig = list(pvname)
-        if process_type:
-            process_str = process_type
-            if interval is not None:
-                process_str += '_' + str(int(interval))
-                if 'flyers' in process_type and stddev is not None:
-                    process_str += '_' + str(int(stddev))
-            pvname = [process_str+'('+pvn+')' for pvn in pvname]
+        Each response is parsed into timestamp, value, status and severity
+        arrays as soon as it arrives. Data of time intervals whose requests
+        failed are missing from the data returned and their URLs are
+        printed. Returns None if all requests failed.
+        """
+        pvname_orig, pvname, timestamp_start, timestamp_stop = \
+            self._process_data_args(
+                pvname, timestamp_start, timestamp_stop,
+                process_type, interval, stddev)
 
         if get_request_url:
             tstart = _urllib.parse.quote(timestamp_start[0])
             tstop = _urllib.parse.quote(timestamp_stop[-1])
             url = [self._create_url(
-                method='getData.json', pv=pvn,
+                method='getData.' + data_format, pv=pvn,
                 **{'from': tstart, 'to': tstop})
                    for pvn in pvname]
             return url[0] if len(pvname) == 1 else url
 
-        pvn2idcs = dict()
-        all_urls = list()
-        for i, pvn in enumerate(pvname):
-            urls = []
-            for tstart, tstop in zip(timestamp_start, timestamp_stop):
-                urls.append(self._create_url(
-                    method='getData.json', pv=pvn,
-                    **{'from': _urllib.parse.quote(tstart),
-                       'to': _urllib.parse.quote(tstop)}))
-            ini = len(all_urls)
-            all_urls.extend(urls)
-            end = len(all_urls)
-            pvn2idcs[pvname_orig[i]] = _np.arange(ini, end)
+        all_urls, url2pvn = self._create_data_urls(
+            pvname, pvname_orig, timestamp_start, timestamp_stop,
+            data_format)
 
-        resps = self._make_request(all_urls, return_json=True)
+        resps = self._make_request(
+            all_urls, parse=self._get_data_parser(data_format))
         if resps is None:
             return None
 
+        pvn2chunks = {pvn: list() for pvn in pvname_orig}
+        failed = list()
+        for pvn, url, resp in zip(url2pvn, all_urls, resps):
+            if resp is None:
+                failed.append(url)
+            pvn2chunks[pvn].append(resp)
+        if failed:
+            print('Could not get data of {} requests, ignoring them:\n'.format(
+                len(failed)) + '\n'.join(failed))
         pvn2resp = dict()
-        for pvn, idcs in pvn2idcs.items():
-            _ts, _vs = _np.array([]), _np.array([])
-            _st, _sv = _np.array([]), _np.array([])
-            for idx in idcs:
-                resp = resps[idx]
-                if not resp:
-                    continue
-                data = resp[0]['data']
-                _ts = _np.r_[_ts, [v['secs'] + v['nanos']/1.0e9 for v in data]]
-                _vs = _np.r_[_vs, [v['val'] for v in data]]
-                _st = _np.r_[_st, [v['status'] for v in data]]
-                _sv = _np.r_[_sv, [v['severity'] for v in data]]
-            if not _ts.size:
-                timestamp, value, status, severity = [None, None, None, None]
-            else:
-                _, _tsidx = _np.unique(_ts, return_index=True)
-                timestamp, value, status, severity = \
-                    _ts[_tsidx], _vs[_tsidx], _st[_tsidx], _sv[_tsidx]
-
-            pvn2resp[pvn] = [timestamp, value, status, severity]
+        for pvn, chunks in pvn2chunks.items():
+            pvn2resp[pvn] = _concatenate_columns(chunks)
 
         if len(pvname) == 1:
             return pvn2resp[pvname_orig[0]]
         return pvn2resp
 
+    def getDataChunks(self, pvname, timestamp_start, timestamp_stop,
+                      process_type='', interval=None, stddev=None,
+                      data_format='json'):
+        """Yield archiver data of each PV and time interval.
+
+        Takes the same arguments as getData. Yields (pvname, index, data)
+        tuples, in the order responses arrive, where index is the one of
+        the time interval in timestamp_start and timestamp_stop and data
+        is a list with timestamp, value, status and severity arrays, or
+        None if its request failed. Only the data of requests in progress
+        is held in memory.
+        """
+        pvname_orig, pvname, timestamp_start, timestamp_stop = \
+            self._process_data_args(
+                pvname, timestamp_start, timestamp_stop,
+                process_type, interval, stddev)
+        all_urls, url2pvn = self._create_data_urls(
+            pvname, pvname_orig, timestamp_start, timestamp_stop,
+            data_format)
+        nr_intervals = min(len(timestamp_start), len(timestamp_stop))
+
+        loop = self._get_async_event_loop()
+        agen = self._iter_request_response(
+            all_urls, parse=self._get_data_parser(data_format))
+        try:
+            while True:
+                try:
+                    idx, resp = loop.run_until_complete(agen.__anext__())
+                except StopAsyncIteration:
+                    break
+                yield url2pvn[idx], idx % nr_intervals, resp
+        finally:
+            loop.run_until_complete(agen.aclose())
+
     def getPVDetails(self, pvname, get_request_url=False):
         """Get PV Details."""
         url = self._create_url(
@@ -229,17 +275,19 @@ class ClientArchiver:
 
     # ---------- auxiliary methods ----------
 
-    def _make_request(self, url, need_login=False, return_json=False):
+    def _make_request(
+            self, url, need_login=False, return_json=False, parse=None):
         """Make request."""
         loop = self._get_async_event_loop()
         response = loop.run_until_complete(self._handle_request(
-            url, return_json=return_json, need_login=need_login))
+            url, return_json=return_json, need_login=need_login,
+            parse=parse))
         return response
 
     def _create_url(self, method, **kwargs):
         """Create URL."""
         url = self._url
-        if method.startswith('getData.json'):
+        if method.startswith('getData.'):
             url += '/retrieval/data'
         else:
             url += self.ENDPOINT
@@ -249,6 +297,61 @@ class ClientArchiver:
             url += '&'.join(['{}={}'.format(k, v) for k, v in kwargs.items()])
         return url
 
+    @staticmethod
+    def _process_data_args(
+            pvname, timestamp_start, timestamp_stop,
+            process_type, interval, stddev):
+        if isinstance(pvname, str):
+            pvname = [pvname, ]
+        if isinstance(timestamp_start, str):
+            timestamp_start = [timestamp_start, ]
+        if isinstance(timestamp_stop, str):
+            timestamp_stop = [timestamp_stop, ]
+        if not isinstance(timestamp_start, (list, tuple)) or \
+                not isinstance(timestamp_stop, (list, tuple)):
+            raise TypeError(
+                "'timestampstart' and 'timestamp_stop' arguments must be "
+                "timestamp strings or iterable.")
+
+        pvname_orig = list(pvname)
+        if process_type:
+            process_str = process_type
+            if interval is not None:
+                process_str += '_' + str(int(interval))
+                if 'flyers' in process_type and stddev is not None:
+                    process_str += '_' + str(int(stddev))
+            pvname = [process_str+'('+pvn+')' for pvn in pvname]
+        return pvname_orig, pvname, timestamp_start, timestamp_stop
+
+    def _create_data_urls(
+            self, pvname, pvname_orig, timestamp_start, timestamp_stop,
+            data_format):
+        """Return data URLs and the original PV name of each one."""
+        all_urls, url2pvn = list(), list()
+        for pvn, pvn_orig in zip(pvname, pvname_orig):
+            for tstart, tstop in zip(timestamp_start, timestamp_stop):
+                all_urls.append(self._create_url(
+                    method='getData.' + data_format, pv=pvn,
+                    **{'from': _urllib.parse.quote(tstart),
+                       'to': _urllib.parse.quote(tstop)}))
+                url2pvn.append(pvn_orig)
+        return all_urls, url2pvn
+
+    @staticmethod
+    def _get_data_parser(data_format):
+        """Return coroutine function parsing data responses into columns."""
+        if data_format == 'json':
+            async def parse(response):
+                return _json_to_columns(await response.json())
+        elif data_format == 'raw':
+            async def parse(response):
+                return _raw_to_columns(await response.read())
+        else:
+            raise ValueError(
+                "Invalid data format '{}'. Must be one of {}.".format(
+                    data_format, _DATA_FORMATS))
+        return parse
+
     # ---------- async methods ----------
 
     def _get_async_event_loop(self):
@@ -264,45 +367,135 @@ class ClientArchiver:
         return loop
 
     async def _handle_request(
-            self, url, return_json=False, need_login=False):
+            self, url, return_json=False, need_login=False, parse=None):
         """Handle request."""
         if self.session is not None:
             response = await self._get_request_response(
-                url, self.session, return_json)
+                url, self.session, return_json, parse)
         elif need_login:
             raise AuthenticationError('You need to login first.')
         else:
-            async with _ClientSession() as sess:
-                response = await self._get_request_response(
-                    url, sess, return_json)
+            response = await self._get_request_response(
+                url, self._get_pool_session(), return_json, parse)
         return response
 
-    async def _get_request_response(self, url, session, return_json):
+    async def _get_request_response(
+            self, url, session, return_json, parse=None):
         """Get request response."""
         try:
             if isinstance(url, list):
-                response = await _asyncio.gather(
-                    *[session.get(u, ssl=False, timeout=self.timeout)
-                      for u in url])
-                if any([not r.ok for r in response]):
+                tasks = self._create_url_tasks(
+                    url, session, return_json, parse)
+                try:
+                    response = await _asyncio.gather(*tasks)
+                finally:
+                    await self._cancel_tasks(tasks)
+                # NOTE: only failed requests have None responses.
+                if not any(isok for _, isok, _ in response):
                     return None
-                if return_json:
-                    response = await _asyncio.gather(
-                        *[r.json() for r in response])
+                response = [
+                    resp if isok else None for _, isok, resp in response]
             else:
-                response = await session.get(
-                    url, ssl=False, timeout=self.timeout)
-                if not response.ok:
+                isok, response = await self._get_url_response(
+                    url, session, return_json, parse)
+                if not isok:
                     return None
-                if return_json:
-                    response = await response.json()
         except _asyncio.TimeoutError as err_msg:
             raise ConnectionError(err_msg)
         return response
 
+    async def _iter_request_response(self, urls, parse=None):
+        """Yield index and response of each URL, as responses arrive.
+
+        Responses of failed requests are None.
+        """
+        session = self.session or self._get_pool_session()
+        tasks = self._create_url_tasks(urls, session, True, parse)
+        try:
+            for task in _asyncio.as_completed(tasks):
+                idx, isok, response = await task
+                yield idx, response if isok else None
+        except _asyncio.TimeoutError as err_msg:
+            raise ConnectionError(err_msg)
+        finally:
+            await self._cancel_tasks(tasks)
+
+    def _create_url_tasks(self, urls, session, return_json, parse=None):
+        """Return tasks of URL requests, with bounded concurrency.
+
+        Tasks return URL index, whether request succeeded and response.
+        """
+        semaphore = _asyncio.Semaphore(self.max_concurrency)
+        nr_urls, nr_done = len(urls), [0]
+
+        async def get_response(idx, url):
+            async with semaphore:
+                isok, response = await self._get_url_response(
+                    url, session, return_json, parse)
+            nr_done[0] += 1
+            if self.progress_callback is not None:
+                self.progress_callback(nr_done[0], nr_urls)
+            return idx, isok, response
+
+        return [
+            _asyncio.ensure_future(get_response(idx, url))
+            for idx, url in enumerate(urls)]
+
+    @staticmethod
+    async def _cancel_tasks(tasks):
+        for task in tasks:
+            task.cancel()
+        await _asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _get_url_response(self, url, session, return_json, parse=None):
+        """Return whether request succeeded and its response.
+
+        The response is parsed by 'parse' coroutine function, if given, as
+        soon as it arrives. Failed requests are retried with exponential
+        backoff and reported as failed once retries are exhausted.
+        """
+        for retry in range(self.max_retries + 1):
+            if retry:
+                await _asyncio.sleep(self.retry_backoff * 2**(retry - 1))
+            try:
+                response = await session.get(
+                    url, ssl=False, timeout=self.timeout)
+                if response.ok:
+                    if parse is not None:
+                        response = await parse(response)
+                    elif return_json:
+                        response = await response.json()
+                    return True, response
+                response.release()
+                # NOTE: only server errors and throttling are transient.
+                if response.status < 500 and response.status != 429:
+                    return False, None
+            except (_asyncio.TimeoutError, _ClientConnectionError):
+                # NOTE: requests still failing after all retries are
+                # reported as failed, so that other requests are kept.
+                pass
+        return False, None
+
+    def _get_pool_session(self):
+        """Return pooled session of the running event loop."""
+        loop = _asyncio.get_event_loop()
+        if self._pool_session is None or self._pool_session.closed or \
+                self._pool_loop is not loop:
+            self._pool_session = _ClientSession(
+                connector=self._create_connector())
+            self._pool_loop = loop
+            # NOTE: closes the session when the client is garbage collected.
+            _weakref.finalize(
+                self, _close_pool_session, self._pool_session, loop)
+        return self._pool_session
+
+    def _create_connector(self):
+        return _TCPConnector(
+            limit=self.max_concurrency, limit_per_host=self.limit_per_host)
+
     async def _create_session(self, url, headers, payload, ssl):
         """Create session and handle login."""
-        session = _ClientSession()
+        session = _ClientSession(connector=self._create_connector())
         async with session.post(
                 url, headers=headers, data=payload, ssl=ssl,
                 timeout=self.timeout) as response:
@@ -313,3 +506,15 @@ class ClientArchiver:
     async def _close_session(self):
         """Close session."""
         return await self.session.close()
+
+
+def _close_pool_session(session, loop):
+    if session is None or session.closed:
+        return
+    if loop.is_closed():
+        # NOTE: connections are lost along with their event loop.
+        session.detach()
+    elif loop.is_running():
+        loop.create_task(session.close())
+    else:
+        loop.run_until_complete(session.close())
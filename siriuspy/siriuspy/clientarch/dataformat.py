@@ -0,0 +1,198 @@
+"""Archiver data formats module.
+
+Parsers of archiver retrieval responses into timestamp, value, status and
+severity columns.
+
+See https://slacmshankar.github.io/epicsarchiver_docs/pb_pbraw.html
+"""
+
+import calendar as _calendar
+import struct as _struct
+
+import numpy as _np
+
+
+DATA_FORMATS = ('json', 'raw')
+
+STATUS_DTYPE = _np.int32
+SEVERITY_DTYPE = _np.int32
+
+# PB payload types and the wire decoding of their 'val' fields.
+_PB_SCALAR_DECODERS = {
+    1: 'sint32',  # SCALAR_SHORT
+    2: '<f',  # SCALAR_FLOAT
+    3: 'sint32',  # SCALAR_ENUM
+    4: 'byte',  # SCALAR_BYTE
+    5: '<i',  # SCALAR_INT
+    6: '<d',  # SCALAR_DOUBLE
+    }
+_PB_WAVEFORM_DECODERS = {
+    8: 'sint32',  # WAVEFORM_SHORT
+    9: '<f4',  # WAVEFORM_FLOAT
+    10: 'sint32',  # WAVEFORM_ENUM
+    11: 'byte',  # WAVEFORM_BYTE
+    12: '<i4',  # WAVEFORM_INT
+    13: '<f8',  # WAVEFORM_DOUBLE
+    }
+
+# PB sample fields.
+_PB_SECS, _PB_NANO, _PB_VAL, _PB_SEVR, _PB_STAT = 1, 2, 3, 4, 5
+# PB payload info fields.
+_PB_TYPE, _PB_YEAR = 1, 3
+
+
+def json_to_columns(resp):
+    """Return columns of a 'getData.json' response.
+
+    Returns a list with timestamp, value, status and severity arrays.
+    """
+    data = resp[0]['data'] if resp else []
+    nrpts = len(data)
+    timestamp = _np.fromiter(
+        (v['secs'] for v in data), dtype=float, count=nrpts)
+    timestamp += _np.fromiter(
+        (v['nanos'] for v in data), dtype=float, count=nrpts) / 1.0e9
+    value = _np.array([v['val'] for v in data], dtype=float)
+    status = _np.fromiter(
+        (v['status'] for v in data), dtype=STATUS_DTYPE, count=nrpts)
+    severity = _np.fromiter(
+        (v['severity'] for v in data), dtype=SEVERITY_DTYPE, count=nrpts)
+    return [timestamp, value, status, severity]
+
+
+def raw_to_columns(stream):
+    """Return columns of a 'getData.raw' (PB over HTTP) response.
+
+    Only numeric payload types are supported. Returns a list with
+    timestamp, value, status and severity arrays.
+    """
+    lines = bytes(stream).split(b'\n')
+    timestamp, value, status, severity = [], [], [], []
+    decoder = year_start = None
+    for line in lines:
+        if not line:
+            # empty lines separate chunks, each one with its own header.
+            decoder = None
+            continue
+        fields = _decode_pb_message(_pb_unescape(line))
+        if decoder is None:
+            decoder, year_start = _get_pb_decoder(fields)
+            continue
+        timestamp.append(
+            year_start + fields.get(_PB_SECS, 0) +
+            fields.get(_PB_NANO, 0)/1.0e9)
+        value.append(decoder(fields.get(_PB_VAL, b'')))
+        status.append(_to_int64(fields.get(_PB_STAT, 0)))
+        severity.append(_to_int64(fields.get(_PB_SEVR, 0)))
+    return [
+        _np.array(timestamp, dtype=float),
+        _np.array(value, dtype=float),
+        _np.array(status, dtype=STATUS_DTYPE),
+        _np.array(severity, dtype=SEVERITY_DTYPE)]
+
+
+def concatenate_columns(chunks):
+    """Concatenate columns of data chunks, sorted by unique timestamps.
+
+    Chunks that are None are ignored. Returns a list of None if there is
+    no data.
+    """
+    chunks = [
+        chunk for chunk in chunks if chunk is not None and chunk[0].size]
+    if not chunks:
+        return [None, None, None, None]
+    columns = [
+        _np.concatenate([chunk[i] for chunk in chunks]) for i in range(4)]
+    _, _tsidx = _np.unique(columns[0], return_index=True)
+    return [col[_tsidx] for col in columns]
+
+
+# --- private functions ---
+
+
+def _pb_unescape(line):
+    # NOTE: escaped streams only have ESC bytes at the start of escape
+    # sequences, so ESC itself must be the last one to be unescaped.
+    return line.replace(b'\x1b\x02', b'\n').replace(
+        b'\x1b\x03', b'\r').replace(b'\x1b\x01', b'\x1b')
+
+
+def _read_varint(buf, pos):
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _decode_pb_message(buf):
+    """Return dict of field number to raw field value of a PB message.
+
+    Varint fields are returned as integers, other fields as bytes.
+    """
+    fields = dict()
+    pos, size = 0, len(buf)
+    while pos < size:
+        key, pos = _read_varint(buf, pos)
+        wire_type = key & 0x07
+        if wire_type == 0:
+            val, pos = _read_varint(buf, pos)
+        elif wire_type == 1:
+            val, pos = buf[pos:pos+8], pos + 8
+        elif wire_type == 2:
+            length, pos = _read_varint(buf, pos)
+            val, pos = buf[pos:pos+length], pos + length
+        elif wire_type == 5:
+            val, pos = buf[pos:pos+4], pos + 4
+        else:
+            raise ValueError(
+                'Invalid PB wire type {}.'.format(wire_type))
+        fields[key >> 3] = val
+    return fields
+
+
+def _zigzag(val):
+    return (val >> 1) ^ -(val & 1)
+
+
+def _to_int64(val):
+    # int32 fields are plain two's complement varints.
+    return val - (1 << 64) if val >= (1 << 63) else val
+
+
+def _decode_scalar(kind):
+    if kind == 'sint32':
+        return _zigzag
+    if kind == 'byte':
+        return lambda val: val[0] if val else _np.nan
+    fmt = kind
+    return lambda val: _struct.unpack(fmt, val)[0]
+
+
+def _decode_waveform(kind):
+    if kind == 'sint32':
+        def decode(val):
+            out, pos = [], 0
+            while pos < len(val):
+                num, pos = _read_varint(val, pos)
+                out.append(_zigzag(num))
+            return out
+        return decode
+    dtype = _np.int8 if kind == 'byte' else kind
+    return lambda val: _np.frombuffer(val, dtype=dtype)
+
+
+def _get_pb_decoder(info):
+    ptype = info.get(_PB_TYPE, 0)
+    if ptype in _PB_SCALAR_DECODERS:
+        decoder = _decode_scalar(_PB_SCALAR_DECODERS[ptype])
+    elif ptype in _PB_WAVEFORM_DECODERS:
+        decoder = _decode_waveform(_PB_WAVEFORM_DECODERS[ptype])
+    else:
+        raise ValueError('Unsupported PB payload type {}.'.format(ptype))
+    year = _to_int64(info.get(_PB_YEAR, 1970))
+    year_start = _calendar.timegm((year, 1, 1, 0, 0, 0))
+    return decoder, year_start
@@ -2,7 +2,10 @@
 
 from copy import deepcopy as _dcopy
 
+import numpy as _np
+
 from .client import ClientArchiver as _ClientArchiver
+from .dataformat import concatenate_columns as _concatenate_columns
 from .time import Time as _Time, get_time_intervals as _get_time_intervals
 
 
@@ -116,10 +119,11 @@ class PVDetails:
 class PVData:
     """Archive PV Data."""
 
-    def __init__(self, pvname, connector=None):
+    def __init__(self, pvname, connector=None, cache=None):
         """Initialize."""
         self._pvname = pvname
         self._connector = connector
+        self._cache = cache
         self._time_start = None
         self._time_stop = None
         self._timestamp = None
@@ -168,6 +172,15 @@ class PVData:
         """Check connected."""
         return self.connector and self.connector.connected
 
+    @property
+    def cache(self):
+        """Local data cache, DataCache object or None."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, new_cache):
+        self._cache = new_cache
+
     @property
     def timestamp_start(self):
         """Timestamp start."""
@@ -248,7 +261,12 @@ class PVData:
         return self._severity
 
     def update(self, mean_sec=None, parallel=True):
-        """Update."""
+        """Update.
+
+        If a cache is set, data of time bins aligned to
+        parallel_query_bin_interval are read from the cache, if available,
+        regardless of 'parallel'.
+        """
         self.connect()
         if None in (self.timestamp_start, self.timestamp_stop):
             print('Start and stop timestamps not defined! Aborting.')
@@ -256,6 +274,14 @@ class PVData:
         process_type = 'mean' if mean_sec is not None else ''
 
         interval = self.parallel_query_bin_interval
+        if self._cache is not None:
+            data = _get_cached_data(
+                self.connector, self._cache, [self._pvname],
+                self._time_start, self._time_stop, interval,
+                process_type, mean_sec)
+            if data is not None:
+                self.set_data(data[self._pvname])
+            return
         if parallel:
             timestamp_start, timestamp_stop = _get_time_intervals(
                 self._time_start, self._time_stop, interval,
@@ -279,10 +305,11 @@ class PVData:
 class PVDataSet:
     """A set of PVData objects."""
 
-    def __init__(self, pvnames, connector=None):
+    def __init__(self, pvnames, connector=None, cache=None):
         """Initialize."""
         self._pvnames = pvnames
         self._connector = connector
+        self._cache = cache
         self._time_start = None
         self._time_stop = None
         self._parallel_query_bin_interval = 12*60*60  # 12h
@@ -308,6 +335,17 @@ class PVDataSet:
         """Check connected."""
         return self.connector and self.connector.connected
 
+    @property
+    def cache(self):
+        """Local data cache, DataCache object or None."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, new_cache):
+        self._cache = new_cache
+        for pvname in self._pvnames:
+            self._pvdata[pvname].cache = self._cache
+
     @property
     def timestamp_start(self):
         """Timestamp start."""
@@ -379,7 +417,12 @@ class PVDataSet:
                 self._parallel_query_bin_interval
 
     def update(self, mean_sec=None, parallel=True):
-        """Update."""
+        """Update.
+
+        If a cache is set, data of time bins aligned to
+        parallel_query_bin_interval are read from the cache, if available,
+        regardless of 'parallel'.
+        """
         self.connect()
         if None in (self.timestamp_start, self.timestamp_stop):
             print('Start and stop timestamps not defined! Aborting.')
@@ -387,17 +430,23 @@ class PVDataSet:
         process_type = 'mean' if mean_sec is not None else ''
 
         interval = self.parallel_query_bin_interval
-        if parallel:
-            timestamp_start, timestamp_stop = _get_time_intervals(
+        if self._cache is not None:
+            data = _get_cached_data(
+                self.connector, self._cache, self._pvnames,
                 self._time_start, self._time_stop, interval,
-                return_isoformat=True)
+                process_type, mean_sec)
         else:
-            timestamp_start = self._time_start.get_iso8601()
-            timestamp_stop = self._time_stop.get_iso8601()
-
-        data = self.connector.getData(
-            self._pvnames, timestamp_start, timestamp_stop,
-            process_type=process_type, interval=mean_sec)
+            if parallel:
+                timestamp_start, timestamp_stop = _get_time_intervals(
+                    self._time_start, self._time_stop, interval,
+                    return_isoformat=True)
+            else:
+                timestamp_start = self._time_start.get_iso8601()
+                timestamp_stop = self._time_stop.get_iso8601()
+
+            data = self.connector.getData(
+                self._pvnames, timestamp_start, timestamp_stop,
+                process_type=process_type, interval=mean_sec)
         if not data:
             return
         for pvname in self._pvnames:
@@ -406,9 +455,72 @@ class PVDataSet:
     def _init_connectors(self):
         pvdata = dict()
         for pvname in self._pvnames:
-            pvdata[pvname] = PVData(pvname, self._connector)
+            pvdata[pvname] = PVData(pvname, self._connector, self._cache)
         return pvdata
 
     def __getitem__(self, pvname):
         """Get item."""
         return self._pvdata[pvname]
+
+
+def _get_cached_data(
+        connector, cache, pvnames, time_start, time_stop, interval,
+        process_type, mean_sec):
+    """Return dict of PV data, retrieving only time bins not in cache.
+
+    Time bins are aligned to multiples of 'interval'. Returns None if any
+    retrieval fails.
+    """
+    tstart, tstop = time_start.timestamp(), time_stop.timestamp()
+    first = _np.floor(tstart / interval) * interval
+    nrbins = max(int(_np.ceil((tstop - first) / interval)), 1)
+    edges = first + interval * _np.arange(nrbins + 1)
+    bins = list(zip(edges[:-1], edges[1:]))
+
+    pvn2keys, pvn2chunks, missing2pvns = dict(), dict(), dict()
+    for pvn in pvnames:
+        keys = [
+            cache.get_key(
+                pvn, bstart, bstop,
+                process_type=process_type, interval=mean_sec)
+            for bstart, bstop in bins]
+        chunks = [
+            cache.get(key) if cache.is_closed(bstop) else None
+            for key, (_, bstop) in zip(keys, bins)]
+        missing = tuple(i for i, chunk in enumerate(chunks) if chunk is None)
+        pvn2keys[pvn], pvn2chunks[pvn] = keys, chunks
+        if missing:
+            missing2pvns.setdefault(missing, list()).append(pvn)
+
+    failed = False
+    for missing, pvns in missing2pvns.items():
+        timestamp_start = [
+            _Time(timestamp=bins[i][0]).get_iso8601() for i in missing]
+        timestamp_stop = [
+            _Time(timestamp=bins[i][1]).get_iso8601() for i in missing]
+        chunks = connector.getDataChunks(
+            pvns, timestamp_start, timestamp_stop,
+            process_type=process_type, interval=mean_sec)
+        for pvn, idx, chunk in chunks:
+            if chunk is None:
+                failed = True
+                continue
+            ibin = missing[idx]
+            pvn2chunks[pvn][ibin] = chunk
+            if cache.is_closed(bins[ibin][1]):
+                cache.put(pvn2keys[pvn][ibin], chunk)
+    if failed:
+        return None
+
+    pvn2data = dict()
+    for pvn, chunks in pvn2chunks.items():
+        data = _concatenate_columns(chunks)
+        if data[0] is not None:
+            # NOTE: keeps last sample before start, as the archiver does.
+            ini = max(_np.searchsorted(data[0], tstart, side='right') - 1, 0)
+            end = _np.searchsorted(data[0], tstop, side='right')
+            data = [col[ini:end] for col in data]
+            if not data[0].size:
+                data = [None, None, None, None]
+        pvn2data[pvn] = data
+    return pvn2data
@@ -1,7 +1,7 @@
 """Configuration Type Module."""
 
 import importlib as _importlib
-import copy as _copy
+import pickle as _pickle
 import numpy as _np
 
 from . import types as _types
@@ -12,8 +12,9 @@ from . import types as _types
 # NOTE: cannot use tuple values in configuration dictionaries since conversion
 #       through json looses track of tuple|list type.
 
-_CONFIG_TYPES_DICT = None
-_CONFIG_TYPES_CHECK = None
+# NOTE: templates of each configuration type are loaded on first use and
+#       stored pickled, since unpickling is much faster than deepcopy.
+_TEMPLATES = dict()  # config_type -> [pickled value, value, check]
 _INT_TYPES = {int}
 _FLOAT_TYPES = {float}
 
@@ -30,40 +31,71 @@ for key, typ in _np.typeDict.items():
 
 def get_config_types():
     """Return list of configuration types."""
-    if _CONFIG_TYPES_DICT is None:
-        _init_CONFIG_TYPES_DICT()
-    return tuple(_CONFIG_TYPES_DICT.keys())
+    return tuple(_types.CONFIG_TYPES)
 
 
-def get_template(config_type):
-    """Return value of a configuration type."""
-    if _CONFIG_TYPES_DICT is None:
-        _init_CONFIG_TYPES_DICT()
-    value = _CONFIG_TYPES_DICT.get(config_type, dict())
-    return _copy.deepcopy(value)
+def get_template(config_type, copy=True):
+    """Return value of a configuration type.
+
+    If copy is False, the template shared by all callers is returned and
+    it must not be modified.
+    """
+    template = _get_template(config_type)
+    if template is None:
+        return dict()
+    data, value, _ = template
+    return _pickle.loads(data) if copy else value
 
 
 def check_value(config_type, value):
     """Check whether values data corresponds to a configuration type."""
-    if _CONFIG_TYPES_DICT is None:
-        _init_CONFIG_TYPES_DICT()
-    ref_value = _CONFIG_TYPES_DICT[config_type]
-    if _CONFIG_TYPES_CHECK[config_type]:
+    template = _get_template(config_type)
+    if template is None:
+        raise KeyError(config_type)
+    _, ref_value, check = template
+    if check:
         return _recursive_check(ref_value, value)
     return True
 
 
-def _init_CONFIG_TYPES_DICT():
-    global _CONFIG_TYPES_DICT, _CONFIG_TYPES_CHECK
-    _CONFIG_TYPES_DICT = dict()
-    _CONFIG_TYPES_CHECK = dict()
-    for ct_name in _types.CONFIG_TYPES:
-        ctm = _importlib.import_module(
-            'siriuspy.clientconfigdb.types.' + ct_name)
+def load_cache(fname):
+    """Load templates from a cache file created with save_cache.
+
+    Configuration type modules of cached templates are not imported.
+    """
+    with open(fname, 'rb') as fil:
+        cache = _pickle.load(fil)
+    for config_type, (data, check) in cache.items():
+        if config_type in _types.CONFIG_TYPES:
+            _TEMPLATES[config_type] = [data, None, check]
+
+
+def save_cache(fname, config_types=None):
+    """Save templates of configuration types to a cache file."""
+    if config_types is None:
+        config_types = get_config_types()
+    cache = dict()
+    for config_type in config_types:
+        data, _, check = _get_template(config_type)
+        cache[config_type] = (data, check)
+    with open(fname, 'wb') as fil:
+        _pickle.dump(cache, fil, protocol=_pickle.HIGHEST_PROTOCOL)
+
+
+def _get_template(config_type):
+    template = _TEMPLATES.get(config_type)
+    if template is None:
+        if config_type not in _types.CONFIG_TYPES:
+            return None
+        ctm = _importlib.import_module(_types.__name__ + '.' + config_type)
         ct = ctm.get_dict()
-        config_type_name = ct['config_type_name']
-        _CONFIG_TYPES_DICT[config_type_name] = ct['value']
-        _CONFIG_TYPES_CHECK[config_type_name] = ct.get('check', True)
+        data = _pickle.dumps(ct['value'], protocol=_pickle.HIGHEST_PROTOCOL)
+        template = [data, ct['value'], ct.get('check', True)]
+        _TEMPLATES[config_type] = template
+    elif template[1] is None:
+        # template loaded from cache file.
+        template[1] = _pickle.loads(template[0])
+    return template
 
 
 # NOTE: It would be better if this method raised an error with a message
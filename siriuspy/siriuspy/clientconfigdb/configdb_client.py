@@ -74,6 +74,16 @@ class ConfigDBClient:
         """Return list of configuration types as defined in templates."""
         return list(_templates.get_config_types())
 
+    @staticmethod
+    def load_templates_cache(fname):
+        """Load templates from a cache file, instead of type modules."""
+        _templates.load_cache(fname)
+
+    @staticmethod
+    def save_templates_cache(fname, config_types=None):
+        """Save templates of configuration types to a cache file."""
+        _templates.save_cache(fname, config_types=config_types)
+
     def find_configs(self,
                      name=None,
                      begin=None,
@@ -160,10 +170,14 @@ class ConfigDBClient:
         return self._make_request(
             config_type=config_type, name=name, discarded=True, method='POST')
 
-    def get_value_from_template(self, config_type=None):
-        """Return value of a configuration type."""
+    def get_value_from_template(self, config_type=None, copy=True):
+        """Return value of a configuration type.
+
+        If copy is False, the template shared by all callers is returned
+        and it must not be modified.
+        """
         config_type = self._process_config_type(config_type)
-        return _templates.get_template(config_type)
+        return _templates.get_template(config_type, copy=copy)
 
     def check_valid_value(self, value, config_type=None):
         """Check whether values data corresponds to a configuration type."""
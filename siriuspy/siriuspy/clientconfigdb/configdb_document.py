@@ -134,9 +134,9 @@ class ConfigDBDocument():
         """."""
         return self._configdbclient.check_valid_value(value)
 
-    def get_value_from_template(self):
+    def get_value_from_template(self, copy=True):
         """."""
-        return self._configdbclient.get_value_from_template()
+        return self._configdbclient.get_value_from_template(copy=copy)
 
     @classmethod
     def generate_config_name(cls, name=None):
@@ -3,11 +3,15 @@
 import time as _time
 import numpy as _np
 from epics import get_pv as _get_pv
+from epics import ca as _ca
 
 from . import ConfigDBDocument as _ConfigDBDocument
 
 
 _TIMEOUT = 0.5
+_CONNECTION_TIMEOUT = 5.0
+_PUT_TIMEOUT = 10.0
+_TINY_TIMEOUT = 1e-3
 
 
 class PVsConfig(_ConfigDBDocument):
@@ -21,14 +25,14 @@ class PVsConfig(_ConfigDBDocument):
 
     def connect(self):
         """Create PVs."""
-        template = self.get_value_from_template()
+        template = self.get_value_from_template(copy=False)
         for pvn, _, _ in template['pvs']:
             self._get_pv(pvn)
 
     @property
     def connected(self):
         """."""
-        template = self.get_value_from_template()
+        template = self.get_value_from_template(copy=False)
         for pvn, _, _ in template['pvs']:
             pvobj = self.PVs.get(pvn)
             if pvobj is None:
@@ -45,26 +49,39 @@ class PVsConfig(_ConfigDBDocument):
         pvsdict = {item[0]: item[1] for item in pvslist}
         return pvsdict
 
-    def read(self, timeout=_TIMEOUT):
-        """Read machine state."""
-        new_config_value = dict()
-        new_config_value['pvs'] = list()
+    def read(self, timeout=_TIMEOUT,
+             connection_timeout=_CONNECTION_TIMEOUT):
+        """Read machine state.
 
-        template = self.get_value_from_template()
+        All PVs are read at once, so the reading time is bounded by the
+        slowest IOC. 'connection_timeout' and 'timeout' bound the time
+        to wait for all connections and for all values, respectively.
+        """
+        template = self.get_value_from_template(copy=False)
+        pvnames = [pvn for pvn, _, _ in template['pvs']]
 
         # connect
         self.connect()
+        connected = self._wait_for_connection(pvnames, connection_timeout)
 
         # read
-        pvs_not_read = set()
+        pvs_not_read = {pvn for pvn in pvnames if pvn not in connected}
+        pvnames_get = [
+            pvn for pvn in pvnames
+            if pvn in connected and not pvn.endswith('-Cmd')]
+        values = dict(zip(pvnames_get, self._get_values(pvnames_get, timeout)))
+        new_config_value = dict()
+        new_config_value['pvs'] = list()
         for pvn, defval, delay in template['pvs']:
-            pvobj = self._get_pv(pvn)
-            if pvobj.wait_for_connection(timeout):
-                value = defval if pvn.endswith('-Cmd')\
-                    else pvobj.get(timeout=timeout)
-            else:
-                pvs_not_read.add(pvn)
+            if pvn not in connected:
                 value = 0
+            elif pvn.endswith('-Cmd'):
+                value = defval
+            else:
+                value = values[pvn]
+                if value is None:
+                    pvs_not_read.add(pvn)
+                    value = 0
             new_config_value['pvs'].append([pvn, value, delay])
 
         if pvs_not_read:
@@ -81,32 +98,42 @@ class PVsConfig(_ConfigDBDocument):
         self.save(new_name)
         return True, []
 
-    def apply(self, timeout=_TIMEOUT):
-        """Apply current config value to machine and check if implemented."""
+    def apply(self, timeout=_TIMEOUT,
+              connection_timeout=_CONNECTION_TIMEOUT,
+              put_timeout=_PUT_TIMEOUT):
+        """Apply current config value to machine and check if implemented.
+
+        PVs are set in stages: each PV with a non-null delay closes a stage,
+        whose PVs are set at once. The next stage is set only after all
+        puts of the previous one are completed and its delay has elapsed.
+        """
+        pvnames = [pvn for pvn, _, _ in self._value['pvs']]
+
         # connect
         self.connect()
+        connected = self._wait_for_connection(pvnames, connection_timeout)
 
-        pvs_not_set = set()
+        pvs_not_set = {pvn for pvn in pvnames if pvn not in connected}
 
         # set
+        stage = list()
         for pvn, value, delay in self._value['pvs']:
-            pvobj = self._get_pv(pvn)
-            try:
-                pvobj.put(value)
+            if pvn in connected:
+                stage.append((pvn, value))
+            if delay:
+                pvs_not_set.update(self._put_values(stage, put_timeout))
                 _time.sleep(delay)
-            except TypeError:
-                pvs_not_set.add(pvn)
-
-        # wait
-        _time.sleep(2.0)
+                stage = list()
+        pvs_not_set.update(self._put_values(stage, put_timeout))
 
         # check
-        for pvn, value, delay in self._value['pvs']:
-            if pvn in pvs_not_set:
-                continue
-            equal = self._check_pv(pvn, value, timeout=timeout)
-            if not equal:
-                pvs_not_set.add(pvn)
+        pvnames_check = [pvn for pvn in pvnames if pvn not in pvs_not_set]
+        values_check = [
+            value for pvn, value, _ in self._value['pvs']
+            if pvn not in pvs_not_set]
+        equal = self._check_values(pvnames_check, values_check, timeout)
+        pvs_not_set.update(
+            pvn for pvn, eql in zip(pvnames_check, equal) if not eql)
 
         if pvs_not_set:
             return False, pvs_not_set
@@ -130,24 +157,84 @@ class PVsConfig(_ConfigDBDocument):
             self.PVs[pvname] = pvobj
         return pvobj
 
-    def _check_pv(self, pvname, value, timeout=_TIMEOUT,
-                  rel_tol=1e-06, abs_tol=0.0):
-        """Check PV value."""
-        pvobj = self._get_pv(pvname)
-        pvobj.wait_for_connection(timeout)
-        curr_val = pvobj.get(timeout=timeout)
-        if curr_val is None:
-            return False
-        elif isinstance(curr_val, (_np.ndarray, list, tuple)) or \
-                isinstance(value, (_np.ndarray, list, tuple)):
+    def _wait_for_connection(self, pvnames, timeout):
+        """Wait for connection of all PVs and return connected ones."""
+        pvobjs = {pvn: self._get_pv(pvn) for pvn in pvnames}
+        tini = _time.time()
+        while True:
+            connected = {pvn for pvn, pvo in pvobjs.items() if pvo.connected}
+            if len(connected) == len(pvobjs) or \
+                    _time.time() - tini > timeout:
+                return connected
+            _ca.poll()
+
+    def _get_values(self, pvnames, timeout):
+        """Return values of connected PVs, None for the ones not read.
+
+        Gets of all PVs are requested before waiting for any of them.
+        """
+        chids = [self._get_pv(pvn).chid for pvn in pvnames]
+        for chid in chids:
+            _ca.get(chid, wait=False)
+        _ca.poll()
+        tfin = _time.time() + timeout
+        values = list()
+        for chid in chids:
+            values.append(_ca.get_complete(
+                chid, timeout=max(tfin - _time.time(), _TINY_TIMEOUT)))
+        return values
+
+    def _put_values(self, pvs_values, timeout):
+        """Put values of connected PVs and wait for all puts to complete.
+
+        Return set of PVs not set.
+        """
+        pending, pvs_not_set = set(), set()
+        for pvn, value in pvs_values:
+            # NOTE: put callbacks may run before put returns.
+            pending.add(pvn)
             try:
-                if len(curr_val) != len(value):
-                    return False
+                self._get_pv(pvn).put(
+                    value, callback=lambda data, **_: pending.discard(data),
+                    callback_data=pvn)
             except TypeError:
-                return False  # one of them is not an array
-            return _np.allclose(curr_val, value, rtol=rel_tol, atol=abs_tol)
-        elif isinstance(curr_val, float) or isinstance(value, float):
-            return _np.isclose(curr_val, value, rtol=rel_tol, atol=abs_tol)
-        elif curr_val == value:
-            return True
-        return False
+                pending.discard(pvn)
+                pvs_not_set.add(pvn)
+        tini = _time.time()
+        while pending and _time.time() - tini < timeout:
+            _ca.poll()
+        return pvs_not_set | pending
+
+    def _check_values(self, pvnames, values, timeout,
+                      rel_tol=1e-06, abs_tol=0.0):
+        """Return list with the result of the check of each PV value."""
+        curr_vals = self._get_values(pvnames, timeout)
+        equal = [False] * len(pvnames)
+
+        # NOTE: scalars are compared at once, arrays one by one.
+        idcs_flt, curr_flt, vals_flt = list(), list(), list()
+        for idx, (curr_val, value) in enumerate(zip(curr_vals, values)):
+            if curr_val is None:
+                continue
+            elif isinstance(curr_val, (_np.ndarray, list, tuple)) or \
+                    isinstance(value, (_np.ndarray, list, tuple)):
+                try:
+                    if len(curr_val) != len(value):
+                        continue
+                except TypeError:
+                    continue  # one of them is not an array
+                equal[idx] = _np.allclose(
+                    curr_val, value, rtol=rel_tol, atol=abs_tol)
+            elif isinstance(curr_val, float) or isinstance(value, float):
+                idcs_flt.append(idx)
+                curr_flt.append(curr_val)
+                vals_flt.append(value)
+            else:
+                equal[idx] = curr_val == value
+        if idcs_flt:
+            isclose = _np.isclose(
+                _np.array(curr_flt, dtype=float),
+                _np.array(vals_flt, dtype=float), rtol=rel_tol, atol=abs_tol)
+            for idx, eql in zip(idcs_flt, isclose):
+                equal[idx] = bool(eql)
+        return equal
@@ -1,10 +1,22 @@
-"""Types subpackage."""
+"""Types subpackage.
 
+Configuration type modules are imported only when first accessed.
+"""
+
+import importlib as _importlib
 import pkgutil as _pkgutil
 
-CONFIG_TYPES = []
+CONFIG_TYPES = [
+    module_name for _, module_name, _ in _pkgutil.iter_modules(__path__)]
+
+
+def __getattr__(name):
+    """Import configuration type module on first access.
 
-for loader, module_name, is_pkg in _pkgutil.walk_packages(__path__):
-    CONFIG_TYPES.append(module_name)
-    module = loader.find_module(module_name).load_module(module_name)
-    exec('%s = module' % module_name)
+    Only used in python 3.7+, in previous versions configuration type
+    modules have to be imported explicitly.
+    """
+    if name in CONFIG_TYPES:
+        return _importlib.import_module('.' + name, __name__)
+    raise AttributeError(
+        "module '{}' has no attribute '{}'".format(__name__, name))
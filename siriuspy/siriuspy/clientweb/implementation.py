@@ -1,5 +1,10 @@
 """Implementation of web server data retrieval functions."""
+import os as _os
 import re as _re
+import time as _time
+import pickle as _pickle
+import hashlib as _hashlib
+import urllib.error as _urllib_error
 import urllib.request as _urllib_request
 
 from .. import envars as _envars
@@ -15,26 +20,23 @@ _DIAG_FOLDER = '/diagnostics/'
 _TIMESYS_FOLDER = '/timesys/'
 _MAC_SCHEDULE_FOLDER = '/macschedule/'
 
+_BUNDLE_VERSION = 1
 
-def read_url(url, timeout=_TIMEOUT):
-    """Read URL from server."""
+# bundle in use, with texts and ETags of URLs
+_BUNDLE = None
 
-    # build list with servers
-    urls = [_envars.SRVURL_CSCONSTS + url, _envars.SRVURL_CSCONSTS_2 + url]
-    connected = False
-    for url_ in urls:
-        try:
-            # try a new server
-            response = _urllib_request.urlopen(url_, timeout=timeout)
-            data = response.read()
-            text = data.decode('utf-8')
-            connected = True
-            break
-        except Exception:
-            # could not connect with current server
-            print('Error reading url "' + url_ + '"!')
-    if not connected:
-        raise Exception('Error reading web servers!')
+
+def read_url(url, timeout=_TIMEOUT):
+    """Read URL from server.
+
+    If a bundle is in use, URLs in it are read from the bundle and new
+    ones are added to it.
+    """
+    if bundle_has(url):
+        return _BUNDLE['texts'][url][0]
+    text, etag = _read_servers(url, timeout=timeout)
+    if _BUNDLE is not None:
+        _bundle_add(url, text, etag)
     return text
 
 
@@ -47,6 +49,83 @@ def server_online():
         return False
 
 
+def bundle_create():
+    """Start using an empty bundle, where data read from servers is stored.
+
+    The bundle can be saved with bundle_save after reading all data
+    needed, so that it can be loaded with bundle_load when servers are not
+    available or to avoid reading each URL from servers.
+    """
+    global _BUNDLE
+    _BUNDLE = {'texts': dict(), 'loaded': False}
+
+
+def bundle_has(url):
+    """Return whether the bundle in use holds URL."""
+    return _BUNDLE is not None and url in _BUNDLE['texts']
+
+
+def bundle_clear():
+    """Stop using a bundle."""
+    global _BUNDLE
+    _BUNDLE = None
+
+
+def bundle_save(fname):
+    """Save bundle in use to file."""
+    if _BUNDLE is None:
+        raise ValueError('There is no bundle in use!')
+    bundle = {
+        'version': _BUNDLE_VERSION,
+        'created': _time.time(),
+        'texts': {
+            url: (text, etag, _hashlib.sha1(text.encode()).hexdigest())
+            for url, (text, etag) in _BUNDLE['texts'].items()},
+        }
+    fname_tmp = fname + '.tmp'
+    with open(fname_tmp, 'wb') as fil:
+        _pickle.dump(bundle, fil, protocol=_pickle.HIGHEST_PROTOCOL)
+    _os.replace(fname_tmp, fname)
+
+
+def bundle_load(fname):
+    """Start using a bundle saved to file.
+
+    Entries whose checksums do not match their texts are discarded.
+    """
+    global _BUNDLE
+    with open(fname, 'rb') as fil:
+        bundle = _pickle.load(fil)
+    if bundle.get('version') != _BUNDLE_VERSION:
+        raise ValueError(
+            'Invalid bundle version {}!'.format(bundle.get('version')))
+    texts = dict()
+    for url, (text, etag, checksum) in bundle['texts'].items():
+        if _hashlib.sha1(text.encode()).hexdigest() == checksum:
+            texts[url] = (text, etag)
+    _BUNDLE = {'texts': texts, 'loaded': True}
+
+
+def bundle_refresh(timeout=_TIMEOUT):
+    """Refresh texts of bundle in use whose server ETags have changed.
+
+    Texts of URLs that could not be read from servers are kept. Return
+    list of refreshed URLs.
+    """
+    if _BUNDLE is None:
+        raise ValueError('There is no bundle in use!')
+    refreshed = list()
+    for url, (_, etag) in list(_BUNDLE['texts'].items()):
+        try:
+            text, etag = _read_servers(url, timeout=timeout, etag=etag)
+        except Exception:
+            continue
+        if text is not None:
+            _bundle_add(url, text, etag)
+            refreshed.append(url)
+    return refreshed
+
+
 def magnets_model_data(timeout=_TIMEOUT):
     """Return the text of the retrieved magnet model data."""
     url = _MAGNET_FOLDER + 'magnets-model-data.txt'
@@ -178,3 +257,37 @@ def mac_schedule_read(year, timeout=_TIMEOUT):
     """Read machine schedule data."""
     url = _MAC_SCHEDULE_FOLDER + str(year) + '.txt'
     return read_url(url, timeout=timeout)
+
+
+# --- private functions ---
+
+def _read_servers(url, timeout=_TIMEOUT, etag=None):
+    """Read URL from servers, trying each one in turn.
+
+    Return text and ETag of response. If etag is given and it did not
+    change, text is None.
+    """
+    # build list with servers
+    urls = [_envars.SRVURL_CSCONSTS + url, _envars.SRVURL_CSCONSTS_2 + url]
+    for url_ in urls:
+        request = _urllib_request.Request(url_)
+        if etag:
+            request.add_header('If-None-Match', etag)
+        try:
+            # try a new server
+            response = _urllib_request.urlopen(request, timeout=timeout)
+            data = response.read()
+            text = data.decode('utf-8')
+            return text, response.headers.get('ETag')
+        except _urllib_error.HTTPError as err:
+            if etag and err.code == 304:
+                return None, etag
+            print('Error reading url "' + url_ + '"!')
+        except Exception:
+            # could not connect with current server
+            print('Error reading url "' + url_ + '"!')
+    raise Exception('Error reading web servers!')
+
+
+def _bundle_add(url, text, etag):
+    _BUNDLE['texts'][url] = (text, etag)
@@ -7,6 +7,7 @@ from epics import PV as _PV
 
 from ...callbacks import Callback as _Callback
 from ...epics import SiriusPVTimeSerie as _SiriusPVTimeSerie
+from ...epics.pv_time_serie import _SerieBuffer
 from ...envars import VACA_PREFIX as _vaca_prefix
 from ..csdev import \
     Const as _Const, get_lifetime_database as _get_database
@@ -16,6 +17,213 @@ warnings.filterwarnings('error')
 _MAX_BUFFER_SIZE = 36000
 
 
+class _RunningFit:
+    """Least squares fits of lines to a sliding window of samples.
+
+    The window is kept as start and end indices into arrays of samples,
+    which are views of the buffer of acquired samples, so samples are not
+    copied. Running sums over the slices of samples entering and leaving
+    the window are kept with compensated summation, so each sample costs
+    O(1). Times are taken relative to an origin, moved to the first sample
+    of the window when it gets farther than the window length. Sums of the
+    logarithm of values minus an offset, for exponential fits, are kept as
+    well.
+
+    Samples closer than a minimum interval are skipped, and the kept ones
+    are stored in a buffer of their own. The first sample after a reset is
+    always kept, and each following one is kept if it is more than the
+    minimum interval apart from the last kept sample.
+    """
+
+    # sums of 1, x, x*x, y, x*y, log(y), x*log(y) and of invalid logs.
+    _NR_SUMS = 8
+
+    def __init__(self):
+        """Init."""
+        self._timestamps = _np.array([])
+        self._values = _np.array([])
+        self._beg = 0
+        self._end = 0
+        self._kept = None
+        self._sums = _np.zeros(self._NR_SUMS)
+        self._comps = _np.zeros(self._NR_SUMS)
+        self._origin = 0.0
+        self._offset = 0.0
+        self._first = None
+        self._last = None
+        self._min_intvl = 0.0
+
+    @property
+    def timestamps(self):
+        """Return timestamps of samples in the window."""
+        return self._timestamps[self._beg:self._end]
+
+    @property
+    def values(self):
+        """Return values of samples in the window."""
+        return self._values[self._beg:self._end]
+
+    def __len__(self):
+        """Return number of samples in the window."""
+        return self._end - self._beg
+
+    def reset(self):
+        """Remove all samples."""
+        self._timestamps = _np.array([])
+        self._values = _np.array([])
+        self._beg = self._end = 0
+        self._kept = None
+        self._clear_sums()
+        self._first = self._last = None
+
+    def update(self, timestamps, values, first, last, min_intvl=0.0):
+        """Update window with samples of sorted timestamps in [first, last].
+
+        Samples are only added or removed when the window moves forward,
+        otherwise the window is rebuilt. Samples of the window must not
+        change between updates.
+        """
+        if timestamps.size:
+            first = max(first, timestamps[0])
+        if self._first is None or min_intvl != self._min_intvl or \
+                first < self._first or last < self._last:
+            self.reset()
+            self._min_intvl = min_intvl
+            if min_intvl > 0:
+                self._kept = _SerieBuffer()
+        else:
+            self._remove_before(first)
+        self._first, self._last = first, last
+        if self._kept is not None:
+            timestamps, values = self._keep(timestamps, values)
+        self._append(timestamps, values)
+
+    def get_lifetime(self, timestamp, offset=0.0, fit='exp'):
+        """Return lifetime of fitted samples minus offset.
+
+        Linear fits are extrapolated up to 'timestamp'. Returns 0 if the
+        fit is not possible.
+        """
+        if offset != self._offset:
+            self._offset = offset
+            self._rebuild()
+        nrs, sumx, sumxx, sumy, sumxy, sumly, sumxly, nr_invalid = \
+            self._sums + self._comps
+        if fit == 'exp':
+            if nr_invalid:
+                return 0.0
+            sumy, sumxy = sumly, sumxly
+        denom = nrs*sumxx - sumx*sumx
+        if not denom:
+            return 0.0
+        fit_a = (sumxx*sumy - sumxy*sumx)/denom
+        fit_b = (nrs*sumxy - sumx*sumy)/denom
+        if not fit_b:
+            return 0.0
+        if fit == 'exp':
+            return -1/fit_b
+        fit_a += fit_b*(timestamp - self._origin) - offset
+        return -fit_a/fit_b
+
+    @staticmethod
+    def decimate(timestamps, min_intvl, last_kept=None):
+        """Return indices of samples more than 'min_intvl' apart.
+
+        The first sample is kept, unless it is closer to 'last_kept'.
+        Only one binary search is done for each kept sample.
+        """
+        idx = 0
+        if last_kept is not None:
+            idx = _np.searchsorted(
+                timestamps, last_kept + min_intvl, side='right')
+        indices = []
+        while idx < timestamps.size:
+            indices.append(idx)
+            idx = _np.searchsorted(
+                timestamps, timestamps[idx] + min_intvl, side='right')
+        return _np.array(indices, dtype=int)
+
+    def _remove_before(self, timestamp):
+        nr_removed = _np.searchsorted(self.timestamps, timestamp, side='left')
+        if not nr_removed:
+            return
+        removed = slice(self._beg, self._beg + nr_removed)
+        self._beg += nr_removed
+        if self._beg == self._end:
+            self._clear_sums()
+        elif self._timestamps[self._beg] - self._origin > \
+                self._timestamps[self._end-1] - self._timestamps[self._beg]:
+            # NOTE: rebuilding is O(N), but only happens after about N
+            # samples leave the window.
+            self._rebuild()
+        else:
+            self._add_sums(-self._calc_sums(
+                self._timestamps[removed], self._values[removed]))
+
+    def _keep(self, timestamps, values):
+        """Store samples not closer than minimum interval, return views."""
+        last_kept = self._kept.last_timestamp
+        ini = _np.searchsorted(timestamps, self._first, side='left')
+        if last_kept is not None:
+            ini = max(ini, _np.searchsorted(
+                timestamps, last_kept, side='right'))
+        end = _np.searchsorted(timestamps, self._last, side='right')
+        timestamps, values = timestamps[ini:end], values[ini:end]
+        indices = self.decimate(timestamps, self._min_intvl, last_kept)
+        self._kept.extend(timestamps[indices], values[indices])
+        # samples before the window are not needed anymore.
+        self._kept.trim(_np.nextafter(self._first, -_np.inf))
+        return self._kept.get_views()
+
+    def _append(self, timestamps, values):
+        """Move window to arrays, adding samples after its last one."""
+        if not timestamps.size:
+            return
+        beg = _np.searchsorted(timestamps, self._first, side='left')
+        ini = beg
+        if len(self):
+            ini = max(ini, _np.searchsorted(
+                timestamps, self._timestamps[self._end-1], side='right'))
+        end = max(_np.searchsorted(timestamps, self._last, side='right'), ini)
+        if ini < end and not len(self):
+            self._origin = timestamps[ini]
+        self._timestamps, self._values = timestamps, values
+        self._beg, self._end = beg, end
+        if ini < end:
+            self._add_sums(self._calc_sums(
+                timestamps[ini:end], values[ini:end]))
+
+    def _clear_sums(self):
+        self._sums[:] = 0.0
+        self._comps[:] = 0.0
+
+    def _rebuild(self):
+        self._clear_sums()
+        if len(self):
+            self._origin = self._timestamps[self._beg]
+            self._add_sums(self._calc_sums(self.timestamps, self.values))
+
+    def _calc_sums(self, timestamps, values):
+        posx = timestamps - self._origin
+        values = _np.asarray(values, dtype=float)
+        shifted = values - self._offset
+        valid = shifted > 0
+        logy = _np.log(shifted, out=_np.zeros(values.shape), where=valid)
+        return _np.array([
+            values.size, _np.sum(posx), _np.dot(posx, posx),
+            _np.sum(values), _np.dot(posx, values),
+            _np.sum(logy), _np.dot(posx, logy),
+            values.size - _np.count_nonzero(valid)])
+
+    def _add_sums(self, terms):
+        # NOTE: Neumaier compensated summation.
+        sums = self._sums + terms
+        bigger = _np.abs(self._sums) >= _np.abs(terms)
+        self._comps += _np.where(
+            bigger, (self._sums - sums) + terms, (terms - sums) + self._sums)
+        self._sums = sums
+
+
 class SILifetimeApp(_Callback):
     """Main Class of the IOC Logic."""
 
@@ -45,6 +253,8 @@ class SILifetimeApp(_Callback):
         self._is_stored = 0
         self._lifetime = 0
         self._lifetime_bpm = 0
+        self._fit = _RunningFit()
+        self._fit_bpm = _RunningFit()
 
         self._current_pv = _PV(
             _vaca_prefix+'SI-Glob:AP-CurrInfo:Current-Mon',
@@ -106,10 +316,14 @@ class SILifetimeApp(_Callback):
             intvl_smpl = getattr(self, intvl_name)
 
             # calculate lifetime
-            ts_abs_dqorg, val_dqorg = buffer_dt.get_serie(time_absolute=True)
-            ts_dqorg = ts_abs_dqorg - now
-            ts_dq, val_dq, ts_abs_dq = self._filter_buffer(
-                ts_dqorg, val_dqorg, ts_abs_dqorg, first_smpl, last_smpl)
+            ts_abs_dqorg, val_dqorg = buffer_dt.get_serie(
+                time_absolute=True, copy=False)
+            fit = self._fit_bpm if is_bpm else self._fit
+            fit.update(
+                ts_abs_dqorg, val_dqorg, first_smpl, last_smpl,
+                self._min_intvl_btw_spl)
+            ts_abs_dq, val_dq = fit.timestamps, fit.values
+            ts_dq = ts_abs_dq - now
 
             if ts_dq.size == 0:
                 setattr(self, lt_name, 0)
@@ -123,12 +337,14 @@ class SILifetimeApp(_Callback):
                 self.run_callbacks(
                     'SplIntvl'+lt_type+'-Mon', getattr(self, intvl_name))
 
-                val_dq -= self._current_offset
+                val_dq = val_dq - self._current_offset
 
                 # check min number of points in buffer
                 if len(val_dq) > 100:
-                    fit = 'lin' if self._mode == _Const.Fit.Linear else 'exp'
-                    value = self._least_squares_fit(ts_dq, val_dq, fit=fit)
+                    fit_type = \
+                        'lin' if self._mode == _Const.Fit.Linear else 'exp'
+                    value = fit.get_lifetime(
+                        now, self._current_offset, fit=fit_type)
                 else:
                     value = 0
                 setattr(self, lt_name, value)
@@ -256,67 +472,6 @@ class SILifetimeApp(_Callback):
         self.run_callbacks('Lifetime-Mon', self._lifetime)
         self.run_callbacks('LifetimeBPM-Mon', self._lifetime_bpm)
 
-    def _filter_buffer(self, timestamp, value, abs_timestamp, first, last):
-        ts_arrayorg = _np.asarray(timestamp)
-        val_arrayorg = _np.asarray(value)
-        ts_abs_arrayorg = _np.asarray(abs_timestamp)
-        if ts_abs_arrayorg.size == 0:
-            return ts_arrayorg, val_arrayorg, ts_abs_arrayorg
-
-        ind1 = ts_abs_arrayorg >= first
-        ind2 = ts_abs_arrayorg <= last
-        indices = _np.logical_and(ind1, ind2).nonzero()
-        if not indices[0].size:
-            return _np.array([]), _np.array([]), _np.array([])
-        slc = slice(indices[0][0], indices[0][-1]+1)
-
-        ts_aux_array = ts_arrayorg[slc]
-        val_aux_array = val_arrayorg[slc]
-        ts_aux_abs_array = ts_abs_arrayorg[slc]
-
-        min_intvl = self._min_intvl_btw_spl
-        if min_intvl <= 0.0:
-            return ts_aux_array, val_aux_array, ts_aux_abs_array
-
-        indices = _np.zeros(len(ts_aux_array), dtype=bool)
-        indices[0] = _np.True_
-        last_idx = 0
-        for i, _ in enumerate(ts_aux_array):
-            if abs(ts_aux_array[last_idx] - ts_aux_array[i]) > min_intvl:
-                indices[i] = _np.True_
-                last_idx = i
-
-        indices = indices.nonzero()
-        ts_array = ts_aux_array[indices]
-        val_array = val_aux_array[indices]
-        ts_abs_array = ts_aux_abs_array[indices]
-        return ts_array, val_array, ts_abs_array
-
-    @staticmethod
-    def _least_squares_fit(timestamp, value, fit='exp'):
-        if fit == 'exp':
-            try:
-                value = _np.log(value)
-            except Exception:
-                return 0.0
-        _ns = len(timestamp)
-        _x1 = _np.sum(timestamp)
-        _y1 = _np.sum(value)
-        if timestamp.size > 10000:
-            _x2 = _np.sum(timestamp*timestamp)
-            _xy = _np.sum(timestamp*value)
-        else:
-            _x2 = _np.dot(timestamp, timestamp)
-            _xy = _np.dot(timestamp, value)
-        fit_a = (_x2*_y1 - _xy*_x1)/(_ns*_x2 - _x1*_x1)
-        fit_b = (_ns*_xy - _x1*_y1)/(_ns*_x2 - _x1*_x1)
-
-        if fit == 'exp':
-            lifetime = - 1/fit_b
-        else:
-            lifetime = - fit_a/fit_b
-        return lifetime
-
     def _update_times(self, now, force_min_first=False):
         if self._last_ts_set == 'first':
             value = self._frst_smpl_ts
@@ -1,6 +1,9 @@
 """."""
 
 import time as _time
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from functools import partial as _partial
+from threading import Condition as _Condition
 
 import numpy as _np
 
@@ -23,6 +26,19 @@ class BunchbyBunch(_Devices):
         'L': 'SI-Glob:DI-BbBProc-L'}
     DEVICES = _get_namedtuple('Devices', *zip(*_devices.items()))
 
+    # NOTE: default monitor type of each sweep, with the monitored property
+    #       of this type and the one of other types.
+    _SWEEP_MONITORS = {
+        'phase_shifter': ('mean', 'MEAN', 'PEAK1'),
+        'adc_delay': ('mean', 'MEAN', 'PEAK1'),
+        'backend_phase': ('peak', 'PEAK1', 'RMS'),
+        'dac_delay': ('peak', 'PEAK1', 'RMS'),
+        'feedback_phase': ('peak', 'PEAK1', 'RMS'),
+        'rf_phase': ('mean', 'MEAN', 'PEAK1'),
+        }
+    _SWEEP_MONITOR_LABELS = {
+        'MEAN': 'SRAM Mean', 'RMS': 'SRAM RMS', 'PEAK1': 'Peak Magnitude'}
+
     def __init__(self, devname):
         """."""
         devname = BunchbyBunch.process_device_name(devname)
@@ -67,133 +83,209 @@ class BunchbyBunch(_Devices):
             raise NotImplementedError(devname)
         return _PVName(devname)
 
-    def sweep_phase_shifter(self, values, wait=2, mon_type='mean'):
+    def sweep_phase_shifter(
+            self, values, wait=2, mon_type='mean', callback=None):
         """Sweep Servo Phase for each `value` in `values`."""
-        mon_values = []
-        ctrl, mon = 'FBE Out Phase', 'SRAM Mean'
-        print(f'Idx: {ctrl:15s} {mon:15s}')
+        return self._sweep(
+            'phase_shifter', values, wait, mon_type, callback)
 
-        if self.devname.endswith('L'):
-            propty = 'FBELT_SERVO_SETPT'
-        elif self.devname.endswith('H'):
-            propty = 'FBELT_X_PHASE_SETPT'
-        else:
-            propty = 'FBELT_Y_PHASE_SETPT'
-
-        init_val = self.fbe[propty]
-        for i, val in enumerate(values):
-            self.fbe[propty] = val
-            self.fbe._wait(propty, val)
-            _time.sleep(wait)
-            if mon_type.lower() in 'mean':
-                mon_val = self.sram.data_mean
-            else:
-                mon_val = self.sram.spec_marker1_mag
-            mon_values.append(mon_val)
-            print(f'{i:03d}: {val:15.6f} {_np.mean(mon_val):15.6f}')
-        self.fbe[propty] = init_val
-        return _np.array(mon_values)
-
-    def sweep_adc_delay(self, values, wait=2, mon_type='mean'):
+    def sweep_adc_delay(self, values, wait=2, mon_type='mean', callback=None):
         """Sweep ADC Delay for each `value` in `values`."""
-        mon_values = []
-        ctrl, mon = 'ADC Delay', 'SRAM Mean'
-        print(f'Idx: {ctrl:15s} {mon:15s}')
-
-        init_val = self.timing.adc_delay
-        for i, val in enumerate(values):
-            self.timing.adc_delay = val
-            self.timing._wait('TADC', val)
-            _time.sleep(wait)
-            if mon_type.lower() in 'mean':
-                mon_val = self.sram.data_mean
-            else:
-                mon_val = self.sram.spec_marker1_mag
-            mon_values.append(mon_val)
-            print(f'{i:03d}: {val:15.6f} {_np.mean(mon_val):15.6f}')
-        self.timing.adc_delay = init_val
-        return _np.array(mon_values)
-
-    def sweep_backend_phase(self, values, wait=2, mon_type='peak'):
+        return self._sweep('adc_delay', values, wait, mon_type, callback)
+
+    def sweep_backend_phase(
+            self, values, wait=2, mon_type='peak', callback=None):
         """Sweep Backend Phase for each `value` in `values`."""
-        mon_values = []
-        ctrl, mon = 'Backend Phase', 'Peak magnitude'
-        print(f'Idx: {ctrl:15s} {mon:15s}')
-
-        init_val = self.fbe.be_phase
-        for i, val in enumerate(values):
-            self.fbe.be_phase = val
-            self.fbe._wait('FBE_BE_PHASE', val)
-            _time.sleep(wait)
-            if mon_type.lower() in 'peak':
-                mon_val = self.sram.spec_marker1_mag
-            else:
-                mon_val = self.sram.data_rms
-            mon_values.append(mon_val)
-            print(f'{i:03d}: {val:15.6f} {_np.mean(mon_val):15.6f}')
-        self.fbe.be_phase = init_val
-        return _np.array(mon_values)
-
-    def sweep_dac_delay(self, values, wait=2, mon_type='peak'):
+        return self._sweep(
+            'backend_phase', values, wait, mon_type, callback)
+
+    def sweep_dac_delay(self, values, wait=2, mon_type='peak', callback=None):
         """Sweep DAC Delay for each `value` in `values`."""
-        mon_values = []
-        ctrl, mon = 'DAC Delay', 'Peak Magnitude'
-        print(f'Idx: {ctrl:15s} {mon:15s}')
-
-        init_val = self.timing.dac_delay
-        for i, val in enumerate(values):
-            self.timing.dac_delay = val
-            self.timing._wait('TDAC', val)
-            _time.sleep(wait)
-            if mon_type.lower() in 'peak':
-                mon_val = self.sram.spec_marker1_mag
-            else:
-                mon_val = self.sram.data_rms
-            mon_values.append(mon_val)
-            print(f'{i:03d}: {val:15.6f} {_np.mean(mon_val):15.6f}')
-        self.timing.dac_delay = init_val
-        return _np.array(mon_values)
-
-    def sweep_feedback_phase(self, values, wait=2, mon_type='peak'):
+        return self._sweep('dac_delay', values, wait, mon_type, callback)
+
+    def sweep_feedback_phase(
+            self, values, wait=2, mon_type='peak', callback=None):
         """Sweep Feedback Phase for each `value` in `values`."""
-        mon_values = []
-        ctrl, mon = 'Coeff. Phase', 'Peak Magnitude'
-        print(f'Idx: {ctrl:15s} {mon:15s}')
-
-        init_val = self.coeffs.edit_phase
-        for i, val in enumerate(values):
-            self.coeffs.edit_phase = val
-            self.coeffs.cmd_edit_apply()
-            _time.sleep(wait)
-            if mon_type.lower() in 'peak':
-                mon_val = self.sram.spec_marker1_mag
-            else:
-                mon_val = self.sram.data_rms
-            mon_values.append(mon_val)
-            print(f'{i:03d}: {val:15.6f} {_np.mean(mon_val):15.6f}')
-        self.coeffs.edit_phase = init_val
-        self.coeffs.cmd_edit_apply()
-        return _np.array(mon_values)
-
-    def sweep_rf_phase(self, values, wait=2, mon_type='mean'):
+        return self._sweep(
+            'feedback_phase', values, wait, mon_type, callback)
+
+    def sweep_rf_phase(self, values, wait=2, mon_type='mean', callback=None):
         """Sweep RF Phase for each `value` in `values`."""
-        mon_values = []
-        ctrl, mon = 'RF Phase', 'SRAM Mean'
-        print(f'Idx: {ctrl:15s} {mon:15s}')
-
-        llrf = self.rfcav.dev_llrf
-        init_val = llrf.phase
-        for i, val in enumerate(values):
-            self.rfcav.set_phase(val)
-            _time.sleep(wait)
-            if mon_type.lower() in 'mean':
-                mon_val = self.sram.data_mean
-            else:
-                mon_val = self.sram.spec_marker1_mag
-            mon_values.append(mon_val)
-            print(f'{i:03d}: {val:15.6f} {_np.mean(mon_val):15.6f}')
-        llrf.value = init_val
-        return _np.array(mon_values)
+        return self._sweep('rf_phase', values, wait, mon_type, callback)
+
+    @staticmethod
+    def sweep_planes(
+            bbbs, sweep, values, wait=2, mon_type=None, callback=None):
+        """Run sweeps of BunchbyBunch devices of different planes together.
+
+        sweep is the name of a sweep method without the 'sweep_' prefix,
+        as 'adc_delay'. The RF phase is common to all planes, so it is
+        swept only once. After each step callback(devname, index, value,
+        data) is called. Returns dict with sweep data of each device name.
+        """
+        if callback is None:
+            callback = BunchbyBunch._print_sweep_step
+        if sweep == 'rf_phase':
+            return bbbs[0]._sweep_devices(
+                bbbs, sweep, values, wait, mon_type, callback)
+
+        with _ThreadPoolExecutor(max_workers=len(bbbs)) as executor:
+            futures = [
+                executor.submit(
+                    bbb._sweep_devices, (bbb, ), sweep, values, wait,
+                    mon_type, callback)
+                for bbb in bbbs]
+            data = dict()
+            for future in futures:
+                data.update(future.result())
+        return data
+
+    # --- private methods ---
+
+    def _sweep(self, sweep, values, wait, mon_type, callback):
+        if callback is None:
+            ctrl = self._get_sweep_control(sweep)[0]
+            mon = self._get_sweep_monitor(sweep, mon_type)
+            mon = BunchbyBunch._SWEEP_MONITOR_LABELS[mon]
+            print(f'Idx: {ctrl:15s} {mon:15s}')
+
+            def step(_, idx, val, mon_val):
+                print(f'{idx:03d}: {val:15.6f} {_np.mean(mon_val):15.6f}')
+        else:
+            def step(_, *args):
+                callback(*args)
+        data = self._sweep_devices(
+            (self, ), sweep, values, wait, mon_type, step)
+        return data[self.devname]
+
+    def _sweep_devices(self, bbbs, sweep, values, wait, mon_type, callback):
+        """Sweep control of this device recording data of all devices."""
+        _, init_val, set_value = self._get_sweep_control(sweep)
+        mon = self._get_sweep_monitor(sweep, mon_type)
+        monitors = {bbb.devname: (bbb.sram, mon) for bbb in bbbs}
+        scan = _Scan(set_value, monitors, timeout=wait)
+        try:
+            return scan.run(values, callback)
+        finally:
+            set_value(init_val, wait=False)
+
+    def _get_sweep_control(self, sweep):
+        """Return label, initial value and setter of the swept control."""
+        if self.devname.endswith('L'):
+            servo = 'FBELT_SERVO_SETPT'
+        elif self.devname.endswith('H'):
+            servo = 'FBELT_X_PHASE_SETPT'
+        else:
+            servo = 'FBELT_Y_PHASE_SETPT'
+        controls = {
+            'phase_shifter': ('FBE Out Phase', self.fbe, servo),
+            'adc_delay': ('ADC Delay', self.timing, 'TADC'),
+            'backend_phase': ('Backend Phase', self.fbe, 'FBE_BE_PHASE'),
+            'dac_delay': ('DAC Delay', self.timing, 'TDAC'),
+            }
+        if sweep in controls:
+            label, dev, propty = controls[sweep]
+
+            def set_value(value, wait=True):
+                dev[propty] = value
+                if wait:
+                    dev._wait(propty, value)
+            return label, dev[propty], set_value
+
+        if sweep == 'feedback_phase':
+            def set_value(value, wait=True):
+                _ = wait
+                self.coeffs.edit_phase = value
+                self.coeffs.cmd_edit_apply()
+            return 'Coeff. Phase', self.coeffs.edit_phase, set_value
+
+        if sweep == 'rf_phase':
+            llrf = self.rfcav.dev_llrf
+
+            def set_value(value, wait=True):
+                if wait:
+                    self.rfcav.set_phase(value)
+                else:
+                    llrf.phase = value
+            return 'RF Phase', llrf.phase, set_value
+
+        raise NotImplementedError(sweep)
+
+    @staticmethod
+    def _get_sweep_monitor(sweep, mon_type):
+        def_type, propty, other = BunchbyBunch._SWEEP_MONITORS[sweep]
+        mon_type = def_type if mon_type is None else mon_type
+        return propty if mon_type.lower() in def_type else other
+
+    @staticmethod
+    def _print_sweep_step(devname, idx, val, mon_val):
+        print(
+            f'{devname:s} {idx:03d}: {val:15.6f} {_np.mean(mon_val):15.6f}')
+
+
+class _Scan:
+    """Scan of a control recording monitored data after each step.
+
+    After each value is set, monitored PVs are read after they are updated
+    'nr_updates' times, or after 'timeout' seconds. The first update may
+    have data acquired before the value was set.
+    """
+
+    def __init__(self, set_value, monitors, timeout, nr_updates=2):
+        """Init.
+
+        monitors is a dict of (device, propty) of each data key.
+        """
+        self._set_value = set_value
+        self._monitors = monitors
+        self._timeout = timeout
+        self._nr_updates = nr_updates
+        self._counts = dict.fromkeys(monitors, 0)
+        self._cond = _Condition()
+
+    def run(self, values, callback=None):
+        """Return dict with data of each key for each value.
+
+        callback(key, index, value, data) is called after each step.
+        """
+        values = list(values)
+        data = dict.fromkeys(self._monitors)
+        cbs = dict()
+        for key, (dev, propty) in self._monitors.items():
+            cbs[key] = dev.pv_object(propty).add_callback(
+                _partial(self._count_update, key))
+        try:
+            for idx, value in enumerate(values):
+                self._set_value(value)
+                self._wait_updates()
+                for key, (dev, propty) in self._monitors.items():
+                    mon_val = dev[propty]
+                    if mon_val is None:
+                        continue
+                    if data[key] is None:
+                        data[key] = _np.full(
+                            (len(values), ) + _np.shape(mon_val), _np.nan)
+                    data[key][idx] = mon_val
+                    if callback is not None:
+                        callback(key, idx, value, mon_val)
+        finally:
+            for key, (dev, propty) in self._monitors.items():
+                dev.pv_object(propty).remove_callback(cbs[key])
+        return data
+
+    def _count_update(self, key, **kwargs):
+        _ = kwargs
+        with self._cond:
+            self._counts[key] += 1
+            self._cond.notify_all()
+
+    def _wait_updates(self):
+        with self._cond:
+            # only updates after the value is set are counted.
+            self._counts = dict.fromkeys(self._counts, 0)
+            self._cond.wait_for(
+                lambda: min(self._counts.values()) >= self._nr_updates,
+                timeout=self._timeout)
 
 
 class SystemInfo(_Device):
@@ -2,6 +2,7 @@
 
 import time as _time
 import operator as _opr
+from threading import Condition as _Condition
 
 from epics.ca import ChannelAccessGetFailure as _ChannelAccessGetFailure
 
@@ -134,6 +135,14 @@ class Device:
         pvobj = self._pvs[propty]
         pvobj.value = value
 
+    def wait_propty(self, propty, value, timeout=_DEF_TIMEOUT, comp='eq'):
+        """Wait for property to satisfy comp(self[propty], value).
+
+        comp is the name of a function of the 'operator' module or a
+        callable. Returns True if the condition is met before timeout.
+        """
+        return _PVsWaiter([(self, propty, value, comp)]).wait(timeout)[0]
+
     # --- private methods ---
 
     def _create_pvs(self, devname):
@@ -154,14 +163,9 @@ class Device:
 
     def _wait(self, propty, value, timeout=_DEF_TIMEOUT, comp='eq'):
         """."""
-        comp = getattr(_opr, comp)
-        ntrials = int(timeout/_TINY_INTERVAL)
+        # NOTE: readbacks may still have the value before the last setpoint.
         _time.sleep(4*_TINY_INTERVAL)
-        for _ in range(ntrials):
-            if comp(self[propty], value):
-                return True
-            _time.sleep(_TINY_INTERVAL)
-        return False
+        return self.wait_propty(propty, value, timeout=timeout, comp=comp)
 
     def _get_pvname(self, devname, propty):
         if devname:
@@ -336,6 +340,30 @@ class Devices:
         """Return devices."""
         return self._devices
 
+    @staticmethod
+    def wait_conditions(conditions, timeout=_DEF_TIMEOUT):
+        """Wait for conditions on properties of many devices.
+
+        conditions is a list of (device, propty, value, comp) tuples, each
+        one met when comp(device[propty], value). comp is the name of a
+        function of the 'operator' module or a callable, and may be
+        omitted for 'eq'. Returns whether all conditions were met before
+        timeout and the list of 'devname:propty' not met.
+        """
+        return _PVsWaiter(conditions).wait(timeout)
+
+    def wait_devices_propty(
+            self, devices, propty, values, comp='eq', timeout=_DEF_TIMEOUT):
+        """Wait for devices property to reach value(s).
+
+        Returns whether all devices reached their values before timeout
+        and the list of 'devname:propty' that did not.
+        """
+        dev2val = self._get_dev_2_val(devices, values)
+        conditions = [
+            (dev, propty, val, comp) for dev, val in dev2val.items()]
+        return self.wait_conditions(conditions, timeout=timeout)
+
     # --- private methods ---
 
     def _set_devices_propty(self, devices, propty, values, wait=0):
@@ -350,20 +378,12 @@ class Devices:
             self, devices, propty, values, comp='eq',
             timeout=_DEF_TIMEOUT, return_prob=False):
         """Wait for devices property to reach value(s)."""
-        comp = getattr(_opr, comp)
-        dev2val = self._get_dev_2_val(devices, values)
-
+        # NOTE: readbacks may still have the value before the last setpoint.
         _time.sleep(4*_TINY_INTERVAL)
-        for _ in range(int(timeout/_TINY_INTERVAL)):
-            okdevs = {k for k, v in dev2val.items() if comp(k[propty], v)}
-            list(map(dev2val.__delitem__, okdevs))
-            if not dev2val:
-                break
-            _time.sleep(_TINY_INTERVAL)
-
-        allok = not dev2val
+        allok, prob = self.wait_devices_propty(
+            devices, propty, values, comp=comp, timeout=timeout)
         if return_prob:
-            return allok, [dev.devname+':'+propty for dev in dev2val]
+            return allok, prob
         return allok
 
     def _get_dev_2_val(self, devices, values):
@@ -379,3 +399,74 @@ class Devices:
     def __getitem__(self, devidx):
         """Return device."""
         return self._devices[devidx]
+
+
+class _PVsWaiter:
+    """Wait for conditions on device properties using PV callbacks.
+
+    Pending conditions are checked again whenever one of their PVs is
+    updated. PVs that are not auto-monitored do not run callbacks, so
+    they are also checked every _TINY_INTERVAL.
+    """
+
+    def __init__(self, conditions):
+        """Init.
+
+        conditions is a list of (device, propty, value, comp) tuples.
+        """
+        self._conditions = []
+        for cond in conditions:
+            dev, propty, value, *comp = cond
+            comp = comp[0] if comp else 'eq'
+            if isinstance(comp, str):
+                comp = getattr(_opr, comp)
+            self._conditions.append((dev, propty, value, comp))
+        self._cond = _Condition()
+        self._updated = False
+
+    def wait(self, timeout=_DEF_TIMEOUT):
+        """Return whether all conditions are met and the ones not met."""
+        pending = list(self._conditions)
+        cbs = dict()
+        tfin = None if timeout is None else _time.time() + timeout
+        try:
+            for dev, propty, *_ in pending:
+                pvobj = dev.pv_object(propty)
+                if pvobj.auto_monitor and id(pvobj) not in cbs:
+                    index = pvobj.add_callback(
+                        self._set_updated, with_ctrlvars=False)
+                    cbs[id(pvobj)] = (pvobj, index)
+            while True:
+                with self._cond:
+                    self._updated = False
+                pending = [cond for cond in pending if not self._is_met(cond)]
+                if not pending:
+                    break
+                tout = None if tfin is None else tfin - _time.time()
+                if tout is not None and tout <= 0:
+                    break
+                if any(not dev.pv_object(ppt).auto_monitor
+                       for dev, ppt, *_ in pending):
+                    tout = _TINY_INTERVAL if tout is None else \
+                        min(tout, _TINY_INTERVAL)
+                with self._cond:
+                    # updates while conditions were checked are not lost.
+                    if not self._updated:
+                        self._cond.wait(tout)
+        finally:
+            for pvobj, index in cbs.values():
+                pvobj.remove_callback(index)
+        return not pending, [
+            '{}:{}'.format(dev.devname, propty)
+            for dev, propty, *_ in pending]
+
+    def _set_updated(self, **kwargs):
+        _ = kwargs
+        with self._cond:
+            self._updated = True
+            self._cond.notify_all()
+
+    @staticmethod
+    def _is_met(condition):
+        dev, propty, value, comp = condition
+        return bool(comp(dev[propty], value))
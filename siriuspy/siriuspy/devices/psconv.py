@@ -99,6 +99,11 @@ class StrengthConv(_Devices):
         # call base class constructor
         super().__init__(devname, devices)
 
+    @property
+    def normalizer(self):
+        """Return magnet normalizer used in conversions."""
+        return self._norm_mag
+
     @property
     def dipole_strength(self):
         """Return dipole strength."""
@@ -1,11 +1,138 @@
 """SiriusPVTimeSerie Class."""
 
-import collections as _collections
 import time as _time
 import threading as _threading
 import numpy as _np
 
 
+class _SerieBuffer:
+    """Buffer of timestamps and values with contiguous views.
+
+    Points are appended after the end of preallocated arrays and removed
+    from their beginning by moving a start index, so views of the serie
+    are contiguous. When the end of the arrays is reached, remaining points
+    are copied to new arrays, growing them if needed, so appends are O(1)
+    amortized. Points of a view are never overwritten.
+    """
+
+    _INIT_SIZE = 1024
+
+    def __init__(self, maxlen=None):
+        self._maxlen = maxlen
+        self._timestamps = None
+        self._values = None
+        self._beg = 0
+        self._end = 0
+        self._lock = _threading.Lock()
+
+    @property
+    def maxlen(self):
+        """Maximum number of points."""
+        return self._maxlen
+
+    @maxlen.setter
+    def maxlen(self, value):
+        with self._lock:
+            self._maxlen = value
+            if value is not None:
+                self._beg = max(self._beg, self._end - value)
+
+    @property
+    def last_timestamp(self):
+        """Timestamp of the last point, None if empty."""
+        with self._lock:
+            if self._beg == self._end:
+                return None
+            return self._timestamps[self._end-1]
+
+    def get_views(self):
+        """Return read-only views of timestamps and values."""
+        with self._lock:
+            if self._timestamps is None:
+                return _np.array([]), _np.array([])
+            slc = slice(self._beg, self._end)
+            timestamps, values = self._timestamps[slc], self._values[slc]
+        timestamps.flags.writeable = False
+        values.flags.writeable = False
+        return timestamps, values
+
+    def append(self, timestamp, value):
+        """Append point, dropping the first one if buffer is full."""
+        with self._lock:
+            if self._timestamps is None:
+                self._allocate(value)
+            elif self._end == len(self._timestamps):
+                self._reallocate()
+            self._timestamps[self._end] = timestamp
+            self._values[self._end] = value
+            self._end += 1
+            if self._maxlen is not None and \
+                    self._end - self._beg > self._maxlen:
+                self._beg += 1
+
+    def extend(self, timestamps, values):
+        """Append points."""
+        for timestamp, value in zip(timestamps, values):
+            self.append(timestamp, value)
+
+    def trim(self, min_timestamp):
+        """Remove points with timestamps up to 'min_timestamp'."""
+        with self._lock:
+            if self._beg == self._end:
+                return
+            self._beg += _np.searchsorted(
+                self._timestamps[self._beg:self._end], min_timestamp,
+                side='right')
+
+    def select(self, indices):
+        """Keep only points of 'indices'."""
+        timestamps, values = self.get_views()
+        timestamps, values = timestamps[indices], values[indices]
+        self.clear()
+        self.extend(timestamps, values)
+
+    def clear(self):
+        """Remove all points."""
+        with self._lock:
+            # NOTE: new arrays are allocated by the next append, so points
+            # of views are not overwritten.
+            self._timestamps = self._values = None
+            self._beg = self._end = 0
+
+    def __len__(self):
+        """Return number of points."""
+        return self._end - self._beg
+
+    def _allocate(self, value):
+        size = self._INIT_SIZE
+        if self._maxlen is not None:
+            size = min(size, 2*self._maxlen)
+        size = max(size, 1)
+        value = _np.asarray(value)
+        dtype = float if value.dtype.kind in 'biuf' else object
+        self._timestamps = _np.empty(size)
+        self._values = _np.empty((size, ) + value.shape, dtype=dtype)
+
+    def _reallocate(self):
+        size = self._end - self._beg
+        capacity = len(self._timestamps)
+        # NOTE: grows arrays only if they are more than half full, so that
+        # there are at least as many appends as copied points.
+        if 2*size > capacity:
+            capacity *= 2
+            if self._maxlen is not None:
+                capacity = min(capacity, 2*self._maxlen)
+        slc = slice(self._beg, self._end)
+        timestamps = _np.empty(capacity)
+        values = _np.empty(
+            (capacity, ) + self._values.shape[1:], dtype=self._values.dtype)
+        timestamps[:size] = self._timestamps[slc]
+        values[:size] = self._values[slc]
+        # NOTE: new arrays keep views of the old ones unchanged.
+        self._timestamps, self._values = timestamps, values
+        self._beg, self._end = 0, size
+
+
 class SiriusPVTimeSerie:
     """Class to handle time series from pv monitoring."""
 
@@ -27,16 +154,11 @@ class SiriusPVTimeSerie:
         self._time_min_interval = time_min_interval
         self._nr_max_points = nr_max_points
         self._use_pv_timestamp = use_pv_timestamp
+        self._buffer = _SerieBuffer(maxlen=nr_max_points)
         if timestamp_init_data:
             if not value_init_data:
                 raise ValueError("Provide 'value_init_data' input!")
-            self._timestamp_deque = _collections.deque(
-                timestamp_init_data, maxlen=nr_max_points)
-            self._value_deque = _collections.deque(
-                value_init_data, maxlen=nr_max_points)
-        else:
-            self._timestamp_deque = _collections.deque(maxlen=nr_max_points)
-            self._value_deque = _collections.deque(maxlen=nr_max_points)
+            self._buffer.extend(timestamp_init_data, value_init_data)
         self._mode = mode
         if self._mode == 1:
             self._th_auto_acquire = _threading.Thread(
@@ -66,31 +188,15 @@ class SiriusPVTimeSerie:
     def time_min_interval(self, value):
         self._time_min_interval = value
 
-        if self._timestamp_deque:
-            old_timestamp_deque = _collections.deque(
-                self._timestamp_deque, maxlen=self._nr_max_points)
-            old_value_deque = _collections.deque(
-                self._value_deque, maxlen=self._nr_max_points)
-            self._timestamp_deque = _collections.deque(
-                maxlen=self._nr_max_points)
-            self._value_deque = _collections.deque(
-                maxlen=self._nr_max_points)
-
-            aux = old_timestamp_deque.pop()
-            self._timestamp_deque.appendleft(aux)
-            aux = old_value_deque.pop()
-            self._value_deque.appendleft(aux)
-
-            while old_timestamp_deque:
-                if self._time_min_interval < (
-                        self._timestamp_deque[0] - old_timestamp_deque[-1]):
-                    aux = old_timestamp_deque.pop()
-                    self._timestamp_deque.appendleft(aux)
-                    aux = old_value_deque.pop()
-                    self._value_deque.appendleft(aux)
-                else:
-                    old_timestamp_deque.pop()
-                    old_value_deque.pop()
+        timestamps, _ = self._buffer.get_views()
+        if timestamps.size:
+            # keep last point and, going backwards, every point more than
+            # 'value' apart from the previous kept one.
+            indices = [timestamps.size - 1]
+            for idx in range(timestamps.size - 2, -1, -1):
+                if value < timestamps[indices[-1]] - timestamps[idx]:
+                    indices.append(idx)
+            self._buffer.select(indices[::-1])
 
     @property
     def nr_max_points(self):
@@ -100,10 +206,7 @@ class SiriusPVTimeSerie:
     @nr_max_points.setter
     def nr_max_points(self, value):
         self._nr_max_points = value
-        self._timestamp_deque = _collections.deque(
-            self._timestamp_deque, maxlen=self._nr_max_points)
-        self._value_deque = _collections.deque(
-            self._value_deque, maxlen=self._nr_max_points)
+        self._buffer.maxlen = value
 
     @property
     def mode(self):
@@ -127,14 +230,22 @@ class SiriusPVTimeSerie:
         """PV time series, as two separate lists: timestamp and value."""
         return self.get_serie()
 
-    def get_serie(self, time_absolute=False):
-        """Return series, as two separate numpy arrays: timestamp and value."""
+    def get_serie(self, time_absolute=False, copy=True):
+        """Return series, as two separate numpy arrays: timestamp and value.
+
+        If 'copy' is False, read-only views of the serie are returned,
+        which are not changed by later acquisitions. Relative timestamps
+        are always new arrays.
+        """
         timestamp = _time.time()
         self._update(timestamp)
-        timestamp_array = _np.array(self._timestamp_deque)
+        timestamp_array, value_array = self._buffer.get_views()
         if not time_absolute:
-            timestamp_array -= timestamp
-        value_array = _np.array(self._value_deque)
+            timestamp_array = timestamp_array - timestamp
+        elif copy:
+            timestamp_array = timestamp_array.copy()
+        if copy:
+            value_array = value_array.copy()
         return timestamp_array, value_array
 
     def acquire(self):
@@ -153,29 +264,28 @@ class SiriusPVTimeSerie:
                 pv_timestamp, pv_value = timestamp, self._pvobj.value
 
             # check if it is a new datapoint
-            if not self._timestamp_deque or \
-                    pv_timestamp != self._timestamp_deque[-1]:
+            last_timestamp = self._buffer.last_timestamp
+            if last_timestamp is None or pv_timestamp != last_timestamp:
                 # check if there is a limiting time_window
                 if self._time_window is None:
                     # check if there is a limiting time_min_interval
-                    if not self._timestamp_deque or \
-                            minintv <= timestamp-self._timestamp_deque[-1]:
-                        self._timestamp_deque.append(pv_timestamp)
-                        self._value_deque.append(pv_value)
+                    if last_timestamp is None or \
+                            minintv <= timestamp-last_timestamp:
+                        self._buffer.append(pv_timestamp, pv_value)
                         return True
                     else:
                         # print('not acquired: time interval not sufficient')
                         return False
                 else:
-                    # Check if the datapoints in the deques are yet valid
+                    # Check if the datapoints in the serie are yet valid
                     # to the limiting time_window
                     self._update(timestamp)
+                    last_timestamp = self._buffer.last_timestamp
                     # check if the new point is within the limiting time_window
                     if pv_timestamp >= timestamp - self._time_window:
-                        if not self._timestamp_deque or \
-                                minintv <= timestamp-self._timestamp_deque[-1]:
-                            self._timestamp_deque.append(pv_timestamp)
-                            self._value_deque.append(pv_value)
+                        if last_timestamp is None or \
+                                minintv <= timestamp-last_timestamp:
+                            self._buffer.append(pv_timestamp, pv_value)
                             return True
                         else:
                             # print('not acquired: not enough time interval')
@@ -184,7 +294,7 @@ class SiriusPVTimeSerie:
                         # print('not acquired: not within time_window')
                         return False
             else:
-                # print('not acquired: item already in deque')
+                # print('not acquired: item already in serie')
                 return False
         else:
             # print('not acquired: pv not connected')
@@ -197,39 +307,13 @@ class SiriusPVTimeSerie:
 
     def _update(self, timestamp):
         """Update time serie according to current timestamp."""
-        if not self._timestamp_deque or self._time_window is None:
+        if self._time_window is None:
             return
-
-        min_timestamp = timestamp - self._time_window
-        if self._timestamp_deque[-1] <= min_timestamp:
-            self.clearserie()
-        elif self._timestamp_deque[0] >= min_timestamp:
-            pass
-        else:
-            low_interval_end = 0
-            high_interval_end = len(self._timestamp_deque)-1
-            search_index = (high_interval_end - low_interval_end)//2
-
-            while low_interval_end != search_index:
-                if self._timestamp_deque[search_index] <= min_timestamp:
-                    low_interval_end = search_index
-                    search_index = (
-                        (high_interval_end - low_interval_end)//2 +
-                        low_interval_end)
-                else:
-                    high_interval_end = search_index
-                    search_index = (
-                        (high_interval_end - low_interval_end)//2 +
-                        low_interval_end)
-
-            for _ in range(search_index + 1):
-                self._timestamp_deque.popleft()
-                self._value_deque.popleft()
+        self._buffer.trim(timestamp - self._time_window)
 
     def clearserie(self):
         """Clear time serie."""
-        self._timestamp_deque.clear()
-        self._value_deque.clear()
+        self._buffer.clear()
 
     def connected(self):
         """Check PV connection."""
@@ -103,9 +103,6 @@ class MacScheduleData:
     def _reload_mac_schedule_data(year):
         if year in MacScheduleData._mac_schedule_sdata:
             return
-        if not _web.server_online():
-            raise Exception('could not connect to web server')
-
         try:
             data, _ = _util.read_text_data(_web.mac_schedule_read(year))
         except Exception:
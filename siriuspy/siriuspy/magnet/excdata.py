@@ -253,3 +253,81 @@ class ExcitationData:
         self._fname = label
         text = _web.magnets_excitation_data_read(label)
         self._read_text(text)
+
+
+class ExcitationDataStack:
+    """Stacked excitation tables of many magnets.
+
+    Main multipole tables of all magnets are stacked in padded arrays, so
+    that interpolations for all magnets are done with a few vectorized
+    operations. Values beyond table limits are linearly extrapolated, as in
+    ExcitationData.
+    """
+
+    def __init__(self, excdatas, harmonics, multipole_types):
+        """Init method.
+
+        excdatas : sequence of ExcitationData objects, one per magnet.
+        harmonics : sequence of main multipole harmonics, one per magnet.
+        multipole_types : sequence of main multipole types, one per magnet.
+        """
+        currs, mpoles = [], []
+        for excdata, harm, mtype in zip(excdatas, harmonics, multipole_types):
+            currs.append(_np.asarray(excdata.currents, dtype=float))
+            mpoles.append(_np.asarray(
+                excdata.multipoles[mtype][harm], dtype=float))
+        self._rows = _np.arange(len(currs))
+        self._curr2mult = ExcitationDataStack._stack(currs, mpoles)
+        # sort correctly tabulated lists, as in ExcitationData.
+        curr_sorted, mpoles_sorted = [], []
+        for curr, mpole in zip(currs, mpoles):
+            if mpole[-1] <= mpole[0]:
+                curr, mpole = curr[::-1], mpole[::-1]
+            curr_sorted.append(curr)
+            mpoles_sorted.append(mpole)
+        self._mult2curr = ExcitationDataStack._stack(
+            mpoles_sorted, curr_sorted)
+
+    def __len__(self):
+        """Return number of magnets."""
+        return len(self._rows)
+
+    def interp_curr2mult(self, currents):
+        """Interpolate main multipoles of all magnets for their currents."""
+        return self._calc_interp(
+            _np.asarray(currents, dtype=float), *self._curr2mult)
+
+    def interp_mult2curr(self, multipoles):
+        """Interpolate currents of all magnets for their main multipoles."""
+        return self._calc_interp(
+            _np.asarray(multipoles, dtype=float), *self._mult2curr)
+
+    # --- private methods ---
+
+    @staticmethod
+    def _stack(xtabs, ytabs):
+        nrpts = _np.array([len(xtab) for xtab in xtabs])
+        # NOTE: tables are padded with +inf abscissas, never selected.
+        xstack = _np.full((len(xtabs), nrpts.max()), _np.inf)
+        ystack = _np.zeros(xstack.shape)
+        for i, (xtab, ytab) in enumerate(zip(xtabs, ytabs)):
+            xstack[i, :len(xtab)] = xtab
+            ystack[i, :len(ytab)] = ytab
+        return xstack, ystack, nrpts
+
+    def _calc_interp(self, xvals, xtab, ytab, nrpts):
+        # index of upper point of segment of each value, limited to first
+        # and last segments beyond table limits, for extrapolation.
+        idx = _np.sum(xtab <= xvals[:, None], axis=1)
+        idx = _np.clip(idx, 1, nrpts - 1)
+        rows = self._rows
+        xt1, xt2 = xtab[rows, idx-1], xtab[rows, idx]
+        yt1, yt2 = ytab[rows, idx-1], ytab[rows, idx]
+        with _np.errstate(divide='ignore', invalid='ignore'):
+            interp = yt1 + (yt2 - yt1) * (xvals - xt1) / (xt2 - xt1)
+        # degenerate segments, as in util.linear_extrapolation
+        degen = xt2 == xt1
+        if _np.any(degen):
+            yt1, yt2 = yt1[degen], yt2[degen]
+            interp[degen] = _np.where(_np.abs(yt2) < _np.abs(yt1), yt2, yt1)
+        return interp
@@ -11,6 +11,7 @@ from ..pwrsupply.data import PSData as _PSData
 
 from . import util as _mutil
 from .data import MAData as _MAData
+from .excdata import ExcitationDataStack as _ExcitationDataStack
 
 
 # beta(energy) ~ 1 approximation is more computationally efficient.
@@ -73,14 +74,16 @@ class _MagnetNormalizer:
         strengths = self._conv_epicsdb_2_default(strengths)
         intfields = self._conv_strength_2_intfield(strengths, **kwargs)
         mf = self._mfmult
-        # excdata = self._get_main_excdata()
-        excdata = self._madata.excdata(self._psname)
+        excdata = self._get_main_excdata()
         currents = excdata.interp_mult2curr(
             intfields, mf['harmonic'], mf['type'])
         return currents
 
     # --- normalizer aux. methods ---
 
+    def _get_main_excdata(self):
+        return self._madata.excdata(self._psname)
+
     def _conv_current_2_intfield(self, currents):
         mpoles = self._conv_current_2_multipoles(
             currents, only_main_harmonic=True)
@@ -379,3 +382,64 @@ class TrimNormalizer(_MagnetNormalizer):
         # its contribution.
         strengths_fam = _np.array(kwargs['strengths_family'])
         return strengths_trim + strengths_fam
+
+
+class BatchNormalizer:
+    """Convert currents of many magnets to strengths and vice versa at once.
+
+    Magnets are given by MagnetNormalizer objects, which may be shared by
+    magnets with the same excitation data. Main multipole tables of all
+    magnets are stacked, so that a whole vector is converted with a few
+    vectorized operations. Strength factors are cached per dipole strength.
+    """
+
+    _FACTORS_CACHE_SIZE = 16
+
+    def __init__(self, normalizers):
+        """Init."""
+        for norm in normalizers:
+            if not isinstance(norm, MagnetNormalizer):
+                raise ValueError(
+                    'BatchNormalizer supports MagnetNormalizer objects only!')
+        self._excstack = _ExcitationDataStack(
+            [norm._get_main_excdata() for norm in normalizers],
+            [norm._mfmult['harmonic'] for norm in normalizers],
+            [norm._mfmult['type'] for norm in normalizers])
+        # conversion coefficients of default [rad] to epicsdb units,
+        # including magnet conversion signs.
+        self._coefs = _np.array([
+            norm._magnet_conv_sign * norm._coef_def2edb
+            for norm in normalizers])
+        self._factors = dict()
+
+    def __len__(self):
+        """Return number of magnets."""
+        return len(self._excstack)
+
+    def conv_current_2_strength(self, currents, strengths_dipole):
+        """Convert currents vector to strengths vector."""
+        intfields = self._excstack.interp_curr2mult(currents)
+        intfield2strength, _ = self._get_factors(strengths_dipole)
+        return intfield2strength * intfields
+
+    def conv_strength_2_current(self, strengths, strengths_dipole):
+        """Convert strengths vector to currents vector."""
+        _, strength2intfield = self._get_factors(strengths_dipole)
+        intfields = strength2intfield * _np.asarray(strengths, dtype=float)
+        return self._excstack.interp_mult2curr(intfields)
+
+    def _get_factors(self, strengths_dipole):
+        factors = self._factors.get(strengths_dipole)
+        if factors is not None:
+            return factors
+        brho, *_ = _util.beam_rigidity(strengths_dipole)
+        if brho == 0:
+            intfield2strength = _np.zeros(len(self._coefs))
+        else:
+            intfield2strength = self._coefs / brho
+        strength2intfield = brho / self._coefs
+        factors = intfield2strength, strength2intfield
+        if len(self._factors) >= BatchNormalizer._FACTORS_CACHE_SIZE:
+            self._factors.clear()
+        self._factors[strengths_dipole] = factors
+        return factors
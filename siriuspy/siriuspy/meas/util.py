@@ -2,6 +2,7 @@
 
 from functools import partial as _part
 import logging as _log
+from threading import Thread as _Thread, Event as _Event, Lock as _Lock
 import numpy as _np
 from scipy.optimize import curve_fit
 
@@ -77,7 +78,12 @@ class ProcessImage(BaseClass):
         self._reading_order = self.ReadingOrder.CLike
         self._method = self.Method.GaussFit
         self._nr_averages = 1
-        self._images = []
+        # NOTE: images being averaged are kept in a ring buffer and their
+        #       sum is updated with each new image.
+        self._images = None
+        self._images_sum = None
+        self._images_idx = 0
+        self._images_cnt = 0
         self._reset_buffer = False
         self._image = _np.zeros(
             (self.DEFAULT_WIDTH, self.DEFAULT_HEIGHT), dtype=float)
@@ -86,6 +92,11 @@ class ProcessImage(BaseClass):
         self._conv_scale = [1, 1]
         self._flip = [False, False]
         self._beam_params = [None, None]
+        self._worker = None
+        self._worker_image = None
+        self._worker_lock = _Lock()
+        self._worker_evt = _Event()
+        self._worker_stop = False
 
     def get_map2write(self):
         """."""
@@ -176,6 +187,12 @@ class ProcessImage(BaseClass):
         if not isinstance(val, _np.ndarray):
             _log.error('Image is not a numpy array')
             return
+        if self._worker is not None:
+            with self._worker_lock:
+                # a previous image not processed yet is dropped.
+                self._worker_image = val
+                self._worker_evt.set()
+            return
         self._process_image(val)
 
     @property
@@ -222,7 +239,7 @@ class ProcessImage(BaseClass):
     @property
     def buffer_size(self):
         """Return the current buffer size."""
-        return len(self._images)
+        return self._images_cnt
 
     @property
     def imagecroplow(self):
@@ -429,7 +446,7 @@ class ProcessImage(BaseClass):
         if not isinstance(val, _np.ndarray):
             _log.error('Could not set background')
             return
-        img = self._adjust_image_dimensions(np.array(val, dtype=float))
+        img = self._adjust_image_dimensions(_np.array(val, dtype=float))
         if img is None:
             _log.error('Could not set background')
             return
@@ -587,45 +604,69 @@ class ProcessImage(BaseClass):
         self._reset_buffer = True
         self.run_callbacks('BufferSize-Mon', 0)
 
+    def start_worker(self):
+        """Process images set from now on in a dedicated thread.
+
+        Only the last image set is processed when the thread is free, the
+        ones set while it was busy are dropped.
+        """
+        if self._worker is not None:
+            return
+        self._worker_stop = False
+        self._worker = _Thread(target=self._run_worker, daemon=True)
+        self._worker.start()
+
+    def stop_worker(self):
+        """Stop processing thread, images are processed as they are set."""
+        if self._worker is None:
+            return
+        with self._worker_lock:
+            self._worker_stop = True
+            self._worker_evt.set()
+        self._worker.join()
+        self._worker = None
+        # pending image is dropped, so a new worker starts idle.
+        with self._worker_lock:
+            self._worker_image = None
+            self._worker_evt.clear()
+
+    def _run_worker(self):
+        """."""
+        while True:
+            self._worker_evt.wait()
+            with self._worker_lock:
+                if self._worker_stop:
+                    break
+                image, self._worker_image = self._worker_image, None
+                self._worker_evt.clear()
+            if image is None:
+                continue
+            try:
+                self._process_image(image)
+            except Exception:
+                _log.exception('Could not process image.')
+
     def _process_image(self, image):
         """."""
         image = self._adjust_image_dimensions(image)
-        image = _np.array(image, dtype=float)
         if image is None:
             _log.error('Image is None')
             return
 
-        # check whether to reset or not the buffer
-        imgs = self._images
-        self._reset_buffer |= bool(imgs) and (imgs[-1].shape != image.shape)
-        if self._reset_buffer:
-            self._images = [image, ]
-            self._reset_buffer = False
-        else:
-            self._images.append(image)
-            self._images = self._images[-self._nr_averages:]
-        buf_size = self.buffer_size
-        self.run_callbacks('BufferSize-Mon', buf_size)
-
         # calculate average of the images
-        if buf_size > 1:
-            image = self._images[0].copy()
-            for img in self._images[1:]:  # faster than using numpy.mean
-                image += img
-            image /= len(self._images)
+        image = self._average_image(image)
+        self.run_callbacks('BufferSize-Mon', self.buffer_size)
 
         if self._background_use and self._background.shape == image.shape:
-            image -= self._background
-            b = _np.where(image < 0)
-            image[b] = 0
-        else:
+            _np.subtract(image, self._background, out=image)
+            _np.maximum(image, 0, out=image)
+        elif self._background_use:
             self.usebackground = False
 
         if self._crop_use:
-            boo = image > self._crop[self.CropIdx.High]
-            image[boo] = self._crop[self.CropIdx.High]
-            boo = image < self._crop[self.CropIdx.Low]
-            image[boo] = self._crop[self.CropIdx.Low]
+            _np.clip(
+                image, self._crop[self.CropIdx.Low],
+                self._crop[self.CropIdx.High], out=image)
 
         if self._flip[self.Plane.X]:
             image = _np.flip(image, axis=self.Plane.X)
@@ -666,6 +707,53 @@ class ProcessImage(BaseClass):
         self.run_callbacks('BeamOffsetX-Mon', self.beamoffsetx)
         self.run_callbacks('BeamOffsetY-Mon', self.beamoffsety)
 
+    def _average_image(self, image):
+        """Add image to the buffer and return a new array with the average."""
+        nr_avgs = max(self._nr_averages, 1)
+        imgs = self._images
+        if self._reset_buffer or imgs is None or \
+                imgs.shape[1:] != image.shape:
+            self._images = _np.empty(
+                (nr_avgs, ) + image.shape, dtype=_np.float32)
+            self._images_sum = _np.zeros(image.shape, dtype=float)
+            self._images_idx = self._images_cnt = 0
+            self._reset_buffer = False
+        elif imgs.shape[0] != nr_avgs:
+            self._resize_buffer(nr_avgs)
+
+        imgs, idx = self._images, self._images_idx
+        if nr_avgs == 1:
+            # the sum is not needed, but the image is kept for averages.
+            imgs[0] = image
+            self._images_cnt = 1
+            return _np.array(image, dtype=float)
+
+        if self._images_cnt == nr_avgs:
+            self._images_sum -= imgs[idx]
+        else:
+            self._images_cnt += 1
+        imgs[idx] = image
+        self._images_idx = (idx + 1) % nr_avgs
+        if self._images_idx == 0 and self._images_cnt == nr_avgs:
+            # NOTE: sum is recalculated once in a while to avoid
+            #       accumulation of rounding errors.
+            imgs.sum(axis=0, dtype=float, out=self._images_sum)
+        else:
+            self._images_sum += imgs[idx]
+        return self._images_sum / self._images_cnt
+
+    def _resize_buffer(self, nr_avgs):
+        """Keep in a buffer of new size the last images of the buffer."""
+        imgs, cnt = self._images, self._images_cnt
+        keep = min(cnt, nr_avgs)
+        idcs = (self._images_idx - keep + _np.arange(keep)) % imgs.shape[0]
+        self._images = _np.empty(
+            (nr_avgs, ) + imgs.shape[1:], dtype=_np.float32)
+        self._images[:keep] = imgs[idcs]
+        self._images_sum = self._images[:keep].sum(axis=0, dtype=float)
+        self._images_idx = keep % nr_avgs
+        self._images_cnt = keep
+
     def _adjust_image_dimensions(self, img):
         """."""
         if len(img.shape) == 1:
@@ -758,13 +846,34 @@ class ProcessImage(BaseClass):
         x = x - mu
         return amp*_np.exp(-x*x/(2.0*sigma*sigma))+y0
 
+    @classmethod
+    def _gaussian_jac(cls, x, *args):
+        """Return jacobian of _gaussian with respect to its parameters."""
+        mu = args[cls.FitParams.Cen]
+        sigma = args[cls.FitParams.Sig]
+        amp = args[cls.FitParams.Amp]
+        x = x - mu
+        expo = _np.exp(-x*x/(2.0*sigma*sigma))
+        jac = _np.empty((x.size, 4))
+        jac[:, cls.FitParams.Amp] = expo
+        jac[:, cls.FitParams.Cen] = amp*expo*x/(sigma*sigma)
+        jac[:, cls.FitParams.Sig] = amp*expo*x*x/(sigma*sigma*sigma)
+        jac[:, cls.FitParams.Off] = 1.0
+        return jac
+
     @classmethod
     def _fit_gaussian(cls, x, y, par=None):
-        """."""
-        if par is None:
-            par = cls._calc_moments(x, y)
+        """Fit gaussian starting from the moments of the projection.
+
+        par is used as starting point only if moments are not finite.
+        """
+        with _np.errstate(divide='ignore', invalid='ignore'):
+            moments = cls._calc_moments(x, y)
+        if par is None or _np.all(_np.isfinite(moments)):
+            par = moments
         try:
-            par, _ = curve_fit(cls._gaussian, x, y, par)
+            par, _ = curve_fit(
+                cls._gaussian, x, y, par, jac=cls._gaussian_jac)
         except Exception:
             _log.error('Could not fit gaussian.')
         return par
@@ -2,6 +2,7 @@
 
 import types as _types
 import re as _re
+from functools import lru_cache as _lru_cache
 
 
 _ATTRS = (
@@ -21,6 +22,17 @@ _ATTRS = (
     'device_propty',
 )
 
+# NOTE: fast path of complete names without channel type, whose device
+# names have at most three fields and whose property has at most two fields
+# and one field suffix. Other names are parsed by _split_name.
+_PVNAME_REGEXP = _re.compile(
+    r'(?:([^:]*)-)?([^:\-]*)-([^:\-]*)'  # prefix, section and subsection
+    r':([^:\-]*)-([^:\-]*)(?:-([^:\-]*))?'  # discipline, device and index
+    r'(?::(([^:.\-]*)(?:-([^:.\-]*))?)'  # property
+    r'(?:\.([^:.]*))?)?$')  # field
+
+_PARSE_CACHE_SIZE = 2**16
+
 
 def get_siriuspvname_attrs():
     """Return SiriusPVName attributes."""
@@ -90,6 +102,43 @@ def split_name(pvname, elements=None):
             complete name, 'elements' says which part of pvname
             it corresponds to.
 
+    """
+    return dict(zip(_ATTRS, _parse_name(pvname, elements)))
+
+
+@_lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_name(pvname, elements=None):
+    """Return tuple with values of _ATTRS of PV name.
+
+    Results are cached, so identical names share the same tuple.
+    """
+    names = pvname.strip().split('://')
+    mat = _PVNAME_REGEXP.match(names[-1]) if len(names) <= 2 else None
+    if mat is None:
+        dic_ = _split_name(pvname, elements)
+        return tuple(dic_[attr] for attr in _ATTRS)
+
+    channel_type = names[0] if len(names) == 2 else ''
+    prefix, sec, sub, dis, dev, idx, propty, propty_name, propty_suffix, \
+        field = mat.groups('')
+    area_name = sec + '-' + sub
+    device_name = area_name + ':' + dis + '-' + dev
+    if mat.group(6) is not None:
+        device_name += '-' + idx
+    device_propty = (
+        dev +
+        ('-' + idx if idx else '') +
+        (':' + propty if propty else '') +
+        ('.' + field if field else ''))
+    return (
+        channel_type, prefix, sec, sub, dis, dev, idx, propty, field,
+        device_name, area_name, propty_name, propty_suffix, device_propty)
+
+
+def _split_name(pvname, elements=None):
+    """Return dict with PV name split into fields.
+
+    Used for names not matched by _PVNAME_REGEXP.
     """
     if not elements:
         elements = 'propty'
@@ -184,26 +233,29 @@ def get_pair_sprb(pv_propty):
 class SiriusPVName(str):
     """Sirius PV Name Class."""
 
+    __slots__ = (
+        'channel_type', 'prefix', 'sec', 'sub', 'dis', 'dev', 'idx',
+        'propty', 'field', '_device_name', 'area_name', 'propty_name',
+        'propty_suffix', 'device_propty')
+
     def __new__(cls, pv_name, elements=None):
         """Implement new method."""
-        name = split_name(pv_name, elements)
         obj = super().__new__(cls, pv_name)
-        obj.channel_type = name['channel_type']
-        obj.prefix = name['prefix']
-        obj.sec = name['sec']
-        obj.sub = name['sub']
-        obj.area_name = name['area_name']
-        obj.dis = name['dis']
-        obj.dev = name['dev']
-        obj.idx = name['idx']
-        obj._device_name = name['device_name']
-        obj.propty_name = name['propty_name']
-        obj.propty_suffix = name['propty_suffix']
-        obj.propty = name['propty']
-        obj.device_propty = name['device_propty']
-        obj.field = name['field']
+        obj.channel_type, obj.prefix, obj.sec, obj.sub, obj.dis, obj.dev, \
+            obj.idx, obj.propty, obj.field, obj._device_name, \
+            obj.area_name, obj.propty_name, obj.propty_suffix, \
+            obj.device_propty = _parse_name(pv_name, elements)
         return obj
 
+    def __getstate__(self):
+        """Return state for pickling."""
+        return tuple(getattr(self, attr) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """Set state from unpickling."""
+        for attr, value in zip(self.__slots__, state):
+            setattr(self, attr, value)
+
     @property
     def device_name(self):
         """."""
@@ -431,34 +483,159 @@ class Filter:
         elif isinstance(pvnames, str):
             pvnames = [pvnames]
 
-        # build filter regexp
-        fs = []
-        for fil in filters:
-            if 'sec' not in fil or fil['sec'] is None:
-                fil['sec'] = '[A-Z]{2,4}'
-            if 'sub' not in fil or fil['sub'] is None:
-                fil['sub'] = '\w{2,16}'
-            if 'dis' not in fil or fil['dis'] is None:
-                fil['dis'] = '[A-Z]{2,6}'
-            if 'dev' not in fil or fil['dev'] is None:
-                fil['dev'] = '.+'
-            pattern = (fil['sec'] + '-' + fil['sub'] + ':' +
-                       fil['dis'] + '-' + fil['dev'])
-            if 'idx' in fil:
-                pattern += '-' + fil['idx']
-            regexp = _re.compile(pattern)
-            fs.append(regexp)
-
-        # filter list
-        filtered_list = list()
-        for pvname in pvnames:
-            for pattern in fs:
-                if pattern.match(pvname):
-                    filtered_list.append(pvname)
-                    break
+        # NOTE: filters and indices of names are cached, so that repeated
+        # queries on the same names are fast.
+        pvnames = tuple(pvnames)
+        index = _get_names_index(pvnames)
+        idcs = set()
+        for spec in _get_filters_specs(filters):
+            idcs.update(index.find(spec))
+        filtered_list = [pvnames[idx] for idx in sorted(idcs)]
 
         if sorting is None:
             sorted_filtered_list = filtered_list
         elif sorting == 'length':
             raise NotImplementedError
         return sorted_filtered_list
+
+
+# --- private filter functions and classes ---
+
+_FILTER_DEFAULTS = {
+    'sec': '[A-Z]{2,4}',
+    'sub': r'\w{2,16}',
+    'dis': '[A-Z]{2,6}',
+    'dev': '.+',
+    }
+_FILTER_FIELDS = ('sec', 'sub', 'dis', 'dev', 'idx')
+_FILTER_LITERAL = _re.compile(r'\w+')
+_FILTER_LITERAL_PREFIX = _re.compile(r'(\w+)\.\*')
+_FILTER_CACHE_SIZE = 256
+_INDEX_CACHE_SIZE = 32
+
+# names split into section, subsection and discipline tokens and the rest.
+_NAME_TOKENS_REGEXP = _re.compile(
+    r'([^:\-]*)-([^:\-]*):([^:\-]*)-(.*)$', _re.DOTALL)
+
+
+def _get_filters_specs(filters):
+    """Return specs of filters, cached for hashable filters."""
+    try:
+        key = tuple(
+            tuple((fld, fil[fld]) for fld in _FILTER_FIELDS if fld in fil)
+            for fil in filters)
+        return _get_filters_specs_cached(key)
+    except TypeError:
+        return tuple(_get_filter_spec(fil) for fil in filters)
+
+
+@_lru_cache(maxsize=_FILTER_CACHE_SIZE)
+def _get_filters_specs_cached(key):
+    return tuple(_get_filter_spec(dict(fil)) for fil in key)
+
+
+def _get_filter_spec(fil):
+    """Return spec of a filter used by _NamesIndex.find.
+
+    Filters whose section, subsection and discipline patterns are literals
+    or defaults are matched with the indices of tokens of these fields, so
+    that only the device and index patterns need to be matched with
+    regexps. Other filters are matched with the full regexp.
+    """
+    fil = {
+        fld: fil[fld] for fld in _FILTER_FIELDS
+        if fld in fil and (fil[fld] is not None or fld == 'idx')}
+    pats = dict(_FILTER_DEFAULTS)
+    pats.update(fil)
+    pattern = (
+        pats['sec'] + '-' + pats['sub'] + ':' +
+        pats['dis'] + '-' + pats['dev'])
+    if 'idx' in fil:
+        pattern += '-' + fil['idx']
+
+    tokens = list()
+    for fld in ('sec', 'sub', 'dis'):
+        if fld not in fil:
+            tokens.append(_re.compile(pats[fld]))
+        elif _FILTER_LITERAL.fullmatch(fil[fld]):
+            tokens.append(fil[fld])
+        else:
+            return ('regexp', _re.compile(pattern))
+
+    dev = fil.get('dev')
+    mat = _FILTER_LITERAL_PREFIX.fullmatch(dev) if dev else None
+    if 'idx' in fil:
+        dev_prefix, tail = None, _re.compile(pats['dev'] + '-' + fil['idx'])
+    elif dev and _FILTER_LITERAL.fullmatch(dev):
+        dev_prefix, tail = dev, None
+    elif mat:
+        dev_prefix, tail = mat.group(1), None
+    else:
+        dev_prefix, tail = None, _re.compile(pats['dev'])
+    return ('index', tuple(tokens), dev_prefix, tail)
+
+
+@_lru_cache(maxsize=_INDEX_CACHE_SIZE)
+def _get_names_index(pvnames):
+    return _NamesIndex(pvnames)
+
+
+class _NamesIndex:
+    """Index of names by their section, subsection and discipline tokens."""
+
+    def __init__(self, pvnames):
+        self._pvnames = pvnames
+        self._tokens = (dict(), dict(), dict())
+        self._devs = dict()
+        self._rests = dict()
+        self._found = dict()
+        for idx, pvname in enumerate(pvnames):
+            mat = _NAME_TOKENS_REGEXP.match(pvname)
+            if mat is None:
+                # NOTE: these names only match filters of full regexps.
+                continue
+            *tokens, rest = mat.groups()
+            for token, index in zip(tokens, self._tokens):
+                index.setdefault(token, set()).add(idx)
+            self._devs.setdefault(rest.split('-', 1)[0], set()).add(idx)
+            self._rests[idx] = rest
+
+    def find(self, spec):
+        """Return indices of names matching filter spec."""
+        idcs = self._found.get(spec)
+        if idcs is None:
+            idcs = frozenset(self._find(spec))
+            self._found[spec] = idcs
+        return idcs
+
+    def _find(self, spec):
+        if spec[0] == 'regexp':
+            regexp = spec[1]
+            return [
+                idx for idx, pvname in enumerate(self._pvnames)
+                if regexp.match(pvname)]
+
+        _, tokens, dev_prefix, tail = spec
+        # NOTE: patterns of literals or defaults of these fields do not
+        # match separators, so regexps match the whole name tokens.
+        cands = None
+        for token, index in zip(tokens, self._tokens):
+            if isinstance(token, str):
+                idcs = index.get(token, set())
+            else:
+                idcs = set()
+                for tkn, tidcs in index.items():
+                    if token.fullmatch(tkn):
+                        idcs |= tidcs
+            cands = idcs if cands is None else cands & idcs
+            if not cands:
+                return cands
+        if dev_prefix is not None:
+            idcs = set()
+            for dev, didcs in self._devs.items():
+                if dev.startswith(dev_prefix):
+                    idcs |= didcs
+            cands &= idcs
+        if tail is not None:
+            cands = {idx for idx in cands if tail.match(self._rests[idx])}
+        return cands
@@ -144,6 +144,14 @@ class PSBSMP(_BSMP):
 
         return response
 
+    def read_group_of_variables_load(
+            self, group_id, timeout=_timeout_read_group_of_variables):
+        """."""
+        response = super().read_group_of_variables_load(
+            group_id=group_id, timeout=timeout)
+
+        return response
+
     def query_list_of_group_of_variables(
             self, timeout=_timeout_query_list_of_group_of_variables):
         """."""
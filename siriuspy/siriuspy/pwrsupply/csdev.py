@@ -1,5 +1,7 @@
 """Power Supply Control System Devices epics database functions."""
 
+import pickle as _pickle
+
 import numpy as _np
 
 # from pcaspy import Severity as _Severity
@@ -741,6 +743,10 @@ class ETypes(_csdev.ETypes):
 
 _et = ETypes  # syntactic sugar
 
+# NOTE: databases of each (psmodel, pstype) are built on first use and
+#       copies are made from them, which is much faster than building them.
+_PS_DATABASES = dict()  # (psmodel, pstype) -> dbase
+
 
 # --- Const class ---
 
@@ -762,28 +768,51 @@ class Const(_csdev.Const):
 # --- Main power supply database functions ---
 
 
-def get_ps_propty_database(psmodel=None, pstype=None, psname=None):
-    """Return epics properties database for a power supply model and type."""
+def get_ps_propty_database(
+        psmodel=None, pstype=None, psname=None, copy=True):
+    """Return epics properties database for a power supply model and type.
+
+    Databases are built only once for each model and type. If copy is
+    False, the database shared by all callers is returned and it must not
+    be modified.
+    """
     # in case psname is given
     if psname is not None:
         psmodel = _PSSearch.conv_psname_2_psmodel(psname)
         pstype = _PSSearch.conv_psname_2_pstype(psname)
 
-    # get dbase for a psecific psmodel
-    dbase = _get_model_db(psmodel)
+    dbase = _get_ps_propty_database(psmodel, pstype)
+    return _copy_database(dbase) if copy else dbase
 
-    # insert corresponding strengths
-    dbase = _insert_strengths(dbase, pstype)
 
-    # update limits
-    _set_limits(pstype, dbase)
+def save_ps_propty_databases(fname, psmodels_pstypes=None):
+    """Save power supply databases to a cache file.
 
-    # add pvs list as Properties-Cte
-    if not psmodel.startswith('FP_'):
-        dbase = _csdev.add_pvslist_cte(dbase)
+    psmodels_pstypes is a list of (psmodel, pstype) tuples. If None, the
+    databases of all power supplies are saved.
+    """
+    if psmodels_pstypes is None:
+        psmodels_pstypes = set()
+        for psname in _PSSearch.get_psnames(filter_auxps=False):
+            psmodels_pstypes.add((
+                _PSSearch.conv_psname_2_psmodel(psname),
+                _PSSearch.conv_psname_2_pstype(psname)))
+    cache = dict()
+    for psmodel, pstype in psmodels_pstypes:
+        cache[(psmodel, pstype)] = _get_ps_propty_database(psmodel, pstype)
+    with open(fname, 'wb') as fil:
+        _pickle.dump(cache, fil, protocol=_pickle.HIGHEST_PROTOCOL)
 
-    # return database
-    return dbase
+
+def load_ps_propty_databases(fname):
+    """Load power supply databases from a cache file.
+
+    Cached databases are not built again, so the cache file has to be
+    created with the same versions of siriuspy and of the web server data.
+    """
+    with open(fname, 'rb') as fil:
+        cache = _pickle.load(fil)
+    _PS_DATABASES.update(cache)
 
 
 def get_conv_propty_database(pstype=None, psname=None):
@@ -2547,6 +2576,44 @@ def _set_limits(pstype, database):
             dbase['prec'] = PS_CURRENT_PRECISION
 
 
+def _get_ps_propty_database(psmodel, pstype):
+    dbase = _PS_DATABASES.get((psmodel, pstype))
+    if dbase is None:
+        dbase = _build_ps_propty_database(psmodel, pstype)
+        _PS_DATABASES[(psmodel, pstype)] = dbase
+    return dbase
+
+
+def _copy_database(dbase):
+    # NOTE: only mutable values are copied, as a deepcopy would, but
+    #       without the overhead of deepcopy.
+    dbcopy = dict()
+    for propty, pvdb in dbase.items():
+        pvdb = dict(pvdb)
+        for field, value in pvdb.items():
+            if isinstance(value, (_np.ndarray, list)):
+                pvdb[field] = value.copy()
+        dbcopy[propty] = pvdb
+    return dbcopy
+
+
+def _build_ps_propty_database(psmodel, pstype):
+    # get dbase for a psecific psmodel
+    dbase = _get_model_db(psmodel)
+
+    # insert corresponding strengths
+    dbase = _insert_strengths(dbase, pstype)
+
+    # update limits
+    _set_limits(pstype, dbase)
+
+    # add pvs list as Properties-Cte
+    if not psmodel.startswith('FP_'):
+        dbase = _csdev.add_pvslist_cte(dbase)
+
+    return dbase
+
+
 def _get_model_db(psmodel):
     psmodel_2_dbfunc = {
         'FBP': _get_ps_FBP_propty_database,
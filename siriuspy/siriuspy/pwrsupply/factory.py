@@ -86,7 +86,8 @@ class BBBFactory:
                                             processing=False,
                                             scanning=False,
                                             freq=freq,
-                                            init=False)
+                                            init=False,
+                                            batched=True)
 
             devname2devid = dict()
             readers, writers = dict(), dict()
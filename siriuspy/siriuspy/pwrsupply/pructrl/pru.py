@@ -53,6 +53,12 @@ class PRUInterface(_IOInterface):
         ret = self._UART_request(stream, timeout=timeout)
         return ret
 
+    def UART_request_bytes(self, stream, timeout):
+        """Write bytes stream to serial port then read bytes response."""
+        self._timestamp_write = _time.time()
+        ret = self._UART_request_bytes(stream, timeout=timeout)
+        return ret
+
     # --- pure virtual methods ---
 
     def _UART_write(self, stream, timeout):
@@ -64,6 +70,10 @@ class PRUInterface(_IOInterface):
     def _UART_request(self, stream, timeout):
         raise NotImplementedError
 
+    def _UART_request_bytes(self, stream, timeout):
+        # default goes through the char-list request.
+        return _IOInterface.UART_request_bytes(self, stream, timeout)
+
     def _close(self):
         raise NotImplementedError
 
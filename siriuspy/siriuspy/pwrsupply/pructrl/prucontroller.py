@@ -10,6 +10,8 @@ from copy import deepcopy as _dcopy
 from threading import Thread as _Thread
 from threading import Lock as _Lock
 
+import numpy as _np
+
 from ...bsmp import SerialError as _SerialError
 
 from ..bsmp.constants import _const_bsmp
@@ -42,8 +44,14 @@ class PRUController:
                  processing=False,
                  scanning=False,
                  freq=None,
-                 init=True):
-        """Init."""
+                 init=True,
+                 batched=False):
+        """Init.
+
+        In batched mode, scans read the variables of all devices
+        back-to-back and decode them at once into a table of variables
+        (devices x variables), from which variables are read.
+        """
         # --- Init structures ---
 
         print()
@@ -85,6 +93,11 @@ class PRUController:
         self._scope_update = False
         self._scope_update_dev_idx = 0  # cyclical updates!
 
+        # table of variables of all devices, for batched scans
+        self._batched = batched
+        self._variables_table = \
+            self._init_variables_table() if batched else None
+
         # update time interval attribute
         self._scan_interval = self._get_scan_interval()
 
@@ -136,6 +149,11 @@ class PRUController:
         """Store number of operations currently in the queue."""
         return len(self._queue)
 
+    @property
+    def batched(self):
+        """Return whether scans read variables in batches."""
+        return self._batched
+
     @property
     def params(self):
         """Return PRUController parameters."""
@@ -187,6 +205,21 @@ class PRUController:
         else:
             dev_ids = device_ids
 
+        if self._batched:
+            # values are read from the table of variables as new objects,
+            # no copies are needed.
+            values = dict()
+            with self._lock:
+                for dev_id in dev_ids:
+                    if variable_id is None:
+                        values[dev_id] = self._psupplies[dev_id].variables
+                    else:
+                        values[dev_id] = \
+                            self._psupplies[dev_id].get_variable(variable_id)
+            if isinstance(device_ids, int):
+                return values[device_ids]
+            return values
+
         # builds dict of requested values
         values = dict()
         for dev_id in dev_ids:
@@ -202,6 +235,16 @@ class PRUController:
                 return _dcopy(values[device_ids])
             return _dcopy(values)
 
+    def read_variables_table(self):
+        """Return copy of table of variables, in batched mode.
+
+        Rows follow sorted device ids and fields are named 'v<var_id>'.
+        """
+        if not self._batched:
+            return None
+        with self._lock:
+            return self._variables_table.copy()
+
     def read_parameters(self, device_ids, parameter_id=None):
         """Return power supply parameters."""
         # process device_ids
@@ -450,6 +493,14 @@ class PRUController:
         dt_ = _time.time() - t0_
         print(fmt.format('init_threads', 'create structures', 1e3*dt_))
 
+    def _init_variables_table(self):
+        # table rows follow sorted device ids
+        group = self._get_group_all()
+        table = _np.zeros(len(self._device_ids), dtype=group.dtype)
+        for index, dev_id in enumerate(self._device_ids):
+            self._psupplies[dev_id].bind_variables_table(table, index)
+        return table
+
     @staticmethod
     def _init_udc(pru, psmodel_name, device_ids, freq):
 
@@ -543,6 +594,10 @@ class PRUController:
             psupply = self._psupplies[dev_id]
             psupply._connected = False
 
+    def _get_group_all(self):
+        psbsmp = self._udc[self._device_ids[0]]
+        return psbsmp.entities.groups[psbsmp.CONST.G_ALL]
+
     def _check_groups(self):
         group_ids = sorted(self._parms.groups.keys())
 
@@ -612,6 +667,10 @@ class PRUController:
         #     'PRUC._bsmp_update (end)', 1e3*(_time.time() % 1)))
 
     def _bsmp_update_variables(self, dev_id=None):
+        if self._batched:
+            self._bsmp_update_variables_batched(dev_id)
+            return
+
         if dev_id is None:
             psupplies = self._psupplies.values()
         else:
@@ -624,6 +683,24 @@ class PRUController:
                 # no serial connection !
                 pass
 
+    def _bsmp_update_variables_batched(self, dev_id=None):
+        # group reads are issued back-to-back and their loads are then
+        # decoded at once into the table of variables.
+        loads = [None] * len(self._device_ids)
+        for index, dev_id_ in enumerate(self._device_ids):
+            if dev_id is not None and dev_id_ != dev_id:
+                continue
+            try:
+                loads[index] = self._psupplies[dev_id_].read_variables_load()
+            except _SerialError:
+                # no serial connection !
+                pass
+
+        # rows of devices whose loads could not be read are left untouched
+        group = self._get_group_all()
+        with self._lock:
+            group.loads_to_array(loads, self._variables_table)
+
     def _bsmp_update_wfm(self, device_id):
         """Read curve from devices."""
         psupplies = self._psupplies
@@ -765,6 +842,10 @@ class PRUController:
 
     def _bsmp_init_variable_values(self):
 
+        if self._batched:
+            self._bsmp_update_variables()
+            return
+
         # init psupplies variables
         for psupply in self._psupplies.values():
             psupply.update_variables(interval=0.0)
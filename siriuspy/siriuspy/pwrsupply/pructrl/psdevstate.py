@@ -40,6 +40,8 @@ class PSDevState:
         self._connected = None
         self._groups = PSDevState._init_groups()
         self._variables = PSDevState._init_variables()
+        self._variables_table = None
+        self._variables_index = None
         self._curves = PSDevState._init_curves()
         self._parameters = self._init_parameters()
         self._wfmref_rb = None
@@ -84,17 +86,17 @@ class PSDevState:
     def wfmref_index(self):
         """Return current index into DSP selected curve."""
         curve_id = \
-            self._variables[self._psbsmp.CONST.V_WFMREF_SELECTED]
+            self.get_variable(self._psbsmp.CONST.V_WFMREF_SELECTED)
         if curve_id == 0:
-            beg = self._variables[
-                self._psbsmp.CONST.V_WFMREF0_START]
-            end = self._variables[
-                self._psbsmp.CONST.V_WFMREF0_END]
+            beg = self.get_variable(
+                self._psbsmp.CONST.V_WFMREF0_START)
+            end = self.get_variable(
+                self._psbsmp.CONST.V_WFMREF0_END)
         else:
-            beg = self._variables[
-                self._psbsmp.CONST.V_WFMREF1_START]
-            end = self._variables[
-                self._psbsmp.CONST.V_WFMREF1_END]
+            beg = self.get_variable(
+                self._psbsmp.CONST.V_WFMREF1_START)
+            end = self.get_variable(
+                self._psbsmp.CONST.V_WFMREF1_END)
         index = self._psbsmp.curve_index_calc(beg, end)
         return index
 
@@ -106,6 +108,10 @@ class PSDevState:
     @property
     def variables(self):
         """."""
+        if self._variables_table is not None:
+            return {
+                int(name[1:]): self._get_table_variable(name)
+                for name in self._variables_table.dtype.names}
         return self._variables
 
     @property
@@ -126,8 +132,20 @@ class PSDevState:
 
     def get_variable(self, var_id):
         """."""
+        if self._variables_table is not None:
+            return self._get_table_variable('v{}'.format(var_id))
         return self._variables[var_id]
 
+    def bind_variables_table(self, table, index):
+        """Read variables from a row of a table, updated by its owner.
+
+        The table is a structured array with the dtype of the group of all
+        variables (see VariablesGroup.loads_to_array), whose rows are
+        updated in bulk with loads from 'read_variables_load'.
+        """
+        self._variables_table = table
+        self._variables_index = index
+
     def get_parameter(self, eid):
         """."""
         return self._parameters[eid]
@@ -205,6 +223,20 @@ class PSDevState:
                 return False
         return True
 
+    @_psupply_update_connected
+    def read_variables_load(self):
+        """Read load of the group of all variables, without decoding it.
+
+        Returns None if the load could not be read.
+        """
+        group_id = self._psbsmp.CONST.G_ALL
+        ack, load = self._psbsmp.read_group_of_variables_load(
+            group_id=group_id)
+        if ack != self.psbsmp.CONST_BSMP.ACK_OK:
+            return None
+        self._timestamp_update_variables = _time.time()
+        return load
+
     @_psupply_update_connected
     def update_wfm(self, interval=None):
         """Update wfmref."""
@@ -275,6 +307,16 @@ class PSDevState:
 
     # --- private methods ---
 
+    def _get_table_variable(self, name):
+        table, index = self._variables_table, self._variables_index
+        if table.dtype[name].base.kind == 'S':
+            # NOTE: numpy strips null chars from bytes items, so chars are
+            # rebuilt from their codes.
+            codes = table[name][index:index+1].view(_np.uint8).ravel()
+            chars = [bytes((code, )) for code in codes]
+            return chars if table.dtype[name].shape else chars[0]
+        return table[name][index].tolist()
+
     @staticmethod
     def _init_groups():
         # NOTE: template to be expanded, if necessary.
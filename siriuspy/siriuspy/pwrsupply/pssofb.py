@@ -1,7 +1,8 @@
 """PSSOFB class."""
 from copy import deepcopy as _dcopy
-from collections.abc import Iterable
+import functools as _functools
 import logging as _log
+import time as _time
 import multiprocessing as _mp
 from multiprocessing import sharedctypes as _shm
 
@@ -14,6 +15,7 @@ from ..search import PSSearch as _PSSearch
 from ..bsmp import SerialError as _SerialError
 from ..bsmp import constants as _const_bsmp
 from ..devices import StrengthConv as _StrengthConv
+from ..magnet.normalizer import BatchNormalizer as _BatchNormalizer
 from ..epics import CAProcessSpawn as _Process
 
 from .bsmp.constants import ConstFBP as _const_fbp
@@ -36,6 +38,41 @@ class _BBBThread(_AsyncWorker):
         return super().configure_new_run(target, args_)
 
 
+def _timed(phase, row=None):
+    """Decorate methods to record their latencies.
+
+    Latencies are recorded in 'row' or, if it is None, in the row of the
+    beaglebone name given as first method argument.
+    """
+    def decorator(method):
+        @_functools.wraps(method)
+        def wrapper(self, *args):
+            time0 = _time.perf_counter()
+            try:
+                return method(self, *args)
+            finally:
+                dtime = 1000*(_time.perf_counter() - time0)
+                self.timings.record(
+                    args[0] if row is None else row, phase, dtime)
+        return wrapper
+    return decorator
+
+
+class _ConverterTimed:
+    """Unit conversions recording their latencies."""
+
+    # latency recorder row of unit conversions
+    CONVERTER_ROW = 'UnitConverter'
+
+    @_timed('conversion', row=CONVERTER_ROW)
+    def _conv_stren2curr(self, strength):
+        return self.converter.conv_stren2curr(strength)
+
+    @_timed('conversion', row=CONVERTER_ROW)
+    def _conv_curr2stren(self, current):
+        return self.converter.conv_curr2stren(current)
+
+
 class PSNamesSOFB:
     """."""
 
@@ -72,6 +109,7 @@ class UnitConverter:
         """."""
         self.psnames = psnames
         self._pstype_2_index, self._pstype_2_sconv = self._init_strenconv()
+        self._normalizer = self._init_normalizer()
 
     def _init_strenconv(self):
         # 1. create pstype to StrengthConv dictionary.
@@ -100,42 +138,166 @@ class UnitConverter:
 
         return pstype_2_index, pstype_2_sconv
 
+    def _init_normalizer(self):
+        # correctors of the same pstype share their normalizers.
+        normalizers = [None] * len(self.psnames)
+        for pstype, index in self._pstype_2_index.items():
+            normalizer = self._pstype_2_sconv[pstype].normalizer
+            for idx in index:
+                normalizers[idx] = normalizer
+        return _BatchNormalizer(normalizers)
+
     def conv_curr2stren(self, current):
         """."""
-        # benchmarks:
-        # 0.163 ms (normalizer)
-        # 0.277 ms (sconv)
-        strength = _np.zeros(len(current))
-        for pstype, index in self._pstype_2_index.items():
-            sconv = self._pstype_2_sconv[pstype]
-            value = current[index]
-            # stren = sconv.conv_current_2_strength(
-            #     currents=value, strengths_dipole=self._strengths_dipole)
-            stren = sconv.conv_current_2_strength(currents=value)
-            strength[index] = stren
-        return strength
+        strengths_dipole = self._get_strengths_dipole()
+        if strengths_dipole is None:
+            return _np.full(len(current), _np.nan, dtype=float)
+        return self._normalizer.conv_current_2_strength(
+            current, strengths_dipole)
 
     def conv_stren2curr(self, strength):
         """."""
-        # benchmarks:
-        # 0.112 ms (normalizer)
-        # 0.189 ms (sconv)
-        current = _np.full(len(strength), _np.nan, dtype=float)
-        for pstype, index in self._pstype_2_index.items():
-            sconv = self._pstype_2_sconv[pstype]
-            value = strength[index]
-            # idcs = ~_np.isnan(value)
-            # curr = sconv.conv_strength_2_current(
-            #     strengths=value[idcs],
-            #     strengths_dipole=self._strengths_dipole)
-            # curr = sconv.conv_strength_2_current(strengths=value[idcs])
-            # current[index[idcs]] = curr
-            curr = sconv.conv_strength_2_current(strengths=value)
-            current[index] = curr
-        return current
+        strengths_dipole = self._get_strengths_dipole()
+        if strengths_dipole is None:
+            return _np.full(len(strength), _np.nan, dtype=float)
+        return self._normalizer.conv_strength_2_current(
+            strength, strengths_dipole)
+
+    def _get_strengths_dipole(self):
+        # all correctors share the same dipole.
+        sconv = next(iter(self._pstype_2_sconv.values()))
+        return sconv.dipole_strength
+
+
+class LatencyRecorder:
+    """Ring buffers of latencies of SOFB correction phases.
+
+    Latencies [ms] are recorded per row (beaglebone names, in general) and
+    phase in fixed-size ring buffers, from which histogram statistics are
+    computed. Buffers may be provided so that rows are recorded by
+    different processes.
+    """
 
+    PHASES = ('setpoint', 'update', 'state', 'conversion')
+    STATS = ('p50', 'p99', 'max')
+    DEFAULT_SIZE = 1000
 
-class PSConnSOFB:
+    def __init__(self, rows, size=DEFAULT_SIZE, buffers=None):
+        """."""
+        self._rows = tuple(rows)
+        self._row_2_index = {row: i for i, row in enumerate(self._rows)}
+        self._size = size
+        shape = (len(self._rows), len(LatencyRecorder.PHASES))
+        if buffers is None:
+            self._data = _np.full(shape + (size, ), _np.nan)
+            self._count = _np.zeros(shape, dtype=_np.int64)
+        else:
+            data, count = buffers
+            self._data = _np.ndarray(
+                shape + (size, ), dtype=float, buffer=memoryview(data))
+            self._count = _np.ndarray(
+                shape, dtype=_np.int64, buffer=memoryview(count))
+
+    @staticmethod
+    def create_buffers(nr_rows, size=DEFAULT_SIZE):
+        """Return shared memory buffers for a given number of rows."""
+        nr_phases = len(LatencyRecorder.PHASES)
+        data = _shm.Array(
+            _shm.ctypes.c_double, nr_rows*nr_phases*size, lock=False)
+        data[:] = [_np.nan] * len(data)
+        count = _shm.Array(_shm.ctypes.c_int64, nr_rows*nr_phases, lock=False)
+        return data, count
+
+    @property
+    def rows(self):
+        """Return row names."""
+        return self._rows
+
+    @property
+    def size(self):
+        """Return ring buffers size."""
+        return self._size
+
+    def record(self, row, phase, dtime):
+        """Record latency [ms] of a phase."""
+        irow = self._row_2_index[row]
+        iphase = LatencyRecorder.PHASES.index(phase)
+        count = self._count[irow, iphase]
+        self._data[irow, iphase, count % self._size] = dtime
+        self._count[irow, iphase] = count + 1
+
+    def reset(self):
+        """Discard all recorded latencies."""
+        self._data[:] = _np.nan
+        self._count[:] = 0
+
+    def get_latencies(self, row, phase):
+        """Return latencies [ms] in the ring buffer of a row and phase."""
+        irow = self._row_2_index[row]
+        iphase = LatencyRecorder.PHASES.index(phase)
+        nrpts = min(self._count[irow, iphase], self._size)
+        return self._data[irow, iphase, :nrpts].copy()
+
+    def get_histogram(self, phase):
+        """Return dictionary with p50, p99 and max latency vectors [ms].
+
+        Vectors are in row order and have NaN for rows with no records.
+        """
+        iphase = LatencyRecorder.PHASES.index(phase)
+        data = self._data[:, iphase, :]
+        hist = {stat: _np.full(len(self._rows), _np.nan)
+                for stat in LatencyRecorder.STATS}
+        valid = _np.any(~_np.isnan(data), axis=1)
+        if _np.any(valid):
+            data = data[valid]
+            hist['p50'][valid] = _np.nanpercentile(data, 50, axis=1)
+            hist['p99'][valid] = _np.nanpercentile(data, 99, axis=1)
+            hist['max'][valid] = _np.nanmax(data, axis=1)
+        return hist
+
+    def get_worst(self, phase, stat='p99'):
+        """Return row with largest latency statistic and its value [ms]."""
+        values = self.get_histogram(phase)[stat]
+        if _np.all(_np.isnan(values)):
+            return None, _np.nan
+        idx = _np.nanargmax(values)
+        return self._rows[idx], values[idx]
+
+    def get_database(self, prefix=''):
+        """Return PV database of latency statistics."""
+        dbase = dict()
+        for phase, stat in self._phases_stats():
+            pvname = prefix + self._pvname(phase, stat)
+            dbase[pvname] = {
+                'type': 'float', 'count': len(self._rows),
+                'value': _np.zeros(len(self._rows)),
+                'unit': 'ms', 'prec': 3}
+        return dbase
+
+    def get_values(self, prefix=''):
+        """Return dictionary of PV names and latency statistics values."""
+        values = dict()
+        for phase in LatencyRecorder.PHASES:
+            hist = self.get_histogram(phase)
+            for stat in LatencyRecorder.STATS:
+                pvname = prefix + self._pvname(phase, stat)
+                values[pvname] = _np.nan_to_num(hist[stat])
+        return values
+
+    # --- private methods ---
+
+    @staticmethod
+    def _phases_stats():
+        for phase in LatencyRecorder.PHASES:
+            for stat in LatencyRecorder.STATS:
+                yield phase, stat
+
+    @staticmethod
+    def _pvname(phase, stat):
+        return 'Latency' + phase.capitalize() + stat.capitalize() + '-Mon'
+
+
+class PSConnSOFB(_ConverterTimed):
     """."""
 
     MAX_NR_DEVS = _PSSOFB_MAX_NR_UDC * _UDC_MAX_NR_DEV
@@ -150,7 +312,7 @@ class PSConnSOFB:
         # check arguments
         if mproc is not None and \
                 (not isinstance(mproc, dict) or
-                 set(mproc.keys()) != {'rbref', 'ref', 'fret'}):
+                 set(mproc.keys()) - {'timings'} != {'rbref', 'ref', 'fret'}):
             raise ValueError('Invalid mproc dictionary!')
 
         self._acc = 'SI'
@@ -181,6 +343,14 @@ class PSConnSOFB:
             self._sofb_current_refmon = arr.copy()
             self._sofb_func_return = _np.zeros(ncorrs, dtype=int)
 
+        # latencies of bsmp communications and unit conversions
+        if mproc and 'timings' in mproc:
+            rows, size, buffers = mproc['timings']
+            self.timings = LatencyRecorder(rows, size=size, buffers=buffers)
+        else:
+            self.timings = LatencyRecorder(
+                tuple(self.bbbnames) + (PSConnSOFB.CONVERTER_ROW, ))
+
         # create sofb and bsmp indices
         self.indcs_bsmp, self.indcs_sofb = self._create_indices()
 
@@ -225,17 +395,18 @@ class PSConnSOFB:
 
     def bsmp_sofb_kick_set(self, kick):
         """Send kick sofb setpoint to power supplies."""
-        current = self.converter.conv_stren2curr(kick)
+        current = self._conv_stren2curr(kick)
         self.bsmp_sofb_current_set(current)
         return current
 
     def bsmp_sofb_current_set_update(self, current):
         """Send current sofb setpoint to power supplies and update."""
-        self._parallel_execution(self._bsmp_current_setpoint_update, current)
+        self._parallel_execution(
+            self._bsmp_current_setpoint_update, (current, ))
 
     def bsmp_sofb_kick_set_update(self, kick):
         """Send kick sofb setpoint to power supplies and update."""
-        current = self.converter.conv_stren2curr(kick)
+        current = self._conv_stren2curr(kick)
         self.bsmp_sofb_current_set_update(current)
         return current
 
@@ -282,14 +453,14 @@ class PSConnSOFB:
     def sofb_kick_refmon(self):
         """Return SOFB kick Ref-Mon vector, as last updated."""
         current = self.sofb_current_refmon
-        strength = self.converter.conv_curr2stren(current)
+        strength = self._conv_curr2stren(current)
         return strength
 
     @property
     def sofb_kick_readback_ref(self):
         """Return SOFB kick from current_readback_ref from last setpoint."""
         current = self.sofb_current_readback_ref
-        strength = self.converter.conv_curr2stren(current)
+        strength = self._conv_curr2stren(current)
         return strength
 
     @property
@@ -369,6 +540,7 @@ class PSConnSOFB:
         for thr in self._threads:
             thr.wait_ready()
 
+    @_timed('update')
     def _bsmp_update_current(self, bbbname):
         """Update SOFB parameters of a single beaglebone."""
         udc = self._udc[bbbname]
@@ -379,6 +551,7 @@ class PSConnSOFB:
         # update currents
         self._update_currents(bbbname)
 
+    @_timed('setpoint')
     def _bsmp_current_setpoint(self, bbbname, curr_sp):
         """Set currents for a single beaglebone."""
         udc = self._udc[bbbname]
@@ -427,6 +600,7 @@ class PSConnSOFB:
         self._bsmp_current_setpoint(bbbname, curr_sp)
         self._bsmp_update_current(bbbname)
 
+    @_timed('state')
     def _bsmp_update_state(self, bbbname):
         udc = self._udc[bbbname]
         devices = self.bbb2devs[bbbname]
@@ -631,7 +805,7 @@ class PSConnSOFB:
         return pru, udc
 
 
-class PSSOFB:
+class PSSOFB(_ConverterTimed):
     """."""
 
     BBBNAMES = (
@@ -678,6 +852,23 @@ class PSSOFB:
         )
     BBB2DEVS = dict()
 
+    # commands executed by worker processes, identified by their indices.
+    _COMMANDS = (
+        'bsmp_sofb_current_set',
+        'bsmp_sofb_current_set_update',
+        'bsmp_update_sofb',
+        'bsmp_update_state',
+        'bsmp_pwrstate_on',
+        'bsmp_pwrstate_off',
+        'bsmp_slowref',
+        'bsmp_slowrefsync',
+        )
+    _COMMANDS_SETPOINT = (
+        'bsmp_sofb_current_set',
+        'bsmp_sofb_current_set_update',
+        )
+    _CMD_SHUTDOWN = -1
+
     def __init__(self, ethbridgeclnt_class, nr_procs=8, asynchronous=False,
                  sofb_update_iocs=False):
         """."""
@@ -699,12 +890,22 @@ class PSSOFB:
         # Unit converter.
         self.converter = UnitConverter(self._sofb_psnames)
 
+        # latencies of bsmp communications and unit conversions
+        self.timings = LatencyRecorder(
+            PSSOFB.BBBNAMES + (PSConnSOFB.CONVERTER_ROW, ))
+
+        # sofb index of each corrector
+        self._sofb_psname_2_index = {
+            psname: i for i, psname in enumerate(self._sofb_psnames)}
+
         # Worker Processes control and synchronization
         self._ethbridge_cls = ethbridgeclnt_class
         self._nr_procs = nr_procs
+        self._sofb_current_setpoint = arr.copy()
+        self._command = None
+        self._startevts = []
         self._doneevts = []
         self._procs = []
-        self._pipes = []
 
     # --- General class properties ---
 
@@ -741,8 +942,15 @@ class PSSOFB:
         spw = _mp.get_context('spawn')
 
         # Create shared memory objects to be shared with worker processes.
+        # Vectors are in sofb order (see sofb_conv_psname_2_index), so
+        # that each cycle only the command id travels through shared
+        # memory and workers are signalled through events.
         arr = self._sofb_current_readback_ref
 
+        spoint = _shm.Array(_shm.ctypes.c_double, arr.size, lock=False)
+        self._sofb_current_setpoint = _np.ndarray(
+            arr.shape, dtype=arr.dtype, buffer=memoryview(spoint))
+
         rbref = _shm.Array(_shm.ctypes.c_double, arr.size, lock=False)
         self._sofb_current_readback_ref = _np.ndarray(
             arr.shape, dtype=arr.dtype, buffer=memoryview(rbref))
@@ -755,6 +963,14 @@ class PSSOFB:
         self._sofb_func_return = _np.ndarray(
             arr.shape, dtype=_np.int32, buffer=memoryview(fret))
 
+        self._command = _shm.Value(_shm.ctypes.c_int, 0, lock=False)
+
+        # latencies are recorded by worker processes in shared buffers.
+        rows, size = self.timings.rows, self.timings.size
+        buffers = LatencyRecorder.create_buffers(len(rows), size)
+        self.timings = LatencyRecorder(rows, size=size, buffers=buffers)
+        timings = (rows, size, buffers)
+
         # Unit converter.
         self.converter = UnitConverter(self._sofb_psnames)
 
@@ -767,24 +983,29 @@ class PSSOFB:
             bbbnames = PSSOFB.BBBNAMES[sub[i]:sub[i+1]]
             # NOTE: It is crucial to use the Event class from the appropriate
             # context, otherwise it will fail for 'spawn' start method.
+            startevt = spw.Event()
             doneevt = spw.Event()
             doneevt.set()
-            theirs, mine = spw.Pipe(duplex=False)
             proc = _Process(
                 target=PSSOFB._run_process,
-                args=(self._ethbridge_cls, bbbnames, theirs, doneevt,
-                      arr.shape, rbref, ref, fret, self._sofb_update_iocs),
+                args=(self._ethbridge_cls, bbbnames, startevt, doneevt,
+                      arr.shape, self._command, spoint, rbref, ref, fret,
+                      timings, self._sofb_update_iocs),
                 daemon=True)
             proc.start()
             self._procs.append(proc)
+            self._startevts.append(startevt)
             self._doneevts.append(doneevt)
-            self._pipes.append(mine)
 
     def processes_shutdown(self):
         """."""
-        for pipe in self._pipes:
-            pipe.send(None)
-            pipe.close()
+        if self._command is None or not self._procs:
+            # processes were not started.
+            return
+        self.wait()
+        self._command.value = PSSOFB._CMD_SHUTDOWN
+        for startevt in self._startevts:
+            startevt.set()
         for proc in self._procs:
             proc.join()
 
@@ -792,20 +1013,20 @@ class PSSOFB:
 
     def bsmp_sofb_current_set(self, current):
         """Send current sofb setpoint to power supplies."""
-        self._parallel_execution('bsmp_sofb_current_set', (current, ))
+        self._parallel_execution('bsmp_sofb_current_set', current)
 
     def bsmp_sofb_kick_set(self, kick):
         """Send kick sofb setpoint to power supplies."""
-        current = self.converter.conv_stren2curr(kick)
+        current = self._conv_stren2curr(kick)
         self.bsmp_sofb_current_set(current)
 
     def bsmp_sofb_current_set_update(self, current):
         """Send current sofb setpoint to power supplies and update."""
-        self._parallel_execution('bsmp_sofb_current_set_update', (current, ))
+        self._parallel_execution('bsmp_sofb_current_set_update', current)
 
     def bsmp_sofb_kick_set_update(self, kick):
         """Send kick sofb setpoint to power supplies and update."""
-        current = self.converter.conv_stren2curr(kick)
+        current = self._conv_stren2curr(kick)
         self.bsmp_sofb_current_set_update(current)
 
     def bsmp_update_sofb(self):
@@ -852,12 +1073,12 @@ class PSSOFB:
     @property
     def sofb_kick_refmon(self):
         """Return SOFB kick from current_readback_ref from last setpoint."""
-        return self.converter.conv_curr2stren(self.sofb_current_refmon)
+        return self._conv_curr2stren(self.sofb_current_refmon)
 
     @property
     def sofb_kick_readback_ref(self):
         """Return SOFB kick from current_readback_ref from last setpoint."""
-        return self.converter.conv_curr2stren(self.sofb_current_readback_ref)
+        return self._conv_curr2stren(self.sofb_current_readback_ref)
 
     @property
     def sofb_func_return(self):
@@ -876,44 +1097,53 @@ class PSSOFB:
 
     def sofb_conv_psname_2_index(self, psname):
         """."""
-        return self._sofb_psnames.index(psname)
+        return self._sofb_psname_2_index[psname]
 
     @staticmethod
     def _run_process(
-            ethbridgeclnt_class, bbbnames, pipe, doneevt,
-            shape, rbref, ref, fret, sofb_update_iocs):
+            ethbridgeclnt_class, bbbnames, startevt, doneevt,
+            shape, command, spoint, rbref, ref, fret, timings,
+            sofb_update_iocs):
         """."""
+        setpoint = _np.ndarray(shape, dtype=float, buffer=memoryview(spoint))
         mproc = {
             'rbref': _np.ndarray(shape, dtype=float, buffer=memoryview(rbref)),
             'ref': _np.ndarray(shape, dtype=float, buffer=memoryview(ref)),
             'fret': _np.ndarray(shape, dtype=_np.int32,
                                 buffer=memoryview(fret)),
+            'timings': timings,
             }
         psconnsofb = PSConnSOFB(
             ethbridgeclnt_class, bbbnames, mproc=mproc,
             sofb_update_iocs=sofb_update_iocs)
 
         while True:
-            rec = pipe.recv()
-            if not rec:
+            startevt.wait()
+            startevt.clear()
+            cmd = command.value
+            if cmd == PSSOFB._CMD_SHUTDOWN:
                 break
-            meth, args = rec
-            if isinstance(meth, str):
-                if isinstance(args, Iterable):
-                    getattr(psconnsofb, meth)(*args)
-                else:
-                    getattr(psconnsofb, meth)()
+            meth = PSSOFB._COMMANDS[cmd]
+            if meth in PSSOFB._COMMANDS_SETPOINT:
+                getattr(psconnsofb, meth)(setpoint)
+            else:
+                getattr(psconnsofb, meth)()
             doneevt.set()
         psconnsofb.threads_shutdown()
-        pipe.close()
 
     # --- private methods: get properties ---
 
-    def _parallel_execution(self, target_name, args=None):
+    def _parallel_execution(self, target_name, current=None):
         """Execute 'method' in parallel."""
-        for pipe, doneevt in zip(self._pipes, self._doneevts):
+        # NOTE: shared buffers may only be overwritten when workers are
+        # done with the previous command.
+        self.wait()
+        if current is not None:
+            self._sofb_current_setpoint[:] = current
+        self._command.value = PSSOFB._COMMANDS.index(target_name)
+        for startevt, doneevt in zip(self._startevts, self._doneevts):
             doneevt.clear()
-            pipe.send((target_name, args))
+            startevt.set()
 
         if not self._async:
             self.wait()
@@ -1,7 +1,8 @@
 """Power Supply Signal Generator."""
 
 import time as _t
-import math as _math
+
+import numpy as _np
 
 
 DEFAULT_SIGGEN_CONFIG = (
@@ -26,6 +27,9 @@ DEFAULT_SIGGEN_CONFIG = (
 class Signal:
     """Signal from SigGen."""
 
+    # NOTE: parameters of signals evaluated in batches.
+    _PARAMS = ('num_cycles', 'freq', 'amplitude', 'offset')
+
     def __init__(self,
                  sigtype,
                  num_cycles,  # Sine, DampedSine, DampedSqrdSin, Trapezoidal
@@ -140,21 +144,53 @@ class Signal:
         """Reset init time."""
         self.time_init = _t.time()
 
+    def get_values(self, time):
+        """Return signal values at times [s] since the signal start."""
+        with _np.errstate(divide='ignore', invalid='ignore'):
+            return self._get_values(_np.asarray(time, dtype=float))
+
     def get_waveform(self, nrpts=100):
-        """."""
+        """Return waveform and time arrays of the signal duration."""
         tmax = self.duration
         tstep = tmax/(nrpts-1) if nrpts > 1 else tmax
-        tval, wval = [], []
-        time = 0
-        while True:
-            wvalue = self._get_value(time)
-            _ = tval.append(time), wval.append(wvalue)
-            if len(tval) == nrpts:
-                break
-            time += tstep
-            if time > tmax:
-                time = tmax
-        return wval, tval
+        time = _np.minimum(_np.arange(nrpts) * tstep, tmax)
+        return self.get_values(time), time
+
+    @staticmethod
+    def get_waveforms(signals, nrpts=100):
+        """Return waveform and time arrays of many signals.
+
+        Signals of each type are evaluated together, so their parameters
+        may differ. Each row of the arrays corresponds to a signal.
+        """
+        wfms = _np.zeros((len(signals), nrpts))
+        times = _np.zeros((len(signals), nrpts))
+        sigclasses = dict()
+        for idx, signal in enumerate(signals):
+            sigclasses.setdefault(type(signal), []).append(idx)
+        for sigclass, indices in sigclasses.items():
+            batch = sigclass._get_batch([signals[idx] for idx in indices])
+            wfms[indices], times[indices] = batch.get_waveform(nrpts)
+        return wfms, times
+
+    # --- private methods ---
+
+    @classmethod
+    def _get_batch(cls, signals):
+        # signal with column arrays of parameters, evaluated by broadcasting.
+        batch = cls.__new__(cls)
+        batch.__dict__.update(signals[0].__dict__)
+        for param in cls._PARAMS:
+            values = [getattr(sig, param) for sig in signals]
+            setattr(batch, param, _np.array(values, dtype=float)[:, None])
+        batch.aux_param = [
+            _np.array(values, dtype=float)[:, None] for values in
+            zip(*[sig.aux_param[:4] for sig in signals])]
+        batch._update()
+        return batch
+
+    def _get_value(self, time_delta):
+        return float(self.get_values(time_delta))
 
     # --- virtual methods ---
 
@@ -164,7 +200,7 @@ class Signal:
     def _get_cycle_time(self):
         raise NotImplementedError
 
-    def _get_value(self, time_delta):
+    def _get_values(self, time):
         raise NotImplementedError
 
     def _update(self):
@@ -180,18 +216,14 @@ class SignalSine(Signal):
     def _get_cycle_time(self):
         return 1.0 / self.freq
 
-    def _get_value(self, time_delta):
-        if self.duration > 0 and time_delta > self.duration:
-            # self.enable = False
-            return self.offset
-        else:
-            value = self.offset + self.amplitude * \
-                self._get_sin_signal(time_delta)
-            return value
+    def _get_values(self, time):
+        value = self.offset + self.amplitude * self._get_sin_signal(time)
+        return _np.where(
+            _is_finished(time, self.duration), self.offset, value)
 
-    def _get_sin_signal(self, time_delta):
-        value = _math.sin(2 * _math.pi * self.freq * time_delta +
-                          _math.radians(self.theta_begin))
+    def _get_sin_signal(self, time):
+        value = _np.sin(2 * _np.pi * self.freq * time +
+                        _np.radians(self.theta_begin))
         return value
 
     def _update(self):
@@ -201,26 +233,28 @@ class SignalSine(Signal):
 class SignalDampedNSine(SignalSine):
     """DampedNSine signal."""
 
+    _PARAMS = SignalSine._PARAMS + ('n', )
+
     def __init__(self, n, **kwargs):
         """Init method."""
         super().__init__(**kwargs)
         self.n = n
         self._update()
 
-    def _get_sin_signal(self, time_delta):
-        sinsig = (super()._get_sin_signal(time_delta))**self.n
-        expsig = self._f * _math.exp(-time_delta/self.decay_time)
+    def _get_sin_signal(self, time):
+        sinsig = (super()._get_sin_signal(time))**self.n
+        expsig = self._f * _np.exp(-time/self.decay_time)
         value = sinsig * expsig
         return value
 
     def _update(self):
-        self.wfreq = 2*_math.pi*self.freq
-        if self.wfreq != 0.0:
-            self._t0 = _math.atan(self.wfreq*self.decay_time*self.n)/self.wfreq
-        else:
-            self._t0 = 0.0
-        self._f = _math.exp(self._t0/self.decay_time) / \
-            _math.sin(self.wfreq*self._t0)**self.n
+        self.wfreq = 2*_np.pi*self.freq
+        with _np.errstate(divide='ignore', invalid='ignore'):
+            self._t0 = _np.where(
+                self.wfreq != 0.0,
+                _np.arctan(self.wfreq*self.decay_time*self.n)/self.wfreq, 0.0)
+            self._f = _np.exp(self._t0/self.decay_time) / \
+                _np.sin(self.wfreq*self._t0)**self.n
 
 
 class SignalDampedSine(SignalDampedNSine):
@@ -248,20 +282,18 @@ class SignalTrapezoidal(Signal):
     def _get_cycle_time(self):
         return self.rampup_time + self.plateau_time + self.rampdown_time
 
-    def _get_value(self, time_delta):
-        if self.duration > 0 and time_delta > self.duration:
-            # self.enable = False
-            return self.offset
-        else:
-            cycle_pos = time_delta % self.cycle_time
-            if cycle_pos < self.rampup_time:
-                value = self.amplitude*cycle_pos/self.rampup_time
-            elif cycle_pos < (self.rampup_time + self.plateau_time):
-                value = self.amplitude
-            else:
-                down_time = cycle_pos - (self.rampup_time + self.plateau_time)
-                value = self.amplitude*(1 - down_time/self.rampdown_time)
-            return self.offset + value
+    def _get_values(self, time):
+        cycle_pos = time % self.cycle_time
+        rampdown_pos = cycle_pos - (self.rampup_time + self.plateau_time)
+        value = _np.where(
+            cycle_pos < self.rampup_time,
+            self.amplitude*cycle_pos/self.rampup_time,
+            _np.where(
+                rampdown_pos < 0, self.amplitude,
+                self.amplitude*(1 - rampdown_pos/self.rampdown_time)))
+        return _np.where(
+            _is_finished(time, self.duration),
+            self.offset, self.offset + value)
 
     def _check(self):
         # TODO: avoid this workaround!
@@ -279,14 +311,12 @@ class SignalTrapezoidal(Signal):
 class SignalSquare(SignalSine):
     """Square signal."""
 
-    def _get_value(self, time_delta):
-        if self.duration > 0 and time_delta > self.duration:
-            value = self.offset
-        elif self._get_sin_signal(time_delta) < 0:
-            value = - self.amplitude + self.offset
-        else:
-            value = self.amplitude + self.offset
-        return value
+    def _get_values(self, time):
+        value = _np.where(
+            self._get_sin_signal(time) < 0, -self.amplitude, self.amplitude)
+        return _np.where(
+            _is_finished(time, self.duration),
+            self.offset, self.offset + value)
 
 
 class SigGenFactory:
@@ -398,3 +428,8 @@ class SigGenFactory:
             kwa['aux_param'][2] = float(kwa['decay_time'])
 
         return kwa
+
+
+def _is_finished(time, duration):
+    """Return whether times are after the end of signals with duration."""
+    return (duration > 0) & (time > duration)
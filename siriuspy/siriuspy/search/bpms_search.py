@@ -81,8 +81,6 @@ class BPMSearch:
         with cls._lock:
             if cls._mapping is not None:
                 return
-            if not _web.server_online():
-                raise Exception('could not read data from web server!')
             text = _web.bpms_data(timeout=_timeout)
             cls._build_mapping(text)
             cls._build_timing_to_bpm_mapping()
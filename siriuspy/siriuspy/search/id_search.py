@@ -90,9 +90,6 @@ class IDSearch:
         with IDSearch._lock:
             if idname in IDSearch._idname_2_orbitffwd_dict:
                 return
-            if not _web.server_online():
-                raise Exception(
-                    'could not read "' + str(idname) + '" from web server!')
             ffwd_fname = IDSearch._idname_2_orbitffwd_fname[idname]
             IDSearch._idname_2_orbitffwd_dict[idname] = \
                 _ExcitationData(filename_web=ffwd_fname + '.txt')
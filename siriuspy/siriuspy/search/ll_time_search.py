@@ -325,8 +325,6 @@ class LLTimeSearch:
         with cls._lock:
             if cls._conn_from_evg:
                 return
-            if not _web.server_online():
-                raise Exception('Could not connect with Consts Server!!')
             text = _web.timing_devices_mapping(timeout=_TIMEOUT)
             cls._parse_text_and_build_connection_mappings(text)
             cls._update_related_maps()
@@ -135,9 +135,6 @@ class MASearch:
         with MASearch._lock:
             if MASearch._maname_2_psnames_dict:
                 return
-            if not _web.server_online():
-                raise Exception(
-                    'could not read magnet-excitation-ps from web server!')
             text = _web.magnets_excitation_ps_read()
             data, param_dict = _util.read_text_data(text)
             maname_2_psnames_dict = dict()
@@ -170,9 +167,6 @@ class MASearch:
         with MASearch._lock:
             if MASearch._maname_2_modeldata_dict:
                 return
-            if not _web.server_online():
-                raise Exception(
-                    'could not read magnet model data from web server!')
             text = _web.magnets_model_data()
             data, param_dict = _util.read_text_data(text)
             maname_2_modeldata_dict = dict()
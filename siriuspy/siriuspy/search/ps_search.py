@@ -399,8 +399,6 @@ class PSSearch:
         """Reload power supply type dictionary from web server."""
         if PSSearch._pstype_dict:
             return
-        if not _web.server_online():
-            raise Exception('could not read pstypes from web server!')
         text = _web.ps_pstypes_names_read()
         data, _ = _util.read_text_data(text)
         pstype_dict = dict()
@@ -434,9 +432,6 @@ class PSSearch:
         with PSSearch._lock:
             if PSSearch._pstype_2_splims_dict:
                 return
-            if not _web.server_online():
-                raise Exception(
-                    'could not read setpoint limits from web server!')
             # ps data
             text = _web.ps_pstype_setpoint_limits()
             ps_data, ps_param_dict = _util.read_text_data(text)
@@ -470,9 +465,6 @@ class PSSearch:
         with PSSearch._lock:
             if pstype in PSSearch._pstype_2_excdat_dict:
                 return
-            if not _web.server_online():
-                raise Exception(
-                    'could not read "' + str(pstype) + '" from web server!')
             PSSearch._pstype_2_excdat_dict[pstype] = \
                 _ExcitationData(filename_web=pstype + '.txt')
 
@@ -482,8 +474,6 @@ class PSSearch:
         with PSSearch._lock:
             if PSSearch._psname_2_psmodel_dict:
                 return
-            if not _web.server_online():
-                raise Exception('could not read psmodels from web server')
             ps_data, _ = _util.read_text_data(_web.ps_psmodels_read())
             pu_data, _ = _util.read_text_data(_web.pu_psmodels_read())
             data = ps_data + pu_data
@@ -504,9 +494,6 @@ class PSSearch:
         with PSSearch._lock:
             if PSSearch._psname_2_siggen_dict:
                 return
-            if not _web.server_online():
-                raise Exception(
-                    'could not read siggen config from web server')
             text = _web.ps_siggen_configuration_read()
             data, _ = _util.read_text_data(text)
             psname_2_siggen_dict = dict()
@@ -543,9 +530,6 @@ class PSSearch:
         with PSSearch._lock:
             if PSSearch._bbbname_2_freq_dict:
                 return
-            if not _web.server_online():
-                raise Exception(
-                    'could not read BBB frequency map from web server')
             data, _ = _util.read_text_data(_web.beaglebone_freq_mapping())
             bbbname_2_freq_dict = dict()
             for line in data:
@@ -557,8 +541,6 @@ class PSSearch:
     def _reload_bbb_2_udc_dict():
         if PSSearch._bbbname_2_udc_dict:
             return
-        if not _web.server_online():
-            raise Exception('could not read BBB to UDC map from web server')
         data, _ = _util.read_text_data(_web.bbb_udc_mapping())
         bbbname_2_udc_dict = dict()
         udc_2_bbbname_dict = dict()
@@ -574,8 +556,6 @@ class PSSearch:
     def _reload_udc_2_bsmp_dict():
         if PSSearch._udc_2_bsmp_dict:
             return
-        if not _web.server_online():
-            raise Exception('could not read UDC to BSMP map from web server')
         data, _ = _util.read_text_data(_web.udc_ps_mapping())
         udc_2_bsmp_dict = dict()
         bsmp_2_udc_dict = dict()
@@ -594,9 +574,6 @@ class PSSearch:
         with PSSearch._lock:
             if PSSearch._ps_2_dclink_dict:
                 return
-            if not _web.server_online():
-                raise Exception(
-                    'could not read BSMP to DCLink map from web server')
             data, _ = _util.read_text_data(_web.bsmp_dclink_mapping())
             ps_2_dclink_dict = dict()
             dclink_2_ps_dict = dict()
@@ -84,6 +84,10 @@ class SimPSTypeModel(_Simulator):
         psmodel = _PSSearch.conv_psname_2_psmodel(psname)
         return pstype, psmodel
 
+    def pv_check_regexps(self):
+        """Return pvname regexps of simulator - overrides base method."""
+        return (self._regexp_pvname, )
+
     def pv_check(self, pvname):
         """Check if SimPV belongs to simlutaor - overrides base method."""
         return self._regexp_pv_check.match(pvname)
@@ -93,7 +97,7 @@ class SimPSTypeModel(_Simulator):
     def callback_pv_dbase(self):
         """."""
         regexp_dbase = dict()
-        dbpvs = _get_database(self._psmodel, self._pstype)
+        dbpvs = _get_database(self._psmodel, self._pstype, copy=False)
         for propty in self._properties:
             if propty in dbpvs:
                 # NOTE: property is considered only if it is in dbase
@@ -2,6 +2,9 @@
 
 import re as _re
 
+_DEFAULT_FLAGS = _re.compile('').flags
+_BACKREF = _re.compile(r'\\[1-9]')
+
 
 class Simulation:
     """Simulation class.
@@ -29,6 +32,11 @@ class Simulation:
     _SIMULS = list()  # registered simulators
     _DBASES = list()  # associated epics databases
     _SIMPVS = dict()  # registered SimPVs
+    _PVNAMES = dict()  # pvnames of registered SimPVs of each simulator
+
+    _INDEX = None  # compiled dispatch index of pvname regexps
+    _CHECK_INDEX = None  # compiled dispatch index of simulators to check
+    _MEMO = dict()  # simulators of pvnames
 
     # --- registration methods ---
 
@@ -41,6 +49,7 @@ class Simulation:
             pvname_regexp = sim.callback_pv_dbase()
             for regexp, dbase in pvname_regexp.items():
                 Simulation._pvnames_register(sim, regexp, dbase)
+        Simulation._index_clear()
 
     @staticmethod
     def simulator_unregister(simulator):
@@ -58,6 +67,7 @@ class Simulation:
                 dbases.append(dbas)
         Simulation._REGEXP, Simulation._SIMULS, Simulation._DBASES = \
             regexp, sims, dbases
+        Simulation._index_clear()
 
     @staticmethod
     def register_state_get():
@@ -88,6 +98,8 @@ class Simulation:
             return False
         sims = set(Simulation.simulator_find(pvname))
         Simulation._SIMPVS[pvname] = (pvobj, sims)
+        for sim in sims:
+            Simulation._PVNAMES.setdefault(sim, set()).add(pvname)
         # execute simulators callback
         for sim in sims:
             sim.callback_pv_register(pvobj)
@@ -153,29 +165,30 @@ class Simulation:
         """Return pvnames of registered SimPVs of a given simulator."""
         if simulator is None:
             return set(Simulation._SIMPVS.keys())
-        pvnames = set()
-        for pvobj, sims in Simulation._SIMPVS:
-            for sim in sims:
-                if sim == simulator:
-                    pvnames.add(pvobj.pvname)
-                    break
-        return pvnames
+        return set(Simulation._PVNAMES.get(simulator, set()))
 
     @staticmethod
     def reset():
         """Reset simulation."""
-        for sim in Simulation._SIMULS:
+        for sim in dict.fromkeys(Simulation._SIMULS):
             sim.reset()
         Simulation._init()
 
     @staticmethod
     def simulator_find(pvname, unique=False):
         """Return simulators set for a given pvname."""
-        set_ = set()
-        for sim in Simulation._SIMULS:
-            if sim.pv_check(pvname):
-                set_.add(sim)
-        return set_.pop() if unique and set_ else set_
+        sims = Simulation._MEMO.get(pvname)
+        if sims is None:
+            # NOTE: only simulators with pv_check regexps matching pvname
+            # have to be checked, and only once.
+            cands = Simulation._index_match(
+                Simulation._check_index_get(), pvname)
+            sims = frozenset(
+                sim for sim in dict.fromkeys(cands) if sim.pv_check(pvname))
+            Simulation._MEMO[pvname] = sims
+        if unique:
+            return next(iter(sims)) if sims else set()
+        return set(sims)
 
     @staticmethod
     def simulator_update(pvname, **kwargs):
@@ -201,13 +214,98 @@ class Simulation:
         Simulation._SIMULS = list()
         Simulation._DBASES = list()
         Simulation._SIMPVS = dict()
+        Simulation._PVNAMES = dict()
+        Simulation._index_clear()
 
     @staticmethod
-    def _find(pvname, itemlist, unique):
-        list_ = list()
-        for rege, item in zip(Simulation._REGEXP, itemlist):
+    def _index_clear():
+        Simulation._INDEX = None
+        Simulation._CHECK_INDEX = None
+        Simulation._MEMO = dict()
+
+    @staticmethod
+    def _index_get():
+        """Return dispatch index of registered pvname regexps.
+
+        Items of the index are the indices of regexps in _REGEXP.
+        """
+        if Simulation._INDEX is None:
+            Simulation._INDEX = Simulation._index_build(
+                zip(Simulation._REGEXP, range(len(Simulation._REGEXP))))
+        return Simulation._INDEX
+
+    @staticmethod
+    def _check_index_get():
+        """Return dispatch index of pv_check regexps of simulators."""
+        if Simulation._CHECK_INDEX is None:
+            regexps = list()
+            for sim in dict.fromkeys(Simulation._SIMULS):
+                regexps.extend(
+                    (_re.compile(rege), sim)
+                    for rege in sim.pv_check_regexps())
+            Simulation._CHECK_INDEX = Simulation._index_build(regexps)
+        return Simulation._CHECK_INDEX
+
+    @staticmethod
+    def _index_build(regexps):
+        """Return dispatch index of (regexp, item) pairs.
+
+        The index is a tuple with a regexp that combines distinct regexps
+        as alternatives of named groups, a list of (regexp, items) of each
+        alternative and a list of (regexp, items) not combined.
+        """
+        patterns = dict()
+        for rege, item in regexps:
+            key = (rege.pattern, rege.flags)
+            if key not in patterns:
+                patterns[key] = (rege, list())
+            patterns[key][1].append(item)
+        groups, others = list(), list()
+        for rege, items in patterns.values():
+            # NOTE: global inline flags of an alternative would apply to
+            # all of them (or fail to compile in python 3.11+), and group
+            # numbers change in the combined regexp, so regexps with them
+            # or with numbered group references are not combined.
+            if rege.flags != _DEFAULT_FLAGS or _BACKREF.search(rege.pattern):
+                others.append((rege, items))
+            else:
+                groups.append((rege, items))
+        try:
+            combined = _re.compile('|'.join(
+                '(?P<_r{}>{})'.format(i, rege.pattern)
+                for i, (rege, _) in enumerate(groups))) if groups else None
+        except (_re.error, AssertionError):
+            # NOTE: regexps with repeated group names can not be combined.
+            combined, groups, others = None, list(), groups + others
+        return combined, groups, others
+
+    @staticmethod
+    def _index_match(index, pvname):
+        """Return items of regexps of an index matching pvname."""
+        combined, groups, others = index
+        items = list()
+        if combined is not None:
+            mat = combined.match(pvname)
+            if mat is not None:
+                # NOTE: alternatives are tried in order, so none of the
+                # ones before the matching alternative can match pvname.
+                for rege, itms in groups[int(mat.lastgroup[2:]):]:
+                    if rege.match(pvname):
+                        items.extend(itms)
+        for rege, itms in others:
             if rege.match(pvname):
-                list_.append(item)
+                items.extend(itms)
+        return items
+
+    @staticmethod
+    def _find_indices(pvname):
+        """Return sorted indices of registered regexps matching pvname."""
+        return sorted(Simulation._index_match(
+            Simulation._index_get(), pvname))
+
+    @staticmethod
+    def _find(pvname, itemlist, unique):
+        list_ = [itemlist[idx] for idx in Simulation._find_indices(pvname)]
 
         # if unique and more than one item, raise exception.
         if unique and len(list_) > 1:
@@ -1,5 +1,6 @@
 """Base Simulator."""
 
+import re as _re
 import random as _random
 from abc import ABC, abstractmethod
 import numpy as _np
@@ -101,11 +102,19 @@ class Simulator(ABC):
             vals[pvname] = self.pv_value_get(pvname)
         return vals
 
+    def pv_check_regexps(self):
+        """Return regular expressions of pvnames that may belong to simulator.
+
+        pv_check is only called for pvnames matching one of them. Subclasses
+        overriding pv_check should override this method as well.
+        """
+        return tuple(self.callback_pv_dbase())
+
     def pv_check(self, pvname):
         """Check if SimPV belongs to simulator."""
         dbases = self.callback_pv_dbase()
         for regexp in dbases:
-            if regexp.match(pvname):
+            if _re.match(regexp, pvname):
                 return True
         return False
 
@@ -1,6 +1,7 @@
 """Class of the Response Matrix."""
 
 import os as _os
+from collections import OrderedDict as _OrderedDict
 from copy import deepcopy as _dcopy
 import logging as _log
 from functools import partial as _part
@@ -18,6 +19,11 @@ class BaseMatrix(_BaseClass):
 class EpicsMatrix(BaseMatrix):
     """Class of the Response Matrix."""
 
+    # NOTE: SVDs of the last selected matrices are cached, so that changes
+    # of regularization parameters only recompose the inverse matrix and
+    # toggling back and forth enable lists do not decompose matrices again.
+    SVD_CACHE_SIZE = 8
+
     def __init__(self, acc, prefix='', callback=None):
         """Initialize the instance."""
         super().__init__(acc, prefix=prefix, callback=callback)
@@ -46,6 +52,7 @@ class EpicsMatrix(BaseMatrix):
         self.ring_extension = 1
         self.respmat_extended = self.respmat.copy()
         self.select_items_extended = _dcopy(self.select_items)
+        self._svd_cache = _OrderedDict()
         self._load_respmat()
 
     @property
@@ -310,13 +317,10 @@ class EpicsMatrix(BaseMatrix):
 
         mat = mat[sel_mat]
         mat = _np.reshape(mat, [sum(selecbpm), sum(seleccor)])
-        try:
-            uuu, sing, vvv = _np.linalg.svd(mat, full_matrices=False)
-        except _np.linalg.LinAlgError():
-            msg = 'ERR: Could not calculate SVD'
-            self._update_log(msg)
-            _log.error(msg[5:])
+        svd = self._calc_svd(mat)
+        if svd is None:
             return False
+        uuu, sing, vvv = svd
         idcs = sing > self.min_sing_val
         singr = sing[idcs]
         nr_sv = _np.sum(idcs)
@@ -335,7 +339,8 @@ class EpicsMatrix(BaseMatrix):
         # calculate processed singular values
         singp = _np.zeros(sing.size, dtype=float)
         singp[idcs] = 1/inv_s[idcs]
-        inv_mat = _np.dot(vvv.T*inv_s, uuu.T)
+        # only singular vectors of selected singular values contribute.
+        inv_mat = _np.dot(vvv[idcs].T*inv_s[idcs], uuu[:, idcs].T)
         is_nan = _np.any(_np.isnan(inv_mat))
         is_inf = _np.any(_np.isinf(inv_mat))
         if is_nan or is_inf:
@@ -355,13 +360,32 @@ class EpicsMatrix(BaseMatrix):
         self.inv_respmat[sel_mat.T] = inv_mat.ravel()
         self.run_callbacks('InvRespMat-Mon', list(self.inv_respmat.ravel()))
         respmat_proc = _np.zeros(self.respmat.shape, dtype=float)
-        respmat_proc[sel_mat] = _np.dot(uuu*singp, vvv).ravel()
+        respmat_proc[sel_mat] = _np.dot(
+            uuu[:, idcs]*singp[idcs], vvv[idcs]).ravel()
         self.run_callbacks('RespMat-Mon', list(respmat_proc.ravel()))
         msg = 'Ok!'
         self._update_log(msg)
         _log.info(msg)
         return True
 
+    def _calc_svd(self, mat):
+        key = (mat.shape, mat.tobytes())
+        svd = self._svd_cache.get(key)
+        if svd is not None:
+            self._svd_cache.move_to_end(key)
+            return svd
+        try:
+            svd = _np.linalg.svd(mat, full_matrices=False)
+        except _np.linalg.LinAlgError:
+            msg = 'ERR: Could not calculate SVD'
+            self._update_log(msg)
+            _log.error(msg[5:])
+            return None
+        self._svd_cache[key] = svd
+        if len(self._svd_cache) > EpicsMatrix.SVD_CACHE_SIZE:
+            self._svd_cache.popitem(last=False)
+        return svd
+
     def _load_respmat(self):
         filename = self._csorb.respmat_fname
         boo = False
@@ -7,6 +7,7 @@ from functools import partial as _part
 from copy import deepcopy as _dcopy
 from threading import Lock, Thread, Event as _Event
 import multiprocessing as _mp
+from multiprocessing import sharedctypes as _shm
 import traceback as _traceback
 
 import numpy as _np
@@ -25,11 +26,20 @@ class BaseOrbit(_BaseClass):
     """."""
 
 
-def run_subprocess(pvs, send_pipe, recv_pipe):
-    """Run subprocesses."""
+def run_subprocess(pvs, pvs_slice, proc_idx, orbbufs, start_evt, done_evt):
+    """Run subprocesses.
+
+    Values of the PVs are written to the 'pvs_slice' of a double-buffered
+    shared memory block, alternating buffers at each acquisition. The
+    timestamp spread flag and the acquisition counter of the process are
+    written at index 'proc_idx' of their shared arrays. 'done_evt' is set
+    after each acquisition and a new one starts when 'start_evt' is set.
+    """
     max_spread = 25/1000  # in [s]
     timeout = 50/1000  # in [s]
 
+    values, noks, seqs, running = _get_orbit_buffers(*orbbufs)
+
     ready_evt = _Event()
 
     tstamps = _np.full(len(pvs), _np.nan)
@@ -60,22 +70,43 @@ def run_subprocess(pvs, send_pipe, recv_pipe):
         pvo.add_callback(callback)
         pvo.connection_callbacks.append(conn_callback)
 
-    boo = True
-    while boo or recv_pipe.recv():
-        boo = False
+    seq = 0
+    while True:
         ready_evt.clear()
         nok = 0.0
         if not ready_evt.wait(timeout=timeout):
             nok = 1.0
-        out = []
-        for pvo in pvsobj:
-            if not pvo.connected:
-                out.append(_np.nan)
-                continue
-            # out.append(pvo.timestamp)
-            out.append(pvo.value)
-        out.append(nok)
-        send_pipe.send(out)
+        # NOTE: the buffer being written is not the one the main process
+        # may be reading, which was written in the previous acquisition.
+        out = values[seq % 2, pvs_slice]
+        for i, pvo in enumerate(pvsobj):
+            value = pvo.value if pvo.connected else None
+            out[i] = _np.nan if value is None else value
+        noks[seq % 2, proc_idx] = nok
+        seq += 1
+        seqs[proc_idx] = seq
+        done_evt.set()
+        start_evt.wait()
+        start_evt.clear()
+        if not running.value:
+            break
+
+
+def _create_orbit_buffers(nr_pvs, nr_procs):
+    values = _shm.Array(_shm.ctypes.c_double, 2*nr_pvs, lock=False)
+    noks = _shm.Array(_shm.ctypes.c_double, 2*nr_procs, lock=False)
+    seqs = _shm.Array(_shm.ctypes.c_int64, nr_procs, lock=False)
+    running = _shm.Value(_shm.ctypes.c_int, 1, lock=False)
+    return values, noks, seqs, running
+
+
+def _get_orbit_buffers(values, noks, seqs, running):
+    values = _np.ndarray(
+        (2, len(values)//2), dtype=float, buffer=memoryview(values))
+    noks = _np.ndarray(
+        (2, len(noks)//2), dtype=float, buffer=memoryview(noks))
+    seqs = _np.ndarray(len(seqs), dtype=_np.int64, buffer=memoryview(seqs))
+    return values, noks, seqs, running
 
 
 class EpicsOrbit(BaseOrbit):
@@ -123,8 +154,8 @@ class EpicsOrbit(BaseOrbit):
         self.new_orbit = _Event()
         if self.acc == 'SI':
             self._processes = []
-            self._mypipes_recv = []
-            self._mypipes_send = []
+            self._start_evts = []
+            self._done_evts = []
             self._create_processes(nrprocs=16)
         self._orbit_thread = _Repeat(
             1/self._acqrate, self._update_orbits, niter=0)
@@ -146,16 +177,29 @@ class EpicsOrbit(BaseOrbit):
         rem = len(pvs) % nrprocs
         sub = [div*i + min(i, rem) for i in range(nrprocs+1)]
 
+        # create shared memory orbit buffers
+        orbbufs = _create_orbit_buffers(len(pvs), nrprocs)
+        self._orbbufs = orbbufs
+        self._orbbuf_values, self._orbbuf_noks, self._orbbuf_seqs, \
+            self._orbbuf_running = _get_orbit_buffers(*orbbufs)
+        # process index of each pv, to select the buffers of each process
+        self._orbbuf_procs = _np.repeat(
+            _np.arange(nrprocs), _np.diff(sub))
+        self._orbbuf_pvs = _np.arange(len(pvs))
+
         # create processes
         for i in range(nrprocs):
-            mine, send_pipe = spw.Pipe(duplex=False)
-            self._mypipes_recv.append(mine)
-            recv_pipe, mine = spw.Pipe(duplex=False)
-            self._mypipes_send.append(mine)
+            # NOTE: It is crucial to use the Event class from the appropriate
+            # context, otherwise it will fail for 'spawn' start method.
+            start_evt = spw.Event()
+            done_evt = spw.Event()
+            self._start_evts.append(start_evt)
+            self._done_evts.append(done_evt)
             pvsn = pvs[sub[i]:sub[i+1]]
             self._processes.append(_Process(
                 target=run_subprocess,
-                args=(pvsn, send_pipe, recv_pipe),
+                args=(pvsn, slice(sub[i], sub[i+1]), i, orbbufs,
+                      start_evt, done_evt),
                 daemon=True))
         for proc in self._processes:
             proc.start()
@@ -166,9 +210,9 @@ class EpicsOrbit(BaseOrbit):
         self._orbit_thread.stop()
         self._orbit_thread.join()
         if self.acc == 'SI':
-            for pipe in self._mypipes_send:
-                pipe.send(False)
-                pipe.close()
+            self._orbbuf_running.value = 0
+            for evt in self._start_evts:
+                evt.set()
             for proc in self._processes:
                 proc.join()
 
@@ -956,17 +1000,20 @@ class EpicsOrbit(BaseOrbit):
 
     def _get_orbit_from_processes(self):
         nr_bpms = self._csorb.nr_bpms
-        out = []
-        nok = []
-        for pipe in self._mypipes_recv:
-            res = pipe.recv()
-            out.extend(res[:-1])
-            nok.append(res[-1])
-        for pipe in self._mypipes_send:
-            pipe.send(True)
-        orbx = _np.array(out[:nr_bpms], dtype=float)
-        orby = _np.array(out[nr_bpms:], dtype=float)
-        return orbx, orby, any(nok)
+        for evt in self._done_evts:
+            evt.wait()
+        # buffers last written by each process
+        bufs = (self._orbbuf_seqs - 1) % 2
+        # start next acquisitions, which write to the other buffers.
+        for start_evt, done_evt in zip(self._start_evts, self._done_evts):
+            done_evt.clear()
+            start_evt.set()
+        out = self._orbbuf_values[
+            bufs[self._orbbuf_procs], self._orbbuf_pvs]
+        nok = self._orbbuf_noks[bufs, _np.arange(bufs.size)]
+        orbx = out[:nr_bpms]
+        orby = out[nr_bpms:]
+        return orbx, orby, _np.any(nok)
 
     def _update_multiturn_orbits(self):
         """."""
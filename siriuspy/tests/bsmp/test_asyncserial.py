@@ -0,0 +1,197 @@
+#!/usr/bin/env python-sirius
+
+"""Test asyncserial module."""
+
+import asyncio
+import struct
+from unittest import TestCase
+from unittest.mock import Mock
+
+from siriuspy.bsmp import (
+    AsyncBSMP,
+    AsyncChannel,
+    AsyncEthBridge,
+    AsyncIOInterfaceAdapter,
+    Entities,
+    Message,
+    Package,
+    SerialErrEmpty,
+    Types,
+)
+from siriuspy.bsmp import constants as const
+from siriuspy.bsmp.exceptions import SerialError
+from siriuspy.util import check_public_interface_namespace
+
+
+class _FakeEthBridgeServer:
+    """Fake bridge server answering BSMP variable reads.
+
+    The value of variable 'var_id' of device 'addr' is 100*addr + var_id.
+    Requests are queued as they arrive and answered one at a time, after
+    'delays[addr]' seconds, emulating a RS-485 serial line. Empty responses
+    are sent if delays are longer than request timeouts.
+    """
+
+    def __init__(self, delays=None):
+        self.delays = delays or dict()
+        self.max_queued = 0
+        self.handlers = []
+        self.server = None
+        self.port = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(
+            self._handle, '127.0.0.1', 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+        # handlers return once clients close their connections
+        await asyncio.gather(*self.handlers)
+
+    async def _handle(self, reader, writer):
+        # NOTE: asyncio.current_task is only available in python 3.7+
+        if hasattr(asyncio, 'current_task'):
+            task = asyncio.current_task()
+        else:
+            task = asyncio.Task.current_task()
+        self.handlers.append(task)
+        queue = asyncio.Queue()
+        answer_task = asyncio.ensure_future(self._answer(queue, writer))
+        try:
+            while True:
+                header = await reader.readexactly(5)
+                cmd, size = struct.unpack('>BI', header)
+                data = await reader.readexactly(size)
+                if cmd == AsyncEthBridge.CMD_REQUEST:
+                    timeout = struct.unpack('>f', data[:4])[0] / 1000
+                    queue.put_nowait((timeout, data[4:]))
+                    self.max_queued = max(self.max_queued, queue.qsize())
+        except asyncio.IncompleteReadError:
+            pass
+        answer_task.cancel()
+        try:
+            await answer_task
+        except asyncio.CancelledError:
+            pass
+        writer.close()
+
+    async def _answer(self, queue, writer):
+        while True:
+            timeout, stream = await queue.get()
+            pck = Package(stream)
+            delay = self.delays.get(pck.address, 0.0)
+            await asyncio.sleep(min(delay, timeout))
+            if delay > timeout:
+                resp = b''
+            else:
+                var_id = pck.message.payload_bytes[0]
+                value = 100*pck.address + var_id
+                resp = Message.message(
+                    const.CMD_VARIABLE_VALUE,
+                    payload=struct.pack('<H', value))
+                resp = Package.package(pck.address, resp).stream_bytes
+            writer.write(struct.pack('>BI', 0x01, len(resp)) + resp)
+            await writer.drain()
+
+
+class TestAsyncChannel(TestCase):
+    """Test AsyncChannel class."""
+
+    api = (
+        'iointerf',
+        'address',
+        'size_counter',
+        'size_counter_reset',
+        'write',
+        'request_',
+        'request',
+    )
+
+    def test_api(self):
+        """Test API."""
+        self.assertTrue(check_public_interface_namespace(AsyncChannel, self.api))
+
+
+class TestAsyncIOInterfaceAdapter(TestCase):
+    """Test AsyncIOInterfaceAdapter class."""
+
+    def test_request(self):
+        """Test request through adapted synchronous interface."""
+        serial = Mock()
+        response = Message.message(0x11, payload=[chr(10)])
+        serial.UART_request_bytes.return_value = \
+            Package.package(0x01, response).stream_bytes
+        channel = AsyncChannel(AsyncIOInterfaceAdapter(serial), 1)
+        message = Message.message(0x01, payload=[chr(1)])
+        loop = asyncio.new_event_loop()
+        try:
+            recv = loop.run_until_complete(channel.request(message, timeout=1))
+        finally:
+            loop.close()
+        serial.UART_request_bytes.assert_called_once_with(
+            Package.package(1, message).stream_bytes, timeout=1)
+        self.assertEqual(recv, response)
+
+
+class TestAsyncBSMP(TestCase):
+    """Test AsyncBSMP with a fake eth-bridge server."""
+
+    variables = [
+        {'eid': eid, 'waccess': False, 'count': 1, 'var_type': Types.T_UINT16}
+        for eid in range(4)]
+
+    def setUp(self):
+        """Common setup for all tests."""
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        """Common teardown for all tests."""
+        self.loop.close()
+
+    async def _read(self, server, addrs, timeout, margin=None):
+        await server.start()
+        iointerf = AsyncEthBridge('127.0.0.1', server.port)
+        if margin is not None:
+            iointerf.TIMEOUT_MARGIN = margin
+        await iointerf.open()
+        bsmps = [
+            AsyncBSMP(iointerf, addr, Entities(self.variables, [], []))
+            for addr in addrs]
+        try:
+            return await asyncio.gather(
+                *[bsmp.read_variable(addr % 4, timeout=timeout)
+                  for addr, bsmp in zip(addrs, bsmps)],
+                return_exceptions=True)
+        finally:
+            await iointerf.close()
+            await server.stop()
+
+    def test_pipelined_requests(self):
+        """Test pipelined requests get their own responses, in order."""
+        server = _FakeEthBridgeServer(delays={1: 0.01, 2: 0.0, 3: 0.005})
+        addrs = [1, 2, 3, 4, 5, 6, 7, 8]
+        resps = self.loop.run_until_complete(
+            self._read(server, addrs, timeout=100))
+        for addr, resp in zip(addrs, resps):
+            self.assertEqual(resp, (const.ACK_OK, 100*addr + addr % 4))
+        # more than one request was in flight at the server
+        self.assertGreater(server.max_queued, 1)
+
+    def test_request_not_connected(self):
+        """Test requests before opening the connection raise SerialError."""
+        iointerf = AsyncEthBridge('127.0.0.1', 0)
+        with self.assertRaises(SerialError):
+            self.loop.run_until_complete(
+                iointerf.UART_request(b'\x00', timeout=10))
+
+    def test_request_timeout(self):
+        """Test a late response does not shift the following ones."""
+        server = _FakeEthBridgeServer(delays={2: 0.2, 3: 0.02})
+        addrs = [1, 2, 3]
+        resps = self.loop.run_until_complete(
+            self._read(server, addrs, timeout=50, margin=0.0))
+        self.assertEqual(resps[0], (const.ACK_OK, 101))
+        self.assertIsInstance(resps[1], SerialErrEmpty)
+        self.assertEqual(resps[2], (const.ACK_OK, 303))
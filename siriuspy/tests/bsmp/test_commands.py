@@ -34,6 +34,7 @@ class TestBSMPAPI(TestCase):
         'query_list_of_functions',
         'read_variable',
         'read_group_of_variables',
+        'read_group_of_variables_load',
         'write_variable',
         'write_group_of_variables',
         'binoperation_variable',
@@ -213,6 +214,15 @@ class TestBSMP0x1(TestCase):
         self.assertAlmostEqual(response[1][2][1], values[2][1])
         self.assertEqual(response[1][3], values[3])
 
+    def test_read_group_of_variables_load(self):
+        """Test read_group_of_variables_load."""
+        load = struct.pack('<hff', 1020, 40.7654321, 1.7654321)
+        load += struct.pack('<f', 0.0123456) + b'teste' + bytes(59)
+        pck = Package.package(0, Message.message(0x13, payload=load))
+        self.serial.UART_request.return_value = pck.stream
+        response = self.bsmp.read_group_of_variables_load(0, timeout=100)
+        self.assertEqual(response, (0xE0, load))
+
     def test_read_group_variable_error(self):
         """Test read variable returns error code."""
         p = Package.package(0, Message.message(0xE3))
@@ -120,7 +120,9 @@ class TestBSMPVariablesGroup(TestCase):
         'ALL',
         'READ_ONLY',
         'WRITEABLE',
+        'dtype',
         'load_to_value',
+        'loads_to_array',
         'value_to_load',
         'variables_size',
     )
@@ -160,6 +162,34 @@ class TestBSMPVariablesGroup(TestCase):
         for i, f in enumerate(value[4]):
             self.assertAlmostEqual(f, expected_value[4][i])
         self.assertEqual(value[-1], expected_value[-1])
+        # bytes-like loads are decoded the same way
+        for load_ in (''.join(load).encode('latin-1'),
+                      memoryview(''.join(load).encode('latin-1'))):
+            self.assertEqual(self.group.load_to_value(load_), value)
+
+    def test_loads_to_array(self):
+        """Test conversion of many loads to structured array."""
+        loads = []
+        for i in range(3):
+            loads.append(
+                struct.pack('<BHIf4f8s', i, 10+i, 20+i, 1.5, 1, 2, 3, i,
+                            b'teste'))
+        self.assertEqual(self.group.variables_size(), len(loads[0]))
+        self.assertEqual(self.group.dtype.itemsize, len(loads[0]))
+        array = self.group.loads_to_array(loads)
+        self.assertEqual(array.shape, (3, ))
+        self.assertEqual(list(array['v0']), [0, 1, 2])
+        self.assertEqual(list(array['v2']), [20, 21, 22])
+        self.assertEqual(list(array['v4'][2]), [1.0, 2.0, 3.0, 2.0])
+        self.assertEqual(bytes(array['v5'][1]), b'teste\x00\x00\x00')
+        # invalid loads leave preallocated rows untouched
+        array = self.group.loads_to_array(
+            [None, loads[1], loads[2][:-1]], array)
+        self.assertEqual(list(array['v0']), [0, 1, 2])
+        for load, row in zip(loads, array):
+            value = self.group.load_to_value(load)
+            self.assertEqual(value[:2], [row['v0'], row['v1']])
+            self.assertEqual(value[4], list(row['v4']))
 
     def test_value_to_load(self):
         """Test value conversion to load."""
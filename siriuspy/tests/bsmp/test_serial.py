@@ -7,6 +7,7 @@ from unittest.mock import Mock
 
 from siriuspy.bsmp import (
     Channel,
+    IOInterface,
     Message,
     Package,
     SerialErrMsgShort,
@@ -22,9 +23,11 @@ class TestBSMPMessage(TestCase):
     api = (
         'message',
         'stream',
+        'stream_bytes',
         'cmd',
         'size',
         'payload',
+        'payload_bytes',
     )
 
     def test_api(self):
@@ -41,6 +44,26 @@ class TestBSMPMessage(TestCase):
         # Convert message to stream
         self.assertEqual(m.stream, stream)
 
+    def test_init_bytes(self):
+        """Test constructor that creates object from bytes stream."""
+        stream = b'\x01\x00\x03\x02\n\x00'
+        m = Message(stream)
+        self.assertEqual(m.cmd, 0x01)
+        self.assertEqual(m.size, 3)
+        self.assertEqual(bytes(m.payload_bytes), b'\x02\n\x00')
+        self.assertEqual(m.payload, [chr(2), chr(10), chr(0)])
+        self.assertEqual(m.stream_bytes, stream)
+        self.assertEqual(m.stream, list(map(chr, stream)))
+
+    def test_message_with_bytes_load(self):
+        """Test bytes and char-list loads build equal messages."""
+        load = [chr(0x07), chr(0x40), chr(0xDD)]
+        m1 = Message.message(cmd=0x41, payload=load)
+        m2 = Message.message(cmd=0x41, payload=b'\x07\x40\xDD')
+        self.assertEqual(m1, m2)
+        self.assertEqual(m1.stream_bytes, m2.stream_bytes)
+        self.assertEqual(m2.payload, load)
+
     def test_small_message(self):
         """Test message with stream impossibly small."""
         with self.assertRaises(SerialErrMsgShort):
@@ -106,6 +129,7 @@ class TestBSMPPackage(TestCase):
         'message',
         'checksum',
         'stream',
+        'stream_bytes',
         'calc_checksum',
         'verify_checksum',
     )
@@ -132,6 +156,17 @@ class TestBSMPPackage(TestCase):
             self.assertEqual(p.message.cmd, d[1])
             self.assertEqual(p.message.payload, d[2])
 
+    def test_package_stream_bytes(self):
+        """Test constructor that creates object from bytes stream."""
+        for d in self.data:
+            stream = ''.join(d[3]).encode('latin-1')
+            p = Package(stream)
+            self.assertEqual(p.address, d[0])
+            self.assertEqual(p.checksum, d[4])
+            self.assertEqual(p.message.cmd, d[1])
+            self.assertEqual(p.message.payload, d[2])
+            self.assertEqual(p.stream, d[3])
+
     def test_parse_small_stream(self):
         """Test constructor that tries to parse strem smaller than 5."""
         stream = ['\x02', '\x00', '\x00', chr(254)]
@@ -156,6 +191,15 @@ class TestBSMPPackage(TestCase):
             stream = d[3]
             self.assertTrue(Package.verify_checksum(stream))
 
+    def test_verify_checksum_bytes(self):
+        """Verify checksum of bytes streams sucessfully."""
+        for d in self.data:
+            stream = ''.join(d[3]).encode('latin-1')
+            self.assertTrue(Package.verify_checksum(stream))
+            self.assertEqual(Package.calc_checksum(stream[:-1]), d[4])
+            self.assertFalse(Package.verify_checksum(
+                stream[:-1] + bytes(((d[4] + 1) & 0xFF, ))))
+
     def test_verify_false_checksum(self):
         """Verify checksums fail."""
         for d in self.data:
@@ -224,3 +268,40 @@ class TestBSMPChannel(TestCase):
         self.serial.UART_request.return_value = None
         with self.assertRaises(SerialError):
             self.channel.request(Message.message(0x10, payload=[chr(10)]))
+
+    def test_request_bytes(self):
+        """Test request through bytes-native interface method."""
+
+        class _IOInterface(IOInterface):
+
+            def __init__(self, response):
+                self.response = response
+                self.stream = None
+
+            def open(self):
+                pass
+
+            def close(self):
+                pass
+
+            def UART_read(self):
+                pass
+
+            def UART_write(self, stream, timeout):
+                pass
+
+            def UART_request(self, stream, timeout):
+                self.stream = stream
+                return self.response
+
+        response = Message.message(0x11, payload=[chr(10)])
+        message = Message.message(0x01, payload=[chr(1)])
+        for resp in (Package.package(0x01, response).stream,
+                     Package.package(0x01, response).stream_bytes):
+            serial = _IOInterface(resp)
+            channel = Channel(serial, 1)
+            recv = channel.request(message, timeout=1)
+            self.assertEqual(
+                serial.stream, Package.package(1, message).stream)
+            self.assertEqual(recv.cmd, response.cmd)
+            self.assertEqual(recv.payload, response.payload)
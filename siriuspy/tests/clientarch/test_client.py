@@ -0,0 +1,314 @@
+#!/usr/bin/env python-sirius
+
+"""Test clientarch client module."""
+
+import asyncio
+import calendar
+import struct
+from unittest import TestCase
+
+import numpy as np
+from aiohttp import web
+from dateutil.parser import isoparse
+
+from siriuspy.clientarch import ClientArchiver
+from siriuspy.clientarch.dataformat import json_to_columns, raw_to_columns
+
+
+def _varint(val):
+    out = b''
+    val &= (1 << 64) - 1
+    while True:
+        byte = val & 0x7f
+        val >>= 7
+        if val:
+            out += bytes([byte | 0x80])
+        else:
+            return out + bytes([byte])
+
+
+def _pb_line(*fields):
+    """Return escaped PB message line from (number, wire type, value)."""
+    msg = b''
+    for num, wire, val in fields:
+        msg += _varint(num << 3 | wire)
+        if wire == 0:
+            msg += _varint(val)
+        elif wire == 2:
+            msg += _varint(len(val)) + val
+        else:
+            msg += val
+    msg = msg.replace(b'\x1b', b'\x1b\x01').replace(
+        b'\n', b'\x1b\x02').replace(b'\r', b'\x1b\x03')
+    return msg + b'\n'
+
+
+def _raw_scalar_double(year, samples):
+    """Return PB stream of one chunk of (secs, nanos, val, sevr, stat)."""
+    stream = _pb_line((1, 0, 6), (2, 2, b'PV'), (3, 0, year))
+    for secs, nanos, val, sevr, stat in samples:
+        stream += _pb_line(
+            (1, 0, secs), (2, 0, nanos), (3, 1, struct.pack('<d', val)),
+            (4, 0, sevr), (5, 0, stat))
+    return stream
+
+
+class FakeArchiverServer:
+    """Fake archiver retrieval server.
+
+    Samples are (secs, nanos, val, sevr, stat) tuples, the same for all PVs.
+    Responses have the samples of the time interval and the last one
+    before it, as the archiver does.
+    """
+
+    def __init__(self, samples):
+        self.samples = samples
+        self.requests = []
+        self.delay = 0.0
+        self.failures = 0
+        self.failing_starts = set()
+        self.hanging_starts = set()
+        self.dropping_starts = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.runner = None
+        self.url = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get('/retrieval/data/getData.json', self._get_json)
+        app.router.add_get('/retrieval/data/getData.raw', self._get_raw)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = 'http://127.0.0.1:{}'.format(port)
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    def _get_samples(self, request):
+        tstart = isoparse(request.query['from']).timestamp()
+        tstop = isoparse(request.query['to']).timestamp()
+        self.requests.append((request.query['pv'], tstart, tstop))
+        times = [secs + nanos/1e9 for secs, nanos, *_ in self.samples]
+        ini = max(sum(t <= tstart for t in times) - 1, 0)
+        return [
+            smp for smp, tim in zip(self.samples[ini:], times[ini:])
+            if tim <= tstop]
+
+    async def _get_json(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        tstart = isoparse(request.query['from']).timestamp()
+        if tstart in self.hanging_starts:
+            await asyncio.sleep(1)
+        if tstart in self.dropping_starts:
+            request.transport.close()
+        if self.failures or tstart in self.failing_starts:
+            self.failures = max(self.failures - 1, 0)
+            return web.Response(status=503)
+        samples = self._get_samples(request)
+        data = [
+            {'secs': secs, 'nanos': nanos, 'val': val,
+             'severity': sevr, 'status': stat}
+            for secs, nanos, val, sevr, stat in samples]
+        return web.json_response(
+            [{'meta': {'name': request.query['pv']}, 'data': data}])
+
+    async def _get_raw(self, request):
+        samples = self._get_samples(request)
+        year = 1970
+        ystart = calendar.timegm((year, 1, 1, 0, 0, 0))
+        samples = [(s[0] - ystart, ) + s[1:] for s in samples]
+        return web.Response(body=_raw_scalar_double(year, samples))
+
+
+class TestDataFormat(TestCase):
+    """Test archiver data parsers."""
+
+    samples = [
+        (100, 500000000, 1.5, 0, 0),
+        (101, 0, -2.0, 2, 3),
+        (102, 250000000, 1.0e10, 1, 17),
+        ]
+
+    def _check_columns(self, columns):
+        timestamp, value, status, severity = columns
+        np.testing.assert_allclose(timestamp, [100.5, 101.0, 102.25])
+        np.testing.assert_allclose(value, [1.5, -2.0, 1.0e10])
+        np.testing.assert_array_equal(status, [0, 3, 17])
+        np.testing.assert_array_equal(severity, [0, 2, 1])
+
+    def test_json_to_columns(self):
+        """Test parsing of json responses."""
+        data = [
+            {'secs': secs, 'nanos': nanos, 'val': val,
+             'severity': sevr, 'status': stat}
+            for secs, nanos, val, sevr, stat in self.samples]
+        self._check_columns(json_to_columns([{'data': data}]))
+        self.assertEqual(json_to_columns([])[0].size, 0)
+
+    def test_raw_to_columns(self):
+        """Test parsing of PB responses, with chunks of different years."""
+        ystart = calendar.timegm((2021, 1, 1, 0, 0, 0))
+        # values escaped in the stream, with newline and escape bytes.
+        values = [struct.unpack('<d', b'\n\x1b\r\n\x1b\r\x00\x00')[0], 3.0]
+        stream = _raw_scalar_double(
+            2020, [(10, 0, values[0], 0, 0)]) + b'\n'
+        stream += _raw_scalar_double(2021, [(5, 500, values[1], 3, 1)])
+        timestamp, value, status, severity = raw_to_columns(stream)
+        np.testing.assert_allclose(
+            timestamp, [ystart - 366*24*3600 + 10, ystart + 5 + 500e-9])
+        np.testing.assert_array_equal(value, values)
+        np.testing.assert_array_equal(status, [0, 1])
+        np.testing.assert_array_equal(severity, [0, 3])
+        self.assertEqual(raw_to_columns(b'')[0].size, 0)
+
+    def test_raw_waveform(self):
+        """Test parsing of PB waveform of sint32 values."""
+        packed = b''.join(_varint((v << 1) ^ (v >> 31)) for v in (1, -2, 3))
+        stream = _pb_line((1, 0, 8), (2, 2, b'PV'), (3, 0, 1970))
+        stream += _pb_line((1, 0, 1), (2, 0, 0), (3, 2, packed))
+        _, value, _, _ = raw_to_columns(stream)
+        np.testing.assert_array_equal(value, [[1, -2, 3]])
+
+    def test_raw_int(self):
+        """Test parsing of PB scalar and waveform of sfixed32 values."""
+        stream = _pb_line((1, 0, 5), (2, 2, b'PV'), (3, 0, 1970))
+        for secs, val in ((1, -70000), (2, 2**31 - 1)):
+            stream += _pb_line(
+                (1, 0, secs), (2, 0, 0), (3, 5, struct.pack('<i', val)))
+        _, value, _, _ = raw_to_columns(stream)
+        np.testing.assert_array_equal(value, [-70000, 2**31 - 1])
+
+        packed = struct.pack('<3i', 1, -2, 100000)
+        stream = _pb_line((1, 0, 12), (2, 2, b'PV'), (3, 0, 1970))
+        stream += _pb_line((1, 0, 1), (2, 0, 0), (3, 2, packed))
+        _, value, _, _ = raw_to_columns(stream)
+        np.testing.assert_array_equal(value, [[1, -2, 100000]])
+
+
+class TestClientArchiverData(TestCase):
+    """Test ClientArchiver data retrieval with a fake archiver server."""
+
+    tstarts = [
+        '1970-01-01T00:00:10+00:00', '1970-01-01T00:00:11.500000+00:00',
+        '1970-01-01T00:00:13+00:00']
+    tstops = tstarts[1:] + ['1970-01-01T00:00:14+00:00']
+    # last sample before each interval is also in its response.
+    samples = [(10, 0, 1.0, 0, 0), (11, 0, 2.0, 0, 0), (12, 0, 3.0, 1, 2)]
+
+    def setUp(self):
+        """Common setup for all tests."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeArchiverServer(self.samples)
+        self.loop.run_until_complete(self.server.start())
+        self.client = ClientArchiver(server_url=self.server.url)
+        self.client.retry_backoff = 0.01
+
+    def tearDown(self):
+        """Common teardown for all tests."""
+        self.client.close()
+        self.loop.run_until_complete(self.server.stop())
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def test_get_data(self):
+        """Test getData concatenates time intervals of each format."""
+        for data_format in ('json', 'raw'):
+            timestamp, value, status, severity = self.client.getData(
+                'PV', self.tstarts, self.tstops, data_format=data_format)
+            np.testing.assert_allclose(timestamp, [10, 11, 12])
+            np.testing.assert_allclose(value, [1.0, 2.0, 3.0])
+            np.testing.assert_array_equal(status, [0, 0, 2])
+            np.testing.assert_array_equal(severity, [0, 0, 1])
+
+    def test_get_data_pvs(self):
+        """Test getData of many PVs."""
+        data = self.client.getData(
+            ['PV1', 'PV2'], self.tstarts[0], self.tstops[0])
+        self.assertEqual(sorted(data), ['PV1', 'PV2'])
+        np.testing.assert_allclose(data['PV2'][0], [10, 11])
+        self.server.samples = []
+        data = self.client.getData(['PV1', 'PV2'], self.tstarts, self.tstops)
+        self.assertEqual(data, {
+            'PV1': [None, None, None, None], 'PV2': [None, None, None, None]})
+
+    def test_get_data_invalid_format(self):
+        """Test getData raises for invalid data formats."""
+        with self.assertRaises(ValueError):
+            self.client.getData('PV', 't0', 't1', data_format='csv')
+
+    def test_get_data_chunks(self):
+        """Test getDataChunks yields every PV time interval."""
+        chunks = list(self.client.getDataChunks(
+            ['PV1', 'PV2'], self.tstarts, self.tstops))
+        self.assertEqual(len(chunks), 6)
+        self.assertEqual(
+            sorted(pvn for pvn, *_ in chunks), ['PV1']*3 + ['PV2']*3)
+        sizes = {(pvn, idx): data[0].size for pvn, idx, data in chunks}
+        self.assertEqual(sizes, {
+            ('PV1', 0): 2, ('PV1', 1): 2, ('PV1', 2): 1,
+            ('PV2', 0): 2, ('PV2', 1): 2, ('PV2', 2): 1})
+
+    def test_get_data_chunks_close(self):
+        """Test getDataChunks can be closed before all chunks arrive."""
+        chunks = self.client.getDataChunks('PV', self.tstarts, self.tstops)
+        pvname, _, _ = next(chunks)
+        chunks.close()
+        self.assertEqual(pvname, 'PV')
+
+    def test_bounded_concurrency(self):
+        """Test number of simultaneous requests is bounded."""
+        self.server.delay = 0.01
+        self.client.max_concurrency = 4
+        progress = []
+        self.client.progress_callback = \
+            lambda done, total: progress.append((done, total))
+        data = self.client.getData(
+            ['PV{}'.format(i) for i in range(10)], self.tstarts, self.tstops)
+        self.assertEqual(len(data), 10)
+        self.assertEqual(self.server.max_in_flight, 4)
+        self.assertEqual(progress, [(i, 30) for i in range(1, 31)])
+
+    def test_retries(self):
+        """Test failed requests are retried."""
+        self.server.failures = 3
+        data = self.client.getData('PV', self.tstarts, self.tstops)
+        np.testing.assert_allclose(data[0], [10, 11, 12])
+        self.client.max_retries = 1
+        self.server.failures = 2
+        chunks = list(self.client.getDataChunks(
+            'PV', self.tstarts[:1], self.tstops[:1]))
+        self.assertEqual(chunks, [('PV', 0, None)])
+
+    def test_failed_chunk(self):
+        """Test a permanently failed chunk only misses its data."""
+        self.server.failing_starts.add(10)
+        data = self.client.getData(
+            ['PV1', 'PV2'], self.tstarts, self.tstops)
+        for pvn in ('PV1', 'PV2'):
+            np.testing.assert_allclose(data[pvn][0], [11, 12])
+        self.server.failing_starts.update({11.5, 13})
+        self.assertIsNone(self.client.getData('PV', self.tstarts, self.tstops))
+
+    def test_lost_chunk(self):
+        """Test a chunk timing out or losing connection only misses it."""
+        self.client.timeout = 0.1
+        self.client.max_retries = 1
+        self.server.hanging_starts.add(10)
+        self.server.dropping_starts.add(13)
+        data = self.client.getData(
+            ['PV1', 'PV2'], self.tstarts, self.tstops)
+        for pvn in ('PV1', 'PV2'):
+            np.testing.assert_allclose(data[pvn][0], [11, 12])
+        chunks = list(self.client.getDataChunks(
+            'PV', self.tstarts, self.tstops))
+        self.assertEqual(
+            sorted(idx for _, idx, dat in chunks if dat is None), [0, 2])
+        self.assertEqual(len(chunks), 3)
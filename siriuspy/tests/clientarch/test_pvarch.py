@@ -0,0 +1,132 @@
+#!/usr/bin/env python-sirius
+
+"""Test clientarch pvarch and cache modules."""
+
+import asyncio
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from siriuspy.clientarch import ClientArchiver, DataCache, PVData, PVDataSet
+
+from .test_client import FakeArchiverServer
+
+
+class TestDataCache(TestCase):
+    """Test DataCache class."""
+
+    def setUp(self):
+        """Common setup for all tests."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = DataCache(path=self.tmpdir.name)
+
+    def tearDown(self):
+        """Common teardown for all tests."""
+        self.tmpdir.cleanup()
+
+    def test_get_put(self):
+        """Test cached data and missing keys."""
+        key = DataCache.get_key('PV', 0, 10, process_type='', interval=None)
+        self.assertNotEqual(
+            key, DataCache.get_key('PV', 0, 10, process_type='mean'))
+        self.assertIsNone(self.cache.get(key))
+        columns = [
+            np.array([1.0, 2.0]), np.array([3.0, 4.0]),
+            np.array([0, 1]), np.array([0, 2])]
+        self.cache.put(key, columns)
+        for col, cached in zip(columns, self.cache.get(key)):
+            np.testing.assert_array_equal(col, cached)
+        # bins without data are cached as empty columns.
+        self.cache.put(key, [None, None, None, None])
+        self.assertEqual(self.cache.get(key)[0].size, 0)
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(key))
+
+    def test_is_closed(self):
+        """Test only old bins are closed."""
+        self.assertTrue(DataCache.is_closed(0))
+        self.assertFalse(DataCache.is_closed(1e12))
+
+    def test_eviction(self):
+        """Test least recently used data is evicted."""
+        columns = [np.zeros(100)] * 4
+        keys = [DataCache.get_key('PV', i, i+1) for i in range(4)]
+        for i, key in enumerate(keys):
+            self.cache.put(key, columns)
+            os.utime(self.cache._get_fname(key), (i, i))
+        self.cache.get(keys[0])
+        fsize = os.path.getsize(self.cache._get_fname(keys[0]))
+        self.cache.max_size = 2.5 * fsize
+        self.assertLessEqual(self.cache.size, self.cache.max_size)
+        cached = [self.cache.get(key) is not None for key in keys]
+        self.assertEqual(cached, [True, False, False, True])
+
+
+class TestPVDataSetCache(TestCase):
+    """Test PVDataSet updates with a data cache."""
+
+    samples = [(t, 0, float(t), 0, 0) for t in range(0, 100, 3)]
+
+    def setUp(self):
+        """Common setup for all tests."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = FakeArchiverServer(self.samples)
+        self.loop.run_until_complete(self.server.start())
+        self.client = ClientArchiver(server_url=self.server.url)
+
+    def tearDown(self):
+        """Common teardown for all tests."""
+        self.client.close()
+        self.loop.run_until_complete(self.server.stop())
+        self.loop.close()
+        asyncio.set_event_loop(None)
+        self.tmpdir.cleanup()
+
+    def _create_dataset(self, cache):
+        dataset = PVDataSet(['PV1', 'PV2'], self.client, cache=cache)
+        dataset.timestamp_start = 25.0
+        dataset.timestamp_stop = 62.0
+        dataset.parallel_query_bin_interval = 10
+        return dataset
+
+    def test_update(self):
+        """Test cached bins are not retrieved again."""
+        dataset = self._create_dataset(DataCache(path=self.tmpdir.name))
+        dataset.update()
+        # bins from 20 to 70 seconds.
+        self.assertEqual(len(self.server.requests), 2*5)
+        self.server.requests.clear()
+
+        dataset = self._create_dataset(DataCache(path=self.tmpdir.name))
+        dataset.update()
+        self.assertEqual(len(self.server.requests), 0)
+
+        nocache = self._create_dataset(None)
+        nocache.update()
+        for pvname in ('PV1', 'PV2'):
+            np.testing.assert_array_equal(
+                dataset[pvname].timestamp, nocache[pvname].timestamp)
+            np.testing.assert_array_equal(
+                dataset[pvname].value, nocache[pvname].value)
+        np.testing.assert_array_equal(
+            dataset['PV1'].timestamp, np.arange(24, 61, 3))
+
+    def test_pvdata_update(self):
+        """Test PVData update with a cache."""
+        pvdata = PVData('PV', self.client, cache=DataCache(self.tmpdir.name))
+        pvdata.timestamp_start = 25.0
+        pvdata.timestamp_stop = 35.0
+        pvdata.parallel_query_bin_interval = 10
+        pvdata.update()
+        pvdata.timestamp_start = 20.0
+        pvdata.update()
+        # both bins were cached in the first update.
+        self.assertEqual(
+            sorted(req[1:] for req in self.server.requests),
+            [(20.0, 30.0), (30.0, 40.0)])
+        np.testing.assert_array_equal(
+            pvdata.timestamp, [18, 21, 24, 27, 30, 33])
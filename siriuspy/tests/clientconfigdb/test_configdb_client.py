@@ -1,10 +1,15 @@
 #!/usr/bin/env python-sirius
 
 """Test the configuration client class."""
+import os
+import sys
+import tempfile
 from unittest import TestCase
 
 from siriuspy.clientconfigdb import ConfigDBClient, ConfigDBDocument
 
+from siriuspy.clientconfigdb import _templates
+from siriuspy.clientconfigdb import types as _types
 import siriuspy.util as util
 
 
@@ -19,6 +24,8 @@ class TestConfigDBClient(TestCase):
         "get_nrconfigs",
         "get_config_types",
         "get_config_types_from_templates",
+        "load_templates_cache",
+        "save_templates_cache",
         "find_configs",
         "get_config_value",
         "get_config_info",
@@ -73,6 +80,53 @@ class TestConfigDBDocument(TestCase):
         self.assertTrue(valid)
 
 
+class TestConfigDBTemplates(TestCase):
+    """Test configuration type templates."""
+
+    def test_get_value_from_template(self):
+        """Test templates are copied unless requested otherwise."""
+        client = ConfigDBClient(config_type='bo_orbit')
+        self.assertIn('bo_orbit', client.get_config_types_from_templates())
+        value = client.get_value_from_template()
+        self.assertEqual(value, {'x': 50*[0.0], 'y': 50*[0.0]})
+        value['x'][0] = 1.0
+        shared = client.get_value_from_template(copy=False)
+        self.assertEqual(shared['x'][0], 0.0)
+        self.assertIs(shared, client.get_value_from_template(copy=False))
+        self.assertTrue(client.check_valid_value(value))
+        self.assertEqual(client.get_value_from_template('invalid'), dict())
+
+    def test_templates_cache(self):
+        """Test templates are loaded from cache without type modules."""
+        module = 'siriuspy.clientconfigdb.types.bo_ramp'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, 'templates.pickle')
+            ConfigDBClient.save_templates_cache(
+                fname, config_types=['bo_ramp'])
+            _templates._TEMPLATES.pop('bo_ramp')
+            sys.modules.pop(module)
+            delattr(_types, 'bo_ramp')
+            ConfigDBClient.load_templates_cache(fname)
+        client = ConfigDBClient(config_type='bo_ramp')
+        self.assertIn('ps_ramp', client.get_value_from_template())
+        self.assertNotIn(module, sys.modules)
+
+    def test_import_without_module_getattr(self):
+        """Test type modules are imported without module __getattr__."""
+        module = 'siriuspy.clientconfigdb.types.si_orbit'
+        _templates._TEMPLATES.pop('si_orbit', None)
+        if module in sys.modules:
+            sys.modules.pop(module)
+            delattr(_types, 'si_orbit')
+        getattr_ = _types.__dict__.pop('__getattr__')
+        try:
+            value = _templates.get_template('si_orbit')
+        finally:
+            _types.__getattr__ = getattr_
+        self.assertIn('x', value)
+        self.assertIn(module, sys.modules)
+
+
 class TestConfigServiceConTimestamp(TestCase):
     """Test response error handling."""
 
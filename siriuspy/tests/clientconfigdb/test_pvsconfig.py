@@ -0,0 +1,111 @@
+#!/usr/bin/env python-sirius
+
+"""Test the PVs configuration class."""
+
+from unittest import TestCase, mock
+
+import numpy as np
+
+from siriuspy.clientconfigdb import PVsConfig
+
+
+class _FakePV:
+    """Fake PV whose puts complete immediately."""
+
+    def __init__(self, pvname, value, connected=True):
+        self.pvname = pvname
+        self.chid = pvname
+        self.value = value
+        self.connected = connected
+        self.puts = list()
+
+    def put(self, value, callback=None, callback_data=None):
+        self.puts.append(value)
+        self.value = value
+        callback(pvname=self.pvname, data=callback_data)
+
+
+class TestPVsConfig(TestCase):
+    """Test PVsConfig machine snapshot and restore."""
+
+    template = {'pvs': [
+        ['A:Scalar-SP', 0.0, 0.0],
+        ['A:Enum-Sel', 0, 0.2],
+        ['A:Array-SP', [0.0, 0.0], 0.0],
+        ['A:Reset-Cmd', 1, 0.0],
+        ]}
+
+    def setUp(self):
+        """Common setup for all tests."""
+        self.pvs = {
+            'A:Scalar-SP': _FakePV('A:Scalar-SP', 1.5),
+            'A:Enum-Sel': _FakePV('A:Enum-Sel', 2),
+            'A:Array-SP': _FakePV('A:Array-SP', np.array([1.0, 2.0])),
+            'A:Reset-Cmd': _FakePV('A:Reset-Cmd', 0),
+            }
+        self.sleeps = list()
+        patches = [
+            mock.patch('siriuspy.clientconfigdb.configdb_document.'
+                       '_ConfigDBClient'),
+            mock.patch('siriuspy.clientconfigdb.pvsconfig._get_pv',
+                       side_effect=lambda pvn, **_: self.pvs[pvn]),
+            mock.patch('siriuspy.clientconfigdb.pvsconfig._time.sleep',
+                       side_effect=self.sleeps.append),
+            ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        pvsca = mock.patch('siriuspy.clientconfigdb.pvsconfig._ca')
+        self.ca = pvsca.start()
+        self.addCleanup(pvsca.stop)
+        self.ca.get_complete.side_effect = \
+            lambda chid, **_: self.pvs[chid].value
+        PVsConfig.PVs = dict()
+        self.config = PVsConfig(name='test')
+        self.config.get_value_from_template = lambda **_: self.template
+
+    def test_read(self):
+        """Test machine state is read at once."""
+        status, failed = self.config.read()
+        self.assertTrue(status)
+        self.assertEqual(failed, [])
+        pvs = self.config.value['pvs']
+        self.assertEqual([pvn for pvn, _, _ in pvs], list(self.pvs))
+        self.assertEqual(pvs[0][1:], [1.5, 0.0])
+        self.assertEqual(pvs[1][1:], [2, 0.2])
+        np.testing.assert_array_equal(pvs[2][1], [1.0, 2.0])
+        # commands are not read.
+        self.assertEqual(pvs[3][1], 1)
+        self.assertEqual(self.ca.get.call_count, 3)
+
+    def test_read_failures(self):
+        """Test PVs not connected or not read are reported."""
+        self.pvs['A:Enum-Sel'].connected = False
+        self.pvs['A:Array-SP'].value = None
+        status, failed = self.config.read(connection_timeout=0.0)
+        self.assertFalse(status)
+        self.assertEqual(failed, {'A:Enum-Sel', 'A:Array-SP'})
+
+    def test_apply(self):
+        """Test config is applied in stages and checked."""
+        self.config._value = {'pvs': [
+            ['A:Scalar-SP', 3.0, 0.0],
+            ['A:Enum-Sel', 1, 0.2],
+            ['A:Array-SP', [3.0, 4.0], 0.0],
+            ['A:Reset-Cmd', 1, 0.0],
+            ]}
+        status, failed = self.config.apply()
+        self.assertTrue(status)
+        self.assertEqual(failed, [])
+        self.assertEqual(self.sleeps, [0.2])
+        self.assertEqual(self.pvs['A:Scalar-SP'].puts, [3.0])
+
+        # values not implemented are reported.
+        self.pvs['A:Array-SP'].put = lambda *_, **__: None
+        self.pvs['A:Scalar-SP'].put = \
+            lambda value, callback, callback_data: callback(data=callback_data)
+        self.config._value['pvs'][0][1] = 5.0
+        self.config._value['pvs'][2][1] = [5.0, 6.0]
+        status, failed = self.config.apply(put_timeout=0.0)
+        self.assertFalse(status)
+        self.assertEqual(failed, {'A:Scalar-SP', 'A:Array-SP'})
@@ -1,6 +1,9 @@
 #!/usr/bin/env python-sirius
 """Test webserver implementation module."""
+import os
+import tempfile
 from unittest import TestCase, mock
+from urllib.error import HTTPError
 from urllib.request import URLError
 
 from siriuspy.clientweb import implementation
@@ -52,6 +55,66 @@ class TestClientWebReadUrl(TestCase):
             implementation.read_url("FakeURL")
 
 
+class TestClientWebBundle(TestCase):
+    """Test bundles of web server data."""
+
+    def setUp(self):
+        """Common setup for all tests."""
+        env_patcher = mock.patch.object(
+            implementation, '_envars', autospec=True)
+        self.addCleanup(env_patcher.stop)
+        env_mock = env_patcher.start()
+        env_mock.SRVURL_CSCONSTS = 'http://server1'
+        env_mock.SRVURL_CSCONSTS_2 = 'http://server2'
+        self.texts = {'/a.txt': ('A', '"a1"'), '/b.txt': ('B', '"b1"')}
+        self.requests = []
+        url_patcher = mock.patch.object(
+            implementation._urllib_request, 'urlopen',
+            side_effect=self._urlopen)
+        self.addCleanup(url_patcher.stop)
+        url_patcher.start()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(implementation.bundle_clear)
+        self.fname = os.path.join(self.tmpdir.name, 'bundle.pickle')
+
+    def _urlopen(self, request, timeout):
+        url = request.full_url.replace('http://server1', '')
+        self.requests.append(url)
+        text, etag = self.texts[url]
+        if request.get_header('If-none-match') == etag:
+            raise HTTPError(request.full_url, 304, 'Not Modified', {}, None)
+        response = mock.Mock(headers={'ETag': etag})
+        response.read.return_value = text.encode()
+        return response
+
+    def test_bundle(self):
+        """Test bundles are saved, loaded and refreshed."""
+        with self.assertRaises(ValueError):
+            implementation.bundle_save(self.fname)
+        implementation.bundle_create()
+        self.assertEqual(implementation.read_url('/a.txt'), 'A')
+        self.assertEqual(implementation.read_url('/b.txt'), 'B')
+        implementation.bundle_save(self.fname)
+        implementation.bundle_clear()
+
+        implementation.bundle_load(self.fname)
+        self.requests.clear()
+        self.assertEqual(implementation.read_url('/a.txt'), 'A')
+        self.assertEqual(self.requests, [])
+        self.assertTrue(implementation.bundle_has('/a.txt'))
+        self.assertFalse(implementation.bundle_has('/c.txt'))
+        # servers do not have the root URL, so they are reported offline.
+        self.assertFalse(implementation.server_online())
+        self.requests.clear()
+
+        self.texts['/b.txt'] = ('B2', '"b2"')
+        self.assertEqual(implementation.bundle_refresh(), ['/b.txt'])
+        self.assertEqual(self.requests, ['/a.txt', '/b.txt'])
+        self.assertEqual(implementation.read_url('/a.txt'), 'A')
+        self.assertEqual(implementation.read_url('/b.txt'), 'B2')
+
+
 @mock.patch.object(implementation, 'read_url', autospec=True,
                    return_value="FakeResponse")
 class TestClientWeb(TestCase):
@@ -60,6 +123,12 @@ class TestClientWeb(TestCase):
     public_interface = {
         'read_url',
         'server_online',
+        'bundle_create',
+        'bundle_has',
+        'bundle_clear',
+        'bundle_save',
+        'bundle_load',
+        'bundle_refresh',
         'magnets_model_data',
         'magnets_excitation_data_read',
         'magnets_excitation_ps_read',
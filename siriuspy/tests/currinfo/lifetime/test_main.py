@@ -4,8 +4,10 @@
 
 import unittest
 from unittest import mock
+import numpy as np
 import siriuspy.util as util
 from siriuspy.currinfo import SILifetimeApp
+from siriuspy.currinfo.lifetime.main import _RunningFit
 
 
 PUB_INTERFACE = (
@@ -61,5 +63,61 @@ class TestASAPCurrInfoLifetimeMain(unittest.TestCase):
         self.assertEqual(self.app._current_offset, 1)
 
 
+class TestRunningFit(unittest.TestCase):
+    """Test incremental lifetime fit."""
+
+    @staticmethod
+    def _fit(timestamp, value, now, fit):
+        """Return lifetime of direct least squares fit."""
+        if fit == 'exp':
+            value = np.log(value)
+        fit_b, fit_a = np.polyfit(timestamp - now, value, 1)
+        return -1/fit_b if fit == 'exp' else -fit_a/fit_b
+
+    def test_sliding_window(self):
+        """Test fits of a sliding window match direct fits."""
+        rng = np.random.default_rng(0)
+        timestamp = 1.7e9 + np.cumsum(rng.uniform(0.05, 0.15, 5000))
+        value = 100*np.exp(-(timestamp - timestamp[0])/36000)
+        value += rng.normal(0, 1e-3, timestamp.size)
+        offset = 1.0
+        runfit = _RunningFit()
+        for idx in range(1000, 5000, 250):
+            now = timestamp[idx]
+            first = now - 60
+            runfit.update(timestamp[:idx+1], value[:idx+1], first, now)
+            sel = (timestamp >= first) & (timestamp <= now)
+            self.assertEqual(len(runfit), np.count_nonzero(sel))
+            for fit in ('lin', 'exp'):
+                self.assertAlmostEqual(
+                    runfit.get_lifetime(now, offset, fit=fit) /
+                    self._fit(timestamp[sel], value[sel]-offset, now, fit),
+                    1.0, places=8)
+
+    def test_views(self):
+        """Test window samples are views of the updated arrays."""
+        timestamp = np.arange(10.0)
+        value = np.linspace(2, 1, 10)
+        runfit = _RunningFit()
+        runfit.update(timestamp[:6], value[:6], 2, 5)
+        runfit.update(timestamp, value, 4, 9)
+        np.testing.assert_array_equal(runfit.timestamps, timestamp[4:])
+        self.assertTrue(np.shares_memory(runfit.values, value))
+        self.assertAlmostEqual(
+            runfit.get_lifetime(9, fit='lin'),
+            self._fit(timestamp[4:], value[4:], 9, 'lin'))
+
+    def test_decimation(self):
+        """Test samples closer than minimum interval are skipped."""
+        timestamp = np.array([0.0, 0.5, 1.2, 1.3, 2.5, 3.0, 3.8])
+        value = np.ones(timestamp.size)
+        runfit = _RunningFit()
+        runfit.update(timestamp[:4], value[:4], 0, 1.3, min_intvl=1.0)
+        np.testing.assert_array_equal(runfit.timestamps, [0.0, 1.2])
+        runfit.update(timestamp, value, 0.5, 3.8, min_intvl=1.0)
+        np.testing.assert_array_equal(runfit.timestamps, [1.2, 2.5, 3.8])
+        self.assertEqual(runfit.get_lifetime(3.8, fit='exp'), 0.0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python-sirius
+
+"""Test devices bbb module."""
+
+import threading
+import time
+from unittest import TestCase
+
+import numpy as np
+
+from siriuspy.devices.bbb import _Scan
+
+
+class _FakePV:
+    """PV with callbacks run by the fake device."""
+
+    def __init__(self):
+        self.callbacks = dict()
+
+    def add_callback(self, callback):
+        """."""
+        index = len(self.callbacks) + 1
+        self.callbacks[index] = callback
+        return index
+
+    def remove_callback(self, index):
+        """."""
+        del self.callbacks[index]
+
+
+class _FakeDevice:
+    """Device with data updated periodically to the last value set."""
+
+    def __init__(self, period=0.02):
+        self.pvobj = _FakePV()
+        self.value = 0.0
+        self.data = np.zeros(3)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._update, args=(period, ), daemon=True)
+        self._thread.start()
+
+    def pv_object(self, propty):
+        """."""
+        _ = propty
+        return self.pvobj
+
+    def stop(self):
+        """."""
+        self._stop.set()
+        self._thread.join()
+
+    def __getitem__(self, propty):
+        return self.data
+
+    def _update(self, period):
+        while not self._stop.wait(period):
+            self.data = np.full(3, self.value)
+            for callback in list(self.pvobj.callbacks.values()):
+                callback(pvname='MEAN', value=self.data)
+
+
+class TestScan(TestCase):
+    """Test scan engine of BunchbyBunch sweeps."""
+
+    def setUp(self):
+        """Common setup for all tests."""
+        self.devs = {'H': _FakeDevice(), 'V': _FakeDevice()}
+        for dev in self.devs.values():
+            self.addCleanup(dev.stop)
+
+    def _set_value(self, value):
+        for dev in self.devs.values():
+            dev.value = value
+
+    def test_run(self):
+        """Test data is read after updates following each step."""
+        monitors = {key: (dev, 'MEAN') for key, dev in self.devs.items()}
+        scan = _Scan(self._set_value, monitors, timeout=5)
+        steps = []
+        tini = time.time()
+        data = scan.run(
+            [1.0, 2.0, 3.0], lambda *args: steps.append(args[:3]))
+        self.assertLess(time.time() - tini, 5)
+        for key in self.devs:
+            np.testing.assert_array_equal(
+                data[key], np.repeat([[1.0], [2.0], [3.0]], 3, axis=1))
+            self.assertEqual(self.devs[key].pvobj.callbacks, dict())
+        self.assertEqual(
+            steps, [(key, idx, val) for idx, val in enumerate([1, 2, 3])
+                    for key in ('H', 'V')])
+
+    def test_timeout(self):
+        """Test data is read after timeout without updates."""
+        dev = self.devs['H']
+        dev.stop()
+        dev.data = np.ones(3)
+        scan = _Scan(self._set_value, {'H': (dev, 'MEAN')}, timeout=0.01)
+        data = scan.run([1.0, 2.0])
+        np.testing.assert_array_equal(data['H'], np.ones((2, 3)))
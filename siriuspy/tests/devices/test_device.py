@@ -0,0 +1,117 @@
+#!/usr/bin/env python-sirius
+
+"""Test devices device module."""
+
+import threading
+import time
+from unittest import TestCase
+
+from siriuspy.devices.device import Device, Devices
+
+
+class _FakePV:
+    """PV running callbacks when its value is set."""
+
+    def __init__(self, auto_monitor=True):
+        self.auto_monitor = auto_monitor
+        self.callbacks = dict()
+        self.value = 0
+
+    def add_callback(self, callback, **kwargs):
+        """."""
+        _ = kwargs
+        index = len(self.callbacks) + 1
+        self.callbacks[index] = callback
+        return index
+
+    def remove_callback(self, index):
+        """."""
+        del self.callbacks[index]
+
+    def put(self, value):
+        """."""
+        self.value = value
+        if self.auto_monitor:
+            for callback in list(self.callbacks.values()):
+                callback(pvname='PV', value=value, cb_info=None)
+
+
+class _FakeDevice:
+    """Device with one PV per property."""
+
+    properties = ('Sts', 'Mon')
+
+    def __init__(self, devname):
+        self.devname = devname
+        self.pvs = {'Sts': _FakePV(), 'Mon': _FakePV(auto_monitor=False)}
+
+    def pv_object(self, propty):
+        """."""
+        return self.pvs[propty]
+
+    def __getitem__(self, propty):
+        return self.pvs[propty].value
+
+    def put_later(self, propty, value, delay):
+        """Set property value after delay."""
+        timer = threading.Timer(
+            delay, self.pvs[propty].put, args=(value, ))
+        timer.start()
+        return timer
+
+
+class TestWaitConditions(TestCase):
+    """Test waits for conditions on device properties."""
+
+    def setUp(self):
+        """Common setup for all tests."""
+        self.devs = [_FakeDevice('DEV{}'.format(i)) for i in range(3)]
+
+    def test_wait_conditions(self):
+        """Test wait returns as soon as all conditions are met."""
+        timers = [
+            dev.put_later('Sts', 1, 0.01*(i+1))
+            for i, dev in enumerate(self.devs)]
+        timers.append(self.devs[0].put_later('Mon', 5, 0.02))
+        conditions = [(dev, 'Sts', 1) for dev in self.devs]
+        conditions.append((self.devs[0], 'Mon', 3, 'gt'))
+        conditions.append((self.devs[1], 'Sts', 0, lambda x, y: x > y))
+        tini = time.time()
+        allok, prob = Devices.wait_conditions(conditions, timeout=2)
+        self.assertLess(time.time() - tini, 0.5)
+        self.assertTrue(allok)
+        self.assertEqual(prob, [])
+        for timer in timers:
+            timer.join()
+        for dev in self.devs:
+            self.assertEqual(dev.pvs['Sts'].callbacks, dict())
+
+    def test_wait_timeout(self):
+        """Test conditions not met are reported."""
+        self.devs[1].put_later('Sts', 1, 0.01).join()
+        allok, prob = Devices.wait_conditions(
+            [(dev, 'Sts', 1) for dev in self.devs] +
+            [(self.devs[0], 'Mon', 1)], timeout=0.1)
+        self.assertFalse(allok)
+        self.assertEqual(prob, ['DEV0:Sts', 'DEV2:Sts', 'DEV0:Mon'])
+
+    def test_wait_devices_propty(self):
+        """Test wait of devices property."""
+        devices = Devices('DEVS', self.devs)
+        for dev, val in zip(self.devs, (1, 2, 3)):
+            dev.pvs['Sts'].put(val)
+        allok, prob = devices.wait_devices_propty(
+            self.devs, 'Sts', [1, 2, 4], timeout=0.1)
+        self.assertFalse(allok)
+        self.assertEqual(prob, ['DEV2:Sts'])
+        self.assertTrue(devices.wait_devices_propty(
+            self.devs, 'Sts', 0, comp='gt', timeout=0.1)[0])
+
+    def test_wait_propty(self):
+        """Test wait of device property."""
+        dev = self.devs[0]
+        timer = dev.put_later('Sts', 2, 0.01)
+        self.assertTrue(Device.wait_propty(dev, 'Sts', 2, timeout=1))
+        timer.join()
+        self.assertFalse(
+            Device.wait_propty(dev, 'Sts', 2, comp='ne', timeout=0.1))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python-sirius
+
+"""Test pv_time_serie module."""
+
+import time
+from unittest import TestCase, mock
+
+import numpy as np
+
+from siriuspy.epics import SiriusPVTimeSerie
+
+
+class TestSiriusPVTimeSerie(TestCase):
+    """Test SiriusPVTimeSerie class."""
+
+    def setUp(self):
+        """Common setup for all tests."""
+        self.pvobj = mock.Mock(connected=True, value=0.0, timestamp=0.0)
+
+    def _acquire(self, serie, values, timestamps=None):
+        timestamps = values if timestamps is None else timestamps
+        for tstamp, value in zip(timestamps, values):
+            self.pvobj.timestamp, self.pvobj.value = tstamp, value
+            serie.acquire()
+
+    def test_nr_max_points(self):
+        """Test serie keeps last points."""
+        serie = SiriusPVTimeSerie(self.pvobj, nr_max_points=1500)
+        self._acquire(serie, np.arange(5000.0))
+        timestamp, value = serie.get_serie(time_absolute=True)
+        np.testing.assert_array_equal(value, np.arange(3500.0, 5000.0))
+        np.testing.assert_array_equal(timestamp, value)
+        serie.nr_max_points = 10
+        _, value = serie.get_serie(time_absolute=True)
+        np.testing.assert_array_equal(value, np.arange(4990.0, 5000.0))
+
+    def test_views(self):
+        """Test views are read-only and not changed by acquisitions."""
+        serie = SiriusPVTimeSerie(self.pvobj, nr_max_points=100)
+        self._acquire(serie, np.arange(100.0))
+        _, view = serie.get_serie(time_absolute=True, copy=False)
+        with self.assertRaises(ValueError):
+            view[0] = 1.0
+        self._acquire(serie, np.arange(100.0, 1000.0))
+        np.testing.assert_array_equal(view, np.arange(100.0))
+
+    def test_views_clear(self):
+        """Test views are not changed by acquisitions after clearing."""
+        serie = SiriusPVTimeSerie(self.pvobj)
+        self._acquire(serie, [1.0, 2.0])
+        timestamp, value = serie.get_serie(time_absolute=True, copy=False)
+        serie.clearserie()
+        self._acquire(serie, [3.0])
+        np.testing.assert_array_equal(timestamp, [1.0, 2.0])
+        np.testing.assert_array_equal(value, [1.0, 2.0])
+        _, value = serie.get_serie(time_absolute=True, copy=False)
+        np.testing.assert_array_equal(value, [3.0])
+
+    def test_time_window(self):
+        """Test points out of time window are removed."""
+        now = time.time()
+        serie = SiriusPVTimeSerie(
+            self.pvobj, time_window=10, timestamp_init_data=[now-20, now-5],
+            value_init_data=[1.0, 2.0])
+        timestamp, value = serie.get_serie()
+        np.testing.assert_array_equal(value, [2.0])
+        self.assertTrue(-6 < timestamp[0] < -4)
+        self._acquire(serie, [3.0, 4.0], [now-30, now])
+        _, value = serie.get_serie()
+        np.testing.assert_array_equal(value, [2.0, 4.0])
+
+    def test_time_min_interval(self):
+        """Test points closer than time_min_interval are removed."""
+        serie = SiriusPVTimeSerie(
+            self.pvobj, timestamp_init_data=[0, 1, 2, 3, 4, 5.5],
+            value_init_data=[0, 1, 2, 3, 4, 5])
+        serie.time_min_interval = 1.2
+        timestamp, value = serie.get_serie(time_absolute=True)
+        np.testing.assert_array_equal(timestamp, [0, 2, 4, 5.5])
+        np.testing.assert_array_equal(value, [0, 2, 4, 5])
@@ -0,0 +1,60 @@
+#!/usr/bin/env python-sirius
+
+"""Test excdata module."""
+from unittest import TestCase
+
+import numpy as np
+
+from siriuspy.magnet.excdata import ExcitationData, ExcitationDataStack
+
+
+TEXT_QUAD = """
+# label          quad
+# harmonics      0 1
+# main_harmonic  1 normal
+-2.0  0.0 0.0  -5.0 0.0
+ 0.0  0.0 0.0   0.0 0.0
+ 1.0  0.0 0.0   2.0 0.0
+ 2.0  0.0 0.0   3.0 0.0
+"""
+
+TEXT_CORR = """
+# label          corr
+# harmonics      0
+# main_harmonic  0 normal
+-10.0  2.0 0.0
+ 0.0   0.5 0.0
+10.0  -3.0 0.0
+"""
+
+
+class TestExcitationDataStack(TestCase):
+    """Test ExcitationDataStack class."""
+
+    def setUp(self):
+        """Common setup for all tests."""
+        self.quad = ExcitationData(text=TEXT_QUAD)
+        self.corr = ExcitationData(text=TEXT_CORR)
+        self.stack = ExcitationDataStack(
+            [self.quad, self.corr, self.corr],
+            [1, 0, 0], ['normal', 'normal', 'normal'])
+
+    def test_interp_curr2mult(self):
+        """Test interpolation, with extrapolation, matches ExcitationData."""
+        for currents in ([-3, -20, 0], [0.5, 5, 10], [2, 15, np.nan]):
+            expected = [
+                self.quad.interp_curr2mult(currents[0])['normal'][1],
+                self.corr.interp_curr2mult(currents[1])['normal'][0],
+                self.corr.interp_curr2mult(currents[2])['normal'][0]]
+            np.testing.assert_allclose(
+                self.stack.interp_curr2mult(currents), expected)
+
+    def test_interp_mult2curr(self):
+        """Test inverse interpolation matches ExcitationData."""
+        for mpoles in ([-6, 3, 0], [2.5, -1, -4], [4, 0.5, 1]):
+            expected = [
+                self.quad.interp_mult2curr(mpoles[0], 1, 'normal'),
+                self.corr.interp_mult2curr(mpoles[1], 0, 'normal'),
+                self.corr.interp_mult2curr(mpoles[2], 0, 'normal')]
+            np.testing.assert_allclose(
+                self.stack.interp_mult2curr(mpoles), expected)
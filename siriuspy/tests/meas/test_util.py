@@ -0,0 +1,109 @@
+#!/usr/bin/env python-sirius
+
+"""Test meas util module."""
+
+from threading import Event
+from unittest import TestCase, mock
+
+import numpy as np
+
+from siriuspy.meas import ProcessImage
+
+
+class TestProcessImage(TestCase):
+    """Test ProcessImage class."""
+
+    height, width = 40, 50
+
+    def setUp(self):
+        """Common setup for all tests."""
+        rng = np.random.default_rng(0)
+        axisy, axisx = np.mgrid[:self.height, :self.width]
+        beam = 1000*np.exp(
+            -(axisx - 24)**2/(2*4**2) - (axisy - 19)**2/(2*3**2))
+        self.frames = [
+            (beam + rng.integers(0, 20, beam.shape)).astype(np.uint16)
+            for _ in range(8)]
+        self.proc = ProcessImage()
+        self.proc.imagewidth = self.width
+        self.proc.roisizex = 20
+        self.proc.roisizey = 20
+
+    def tearDown(self):
+        """Common teardown for all tests."""
+        self.proc.stop_worker()
+
+    def test_average(self):
+        """Test average of the last images."""
+        proc = self.proc
+        proc.nr_averages = 3
+        for frame in self.frames[:5]:
+            proc.image = frame.ravel()
+        self.assertEqual(proc.buffer_size, 3)
+        np.testing.assert_allclose(
+            proc.image, np.mean(self.frames[2:5], axis=0).ravel())
+        # last images are kept when the number of averages changes.
+        proc.nr_averages = 2
+        proc.image = self.frames[5].ravel()
+        np.testing.assert_allclose(
+            proc.image, np.mean(self.frames[4:6], axis=0).ravel())
+        proc.nr_averages = 4
+        proc.image = self.frames[6].ravel()
+        self.assertEqual(proc.buffer_size, 3)
+        np.testing.assert_allclose(
+            proc.image, np.mean(self.frames[4:7], axis=0).ravel())
+        proc.cmd_reset_buffer()
+        proc.image = self.frames[7].ravel()
+        self.assertEqual(proc.buffer_size, 1)
+        np.testing.assert_allclose(proc.image, self.frames[7].ravel())
+
+    def test_background_crop(self):
+        """Test background subtraction and crop of averaged images."""
+        proc = self.proc
+        proc.nr_averages = 2
+        proc.background = np.full(self.height*self.width, 10.0)
+        proc.usebackground = True
+        proc.imagecrophigh = 500
+        proc.useimagecrop = True
+        proc.image = self.frames[0].ravel()
+        proc.image = self.frames[1].ravel()
+        image = np.mean(self.frames[:2], axis=0) - 10
+        np.testing.assert_allclose(
+            proc.image, np.clip(image, 0, 500).ravel())
+
+    def test_beam_params(self):
+        """Test beam parameters of gaussian fit and moments."""
+        proc = self.proc
+        proc.image = self.frames[0].ravel()
+        self.assertAlmostEqual(proc.beamcenterx, 24, delta=0.1)
+        self.assertAlmostEqual(proc.beamcentery, 19, delta=0.1)
+        self.assertAlmostEqual(proc.beamsizex, 4, delta=0.1)
+        self.assertAlmostEqual(proc.beamsizey, 3, delta=0.1)
+        proc.method = proc.Method.Moments
+        proc.image = self.frames[0].ravel()
+        self.assertAlmostEqual(proc.beamcenterx, 24, delta=0.5)
+
+    def test_worker(self):
+        """Test images are processed by the worker thread."""
+        proc = self.proc
+        processed = Event()
+        proc.add_callback(
+            lambda pvname, value, **_: pvname == 'BeamOffsetY-Mon' and
+            processed.set())
+        proc.start_worker()
+        proc.image = self.frames[0].ravel()
+        self.assertTrue(processed.wait(5))
+        np.testing.assert_allclose(proc.image, self.frames[0].ravel())
+        proc.stop_worker()
+        proc.image = self.frames[1].ravel()
+        np.testing.assert_allclose(proc.image, self.frames[1].ravel())
+
+    def test_worker_restart(self):
+        """Test restarted worker waits for new images."""
+        proc = self.proc
+        proc.start_worker()
+        proc.stop_worker()
+        with mock.patch.object(proc, '_process_image') as process:
+            proc.start_worker()
+            proc.stop_worker()
+        process.assert_not_called()
@@ -102,6 +102,19 @@ class TestSiriusPVName(TestCase):
     """Test SiriusPVName module."""
 
     public_interface = (
+        'channel_type',
+        'prefix',
+        'sec',
+        'sub',
+        'area_name',
+        'dis',
+        'dev',
+        'idx',
+        'propty_name',
+        'propty_suffix',
+        'propty',
+        'device_propty',
+        'field',
         'substitute',
         'device_name',
         'get_nickname',
@@ -139,7 +152,68 @@ class TestSiriusPVName(TestCase):
         self.assertEqual(n.device_propty, 'B1B2-1:Current-SP.AVG')
         self.assertEqual(n.field, 'AVG')
 
+    def test_parse_cache(self):
+        """Test identical names share their parsed attributes."""
+        name1 = namesys.SiriusPVName('SI-01M1:PS-QS-1:Current-SP')
+        name2 = namesys.SiriusPVName('SI-01M1:PS-QS-1:Current-SP')
+        self.assertIsNot(name1, name2)
+        self.assertIs(name1.device_propty, name2.device_propty)
+        self.assertFalse(hasattr(name1, '__dict__'))
+        name3 = name1.substitute(propty='Current-RB', field='AVG')
+        self.assertEqual(name3, 'SI-01M1:PS-QS-1:Current-RB.AVG')
+        self.assertEqual(name3.propty_suffix, 'RB')
+        self.assertEqual(name3.device_name, name1.device_name)
+
+    def test_parse_fallback(self):
+        """Test names not in the usual form are parsed as well."""
+        name = namesys.SiriusPVName('PA-PB-SI-Fam:PS-B-1-2:Cur-SP-X.A.B')
+        self.assertEqual(name.prefix, 'PA-PB')
+        self.assertEqual(name.idx, '1')
+        self.assertEqual(name.device_name, 'SI-Fam:PS-B-1-2')
+        self.assertEqual(name.propty, 'Cur-SP-X')
+        self.assertEqual(name.propty_suffix, 'SP')
+        self.assertEqual(name.field, 'A')
+        name = namesys.SiriusPVName('Current-SP')
+        self.assertEqual(name.propty_name, 'Current')
+        self.assertEqual(name.device_name, '')
+
     def test_string(self):
         """Test string."""
         n = namesys.SiriusPVName('ca://PREFIX-SI-Fam:PS-B1B2-1:Current-SP.AVG')
         self.assertIsInstance(n, str)
+
+
+class TestFilter(TestCase):
+    """Test Filter class."""
+
+    names = (
+        'SI-Fam:PS-QDA', 'SI-Fam:PS-QFA', 'SI-01M1:PS-QDA', 'SI-01M1:PS-CH',
+        'SI-01M2:PS-QS', 'BO-Fam:PS-B-1', 'BO-Fam:PS-B-2', 'BO-01U:PS-CH',
+        'BO-01U:PS-QS', 'TB-04:PU-InjSept', 'LA-CN:H1SLPS-18')
+
+    def test_process_filters(self):
+        """Test names are filtered in order."""
+        flt = namesys.Filter
+        self.assertIs(flt.process_filters(self.names), self.names)
+        self.assertEqual(
+            flt.process_filters(self.names, {'sec': 'SI', 'dev': 'QD'}),
+            ['SI-Fam:PS-QDA', 'SI-01M1:PS-QDA'])
+        self.assertEqual(
+            flt.process_filters(self.names, flt.filters.TRIM),
+            ['SI-01M1:PS-QDA', 'SI-01M1:PS-CH', 'SI-01M2:PS-QS',
+             'BO-01U:PS-CH', 'BO-01U:PS-QS', 'TB-04:PU-InjSept'])
+        self.assertEqual(
+            flt.process_filters(
+                self.names, [{'dev': 'B', 'idx': '2'}, {'dis': 'PU'}]),
+            ['BO-Fam:PS-B-2', 'TB-04:PU-InjSept'])
+        self.assertEqual(
+            flt.process_filters(self.names, {'sec': '(?:TB|BO)', 'sub': 'Fam'}),
+            ['BO-Fam:PS-B-1', 'BO-Fam:PS-B-2'])
+        self.assertEqual(
+            flt.process_filters(self.names, {'sec': 'LA'}), [])
+
+    def test_process_filters_unchanged(self):
+        """Test filters of callers are not changed."""
+        filters = [{'sec': 'SI', 'dev': None}]
+        namesys.Filter.process_filters(self.names, filters)
+        self.assertEqual(filters, [{'sec': 'SI', 'dev': None}])
@@ -9,6 +9,20 @@ from siriuspy.pwrsupply.pructrl.pru import PRUInterface
 from siriuspy.pwrsupply.pructrl.pru import PRU
 
 
+class _FakeEthBridgeClient:
+    """Eth-bridge client echoing request char-list streams."""
+
+    def __init__(self, ip_address):
+        self.ip_address = ip_address
+        self.streams = []
+
+    def request(self, stream, timeout):
+        """."""
+        _ = timeout
+        self.streams.append(stream)
+        return stream
+
+
 PUB_INTERFACE = (
     'PRUInterface',
     'PRU',
@@ -33,6 +47,7 @@ class TestPRUInterface(TestCase):
         'UART_write',
         'UART_read',
         'UART_request',
+        'UART_request_bytes',
         'wr_duration',
         'wr_duration_reset',
     )
@@ -96,6 +111,14 @@ class TestPRU(TestCase):
         # TODO: implement test!
         pass
 
+    def test_UART_request_bytes(self):
+        """Test UART_request_bytes sends char-list streams to eth-bridge."""
+        pru_ = PRU(_FakeEthBridgeClient, ip_address='127.0.0.1')
+        stream = bytes([0x01, 0x10, 0x00, 0x01, 0xff])
+        self.assertEqual(pru_.UART_request_bytes(stream, timeout=10), stream)
+        self.assertEqual(
+            pru_._ethbridge.streams, [list('\x01\x10\x00\x01\xff')])
+
     def test_close(self):
         """Test close."""
         # TODO: implement test!
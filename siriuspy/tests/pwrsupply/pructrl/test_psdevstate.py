@@ -0,0 +1,49 @@
+#!/usr/bin/env python-sirius
+
+"""Test PSDevState module."""
+import struct
+from unittest import TestCase
+from unittest.mock import Mock
+
+import numpy as np
+
+from siriuspy.pwrsupply.bsmp.commands import FBP
+from siriuspy.pwrsupply.pructrl.psdevstate import PSDevState
+
+
+class TestPSDevStateTable(TestCase):
+    """Test PSDevState reading variables from a table."""
+
+    def setUp(self):
+        """Common setup for all tests."""
+        self.psbsmp = FBP(1, Mock())
+        self.group = self.psbsmp.entities.groups[self.psbsmp.CONST.G_ALL]
+        # build a load with a firmware version and increasing numbers
+        values = []
+        for variable in self.group.variables:
+            if variable.eid == self.psbsmp.CONST.V_FIRMWARE_VERSION:
+                version = b'0.44.01' + bytes(variable.count - 7)
+                fmt = '{}c'.format(variable.count)
+                values.extend(struct.unpack(fmt, version))
+            else:
+                values.extend(range(variable.count))
+        self.load = self.group._struct.pack(*values)
+        self.psbsmp.read_group_of_variables_load = Mock(
+            return_value=(self.psbsmp.CONST_BSMP.ACK_OK, self.load))
+        self.psbsmp.parameter_read = Mock(return_value=0.0)
+
+    def test_variables_from_table(self):
+        """Test variables read from table match decoded group load."""
+        psupply = PSDevState(self.psbsmp)
+        table = np.zeros(2, dtype=self.group.dtype)
+        psupply.bind_variables_table(table, 1)
+        load = psupply.read_variables_load()
+        self.assertTrue(psupply.connected)
+        self.group.loads_to_array([None, load], table)
+        values = self.group.load_to_value(self.load)
+        expected = {
+            var.eid: value for var, value in zip(self.group.variables, values)}
+        self.assertEqual(psupply.variables, expected)
+        version = psupply.get_variable(self.psbsmp.CONST.V_FIRMWARE_VERSION)
+        self.assertEqual(
+            self.psbsmp.parse_firmware_version(version), '0.44.01')
@@ -2,6 +2,8 @@
 
 """Unittest module for enumtypes.py."""
 
+import os
+import tempfile
 from unittest import mock, TestCase
 import siriuspy.pwrsupply.csdev as csdev
 import siriuspy.util as util
@@ -28,6 +30,8 @@ PUB_INTERFACE = (
     'ETypes',
     'Const',
     'get_ps_propty_database',
+    'save_ps_propty_databases',
+    'load_ps_propty_databases',
     'get_conv_propty_database',
     'get_ps_interlocks',
     'get_ps_modules',
@@ -104,6 +108,8 @@ class TestPwrSupplyCSDev(TestCase):
             self.m_pssearch.get_splims.side_effect = get_splims
             self.m_pssearch.conv_psname_2_psmodel.return_value = 'FBP'
             self.m_pssearch.conv_pstype_2_magfunc.return_value = 'quadrupole'
+        # databases built with mocked searches must not be kept.
+        self.addCleanup(csdev._PS_DATABASES.clear)
 
     def test_public_interface(self):
         """Test module's public interface."""
@@ -166,6 +172,36 @@ class TestPwrSupplyCSDev(TestCase):
         for propty in proptys:
             self.assertIn(propty, dbase)
 
+    def test_ps_propty_database_cache(self):
+        """Test ps_propty_database is built once and copied."""
+        pstype = 'si-quadrupole-q14-fam'
+        dbase = csdev.get_ps_propty_database('FBP', pstype)
+        dbase['Current-SP']['value'] = 1.0
+        nr_calls = self.m_pssearch.get_splims.call_count
+        shared = csdev.get_ps_propty_database('FBP', pstype, copy=False)
+        self.assertEqual(shared['Current-SP']['value'], 0.0)
+        self.assertIs(
+            shared, csdev.get_ps_propty_database('FBP', pstype, copy=False))
+        self.assertEqual(
+            csdev.get_ps_propty_database('FBP', pstype).keys(),
+            shared.keys())
+        self.assertEqual(self.m_pssearch.get_splims.call_count, nr_calls)
+
+    def test_ps_propty_databases_file(self):
+        """Test ps_propty_databases saved to and loaded from a file."""
+        keys = [('FBP', 'si-quadrupole-q14-fam'), ('FAC_DCDC', 'bo-dipole')]
+        dbases = [csdev.get_ps_propty_database(*key) for key in keys]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, 'databases.pickle')
+            csdev.save_ps_propty_databases(fname, keys)
+            csdev._PS_DATABASES.clear()
+            csdev.load_ps_propty_databases(fname)
+        nr_calls = self.m_pssearch.get_splims.call_count
+        for key, dbase in zip(keys, dbases):
+            self.assertEqual(
+                csdev.get_ps_propty_database(*key).keys(), dbase.keys())
+        self.assertEqual(self.m_pssearch.get_splims.call_count, nr_calls)
+
     def test_ps_basic_propty_database(self):
         """Test ps_basic_propty_database."""
         dbase = csdev._get_ps_basic_propty_database()
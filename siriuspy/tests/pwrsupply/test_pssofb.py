@@ -0,0 +1,82 @@
+#!/usr/bin/env python-sirius
+
+"""Unittest module for pssofb.py."""
+
+from unittest import TestCase
+
+import numpy as np
+
+from siriuspy import util
+from siriuspy.pwrsupply.pssofb import LatencyRecorder
+
+
+class TestLatencyRecorder(TestCase):
+    """Test LatencyRecorder class."""
+
+    public_interface = (
+        'PHASES',
+        'STATS',
+        'DEFAULT_SIZE',
+        'create_buffers',
+        'rows',
+        'size',
+        'record',
+        'reset',
+        'get_latencies',
+        'get_histogram',
+        'get_worst',
+        'get_database',
+        'get_values',
+    )
+
+    def test_public_interface(self):
+        """Test class public interface."""
+        valid = util.check_public_interface_namespace(
+            LatencyRecorder, TestLatencyRecorder.public_interface)
+        self.assertTrue(valid)
+
+    def test_ring_buffer(self):
+        """Test ring buffers keep only last latencies."""
+        recorder = LatencyRecorder(('BBB1', 'BBB2'), size=4)
+        for dtime in range(6):
+            recorder.record('BBB1', 'update', dtime)
+        recorder.record('BBB2', 'update', 1.0)
+        self.assertEqual(
+            sorted(recorder.get_latencies('BBB1', 'update')), [2, 3, 4, 5])
+        self.assertEqual(len(recorder.get_latencies('BBB1', 'state')), 0)
+        recorder.reset()
+        self.assertEqual(len(recorder.get_latencies('BBB1', 'update')), 0)
+
+    def test_histogram(self):
+        """Test latency statistics."""
+        recorder = LatencyRecorder(('BBB1', 'BBB2', 'BBB3'), size=100)
+        for dtime in range(1, 101):
+            recorder.record('BBB1', 'setpoint', dtime)
+            recorder.record('BBB2', 'setpoint', 2*dtime)
+        hist = recorder.get_histogram('setpoint')
+        np.testing.assert_allclose(hist['p50'][:2], [50.5, 101.0])
+        np.testing.assert_allclose(hist['max'][:2], [100, 200])
+        self.assertTrue(np.isnan(hist['p99'][2]))
+        self.assertEqual(recorder.get_worst('setpoint')[0], 'BBB2')
+        self.assertIsNone(recorder.get_worst('state')[0])
+
+    def test_shared_buffers(self):
+        """Test recorders sharing buffers."""
+        rows = ('BBB1', 'BBB2')
+        buffers = LatencyRecorder.create_buffers(len(rows), size=10)
+        recorder1 = LatencyRecorder(rows, size=10, buffers=buffers)
+        recorder2 = LatencyRecorder(rows, size=10, buffers=buffers)
+        recorder1.record('BBB2', 'state', 3.0)
+        self.assertEqual(list(recorder2.get_latencies('BBB2', 'state')), [3])
+
+    def test_pvs(self):
+        """Test PV database and values."""
+        recorder = LatencyRecorder(('BBB1', ), size=10)
+        recorder.record('BBB1', 'conversion', 0.5)
+        dbase = recorder.get_database('SI-Glob:AP-SOFB:')
+        values = recorder.get_values('SI-Glob:AP-SOFB:')
+        self.assertEqual(set(dbase), set(values))
+        pvname = 'SI-Glob:AP-SOFB:LatencyConversionMax-Mon'
+        self.assertEqual(values[pvname][0], 0.5)
+        self.assertEqual(
+            values['SI-Glob:AP-SOFB:LatencySetpointP99-Mon'][0], 0)
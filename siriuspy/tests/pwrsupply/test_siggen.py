@@ -3,6 +3,9 @@
 """Unittest module for siggen.py."""
 
 from unittest import TestCase
+
+import numpy as np
+
 import siriuspy.util as util
 import siriuspy.pwrsupply.siggen as siggen
 
@@ -48,7 +51,9 @@ class TestSigGenConfig(TestCase):
         'theta_end',
         'plateau_time',
         'decay_time',
+        'get_values',
         'get_waveform',
+        'get_waveforms',
         'reset',
     )
 
@@ -95,5 +100,31 @@ class TestSigGenConfig(TestCase):
 
     def test_get_waveform(self):
         """Test get_waveform."""
-        # TODO: implement test!
-        pass
+        sig = siggen.SigGenFactory.create(
+            sigtype='Trapezoidal', num_cycles=2, amplitude=2.0, offset=1.0,
+            aux_param=[0.1, 0.2, 0.1, 0.0])
+        wfm, time = sig.get_waveform(9)
+        np.testing.assert_allclose(time, np.linspace(0, 0.8, 9))
+        np.testing.assert_allclose(
+            wfm, [1.0, 3.0, 3.0, 3.0, 1.0, 3.0, 3.0, 3.0, 1.0], atol=1e-12)
+        self.assertEqual(sig.get_values(1.0), 1.0)
+        for sigtype in siggen.SigGenFactory.TYPES:
+            sig = siggen.SigGenFactory.create(sigtype=sigtype)
+            wfm, time = sig.get_waveform(50)
+            values = [sig._get_value(tim) for tim in time]
+            np.testing.assert_allclose(wfm, values)
+
+    def test_get_waveforms(self):
+        """Test get_waveforms of signals with different parameters."""
+        signals = [
+            siggen.SigGenFactory.create(
+                sigtype=sigtype, amplitude=ampl, freq=1.0,
+                aux_param=[0.1, 0.2, 0.1, 0.0])
+            for sigtype in siggen.SigGenFactory.TYPES
+            for ampl in (1.0, 2.0)]
+        wfms, times = siggen.Signal.get_waveforms(signals, 30)
+        self.assertEqual(wfms.shape, (len(signals), 30))
+        for sig, wfm, time in zip(signals, wfms, times):
+            wfm0, time0 = sig.get_waveform(30)
+            np.testing.assert_allclose(wfm, wfm0)
+            np.testing.assert_allclose(time, time0)
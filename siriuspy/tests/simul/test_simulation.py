@@ -0,0 +1,126 @@
+#!/usr/bin/env python-sirius
+
+"""Test simul simulation module."""
+
+from unittest import TestCase
+
+from siriuspy.simul import Simulation, Simulator
+
+
+class _ToySimulator(Simulator):
+    """Simulator of PVs matching a set of regexps."""
+
+    def __init__(self, regexps):
+        super().__init__()
+        self.regexps = regexps
+        self.nr_checks = 0
+
+    def pv_check(self, pvname):
+        self.nr_checks += 1
+        return super().pv_check(pvname)
+
+    def callback_pv_dbase(self):
+        return {rege: {'type': 'float', 'value': i}
+                for i, rege in enumerate(self.regexps)}
+
+    def callback_pv_add(self, pvname):
+        """."""
+
+    def callback_pv_get(self, pvname, **kwargs):
+        """."""
+
+    def callback_pv_put(self, pvname, value, **kwargs):
+        return True
+
+    def callback_update(self, **kwargs):
+        """."""
+
+
+class _PVObj:
+
+    def __init__(self, pvname):
+        self.pvname = pvname
+
+
+class TestSimulation(TestCase):
+    """Test Simulation class."""
+
+    def setUp(self):
+        """Common setup for all tests."""
+        self.simps = _ToySimulator(['.*:PS-.*:Current-SP', '.*:PS-.*:Cur.*'])
+        self.simpu = _ToySimulator(['.*:PU-.*:Voltage-SP'])
+        self.simpsb = _ToySimulator(['.*:PS-.*:Current-SP'])
+        Simulation.simulator_register([self.simps, self.simpu])
+
+    def tearDown(self):
+        """Common teardown for all tests."""
+        Simulation.reset()
+
+    def test_simulator_find(self):
+        """Test simulators of pvnames are found and memoised."""
+        pvname = 'SI-Fam:PS-QFA:Current-SP'
+        self.assertEqual(Simulation.simulator_find(pvname), {self.simps})
+        self.assertIs(Simulation.simulator_find(pvname, True), self.simps)
+        self.assertEqual(Simulation.simulator_find('SI-Fam:PS-QFA:X'), set())
+        # simulators are only checked for pvnames matching their regexps.
+        self.assertEqual(self.simps.nr_checks, 1)
+        self.assertEqual(self.simpu.nr_checks, 0)
+        Simulation.simulator_find(pvname)
+        self.assertEqual(self.simps.nr_checks, 1)
+
+        # registration invalidates memo.
+        Simulation.simulator_register(self.simpsb)
+        self.assertEqual(
+            Simulation.simulator_find(pvname), {self.simps, self.simpsb})
+        Simulation.simulator_unregister(self.simps)
+        self.assertEqual(Simulation.simulator_find(pvname), {self.simpsb})
+
+    def test_simulator_find_check_regexps(self):
+        """Test simulators are checked for pvnames of their check regexps."""
+        simdev = _ToySimulator(['SI-Fam:PS-QDA:Current-SP'])
+        simdev.pv_check_regexps = lambda: ('SI-Fam:PS-QDA', )
+        simdev.pv_check = lambda pvname: pvname.startswith('SI-Fam:PS-QDA')
+        Simulation.simulator_register(simdev)
+        self.assertEqual(
+            Simulation.simulator_find('SI-Fam:PS-QDA:Volt-Mon'), {simdev})
+        self.assertEqual(
+            Simulation.simulator_find('SI-Fam:PS-QDA:Current-SP'),
+            {self.simps, simdev})
+
+    def test_inline_flags(self):
+        """Test regexps with inline flags are not combined with others."""
+        siminl = _ToySimulator(['(?i)si-fam:ps-qfb:current-sp'])
+        Simulation.simulator_register(siminl)
+        self.assertEqual(
+            Simulation.simulator_find('SI-Fam:PS-QFB:Current-SP'),
+            {self.simps, siminl})
+        self.assertEqual(
+            Simulation.simulator_find('SI-Fam:PS-QFB:CURRENT-SP'), {siminl})
+        self.assertEqual(
+            Simulation.pv_dbase_find('si-fam:pu-qfb:voltage-sp'), None)
+
+    def test_pv_dbase_find(self):
+        """Test databases of pvnames are found in registration order."""
+        dbase = Simulation.pv_dbase_find(
+            'SI-Fam:PS-QFA:Current-RB', unique=True)
+        self.assertEqual(dbase['value'], 1)
+        self.assertIsNone(Simulation.pv_dbase_find('SI-Fam:MA-QFA:Current-SP'))
+        with self.assertRaises(ValueError):
+            Simulation.pv_dbase_find('SI-Fam:PS-QFA:Current-SP')
+        Simulation.PV_DATABASE_UNIQUE = False
+        try:
+            dbases = Simulation.pv_dbase_find('SI-Fam:PS-QFA:Current-SP')
+        finally:
+            Simulation.PV_DATABASE_UNIQUE = True
+        self.assertEqual([dbase['value'] for dbase in dbases], [0, 1])
+
+    def test_get_pvnames(self):
+        """Test pvnames of simulators registered SimPVs."""
+        pvnames = ['SI-Fam:PS-QFA:Current-SP', 'TS-01:PU-EjeSeptG:Voltage-SP']
+        for pvname in pvnames:
+            self.assertTrue(Simulation.pv_register(_PVObj(pvname)))
+        self.assertFalse(Simulation.pv_register(_PVObj(pvnames[0])))
+        self.assertEqual(Simulation.get_pvnames(), set(pvnames))
+        self.assertEqual(Simulation.get_pvnames(self.simps), {pvnames[0]})
+        self.assertEqual(Simulation.get_pvnames(self.simpu), {pvnames[1]})
+        self.assertEqual(Simulation.get_pvnames(self.simpsb), set())